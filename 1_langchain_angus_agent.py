@@ -29,7 +29,8 @@ from tools.youtube_tools import (
     fetch_youtube_comments,
     reply_to_youtube_comment,
     check_upload_quota,
-    get_video_details
+    get_video_details,
+    CommentPrefetcher
 )
 from tools.supabase_tools import (
     get_pending_songs,
@@ -204,27 +205,31 @@ def AngusCommentProcessingTool(
         
         processing_results = []
         comments_processed = 0
-        
-        for video in videos:
+
+        # Prefetch the first videos' comments; while each video is being
+        # processed the next fetch runs in the background, so the network
+        # wait overlaps the LLM/DB work instead of adding to it
+        prefetcher = CommentPrefetcher(
+            [v.get("video_id") for v in videos], max_results=10
+        )
+
+        for index, video in enumerate(videos):
             if comments_processed >= comment_limit:
                 break
-                
+
             video_id = video.get("video_id")
             video_title = video.get("title", "Unknown")
-            
+
             try:
-                # Fetch comments
-                comments_result = fetch_youtube_comments.invoke({
-                    "video_id": video_id,
-                    "max_results": min(comment_limit - comments_processed, 10)
-                })
-                
-                if not comments_result or "error" in comments_result:
+                # Collect the prefetched comments and prime the next video
+                comments = prefetcher.get(video_id)
+                if index + 1 < len(videos):
+                    prefetcher.prime(videos[index + 1].get("video_id"))
+
+                if not comments:
                     processing_results.append(f"❌ Failed to fetch comments for '{video_title}'")
                     continue
-                
-                comments = comments_result.get("comments", [])
-                
+
                 for comment in comments:
                     if comments_processed >= comment_limit:
                         break
@@ -279,7 +284,9 @@ def AngusCommentProcessingTool(
                     
             except Exception as e:
                 processing_results.append(f"❌ Error processing comments for '{video_title}': {str(e)}")
-        
+
+        prefetcher.close()
+
         result_summary = f"Comment processing completed: {comments_processed} comments processed\n" + "\n".join(processing_results[-10:])  # Show last 10 results
         return {"result": result_summary}
         
@@ -0,0 +1,66 @@
+"""
+Cached dependency verification for the launcher scripts.
+
+The launchers used to confirm packages were installed by importing them -
+executing several hundred MB of langchain/openai/supabase bytecode just to
+prove presence, at every invocation. This module checks availability with
+importlib.util.find_spec (loader resolution only, no code execution) and
+memoizes the answer to a small JSON file keyed by the interpreter path and
+site-packages directory mtimes, so a warm launch answers in milliseconds
+and the cache invalidates itself whenever packages are (un)installed.
+"""
+import importlib.util
+import json
+import os
+import sys
+
+_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "angus", "req_ok.json")
+
+def _environment_key():
+    """Fingerprint of the interpreter's package environment.
+
+    site-packages directory mtimes change on any install/uninstall, so a
+    stale cache can never report a removed package as present.
+    """
+    site_dirs = sorted(
+        p for p in sys.path
+        if p.endswith("site-packages") and os.path.isdir(p)
+    )
+    mtimes = [(p, os.path.getmtime(p)) for p in site_dirs]
+    return repr((sys.executable, mtimes))
+
+def verify(packages):
+    """Check which packages are installed, without importing any of them.
+
+    Args:
+        packages: Iterable of (display_name, import_name) pairs.
+
+    Returns:
+        Dict mapping each display_name to True if the package resolves.
+    """
+    packages = list(packages)
+    key = _environment_key()
+
+    try:
+        with open(_CACHE_PATH) as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            result = cached.get("result", {})
+            if all(name in result for name, _ in packages):
+                return {name: result[name] for name, _ in packages}
+    except (OSError, ValueError):
+        pass
+
+    result = {
+        name: importlib.util.find_spec(import_name) is not None
+        for name, import_name in packages
+    }
+
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(_CACHE_PATH, "w") as f:
+            json.dump({"key": key, "result": result}, f)
+    except OSError:
+        pass
+
+    return result
@@ -28,6 +28,9 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once .env is loaded; reads below are dict lookups
+from env_cache import ENV
+
 # Configuration
 base_url = "http://localhost:5555/devmode/exampleApplication/privkey/session1/sse"
 params = {
@@ -115,7 +118,7 @@ async def main():
                 model = ChatOpenAI(
                     model="gpt-4o",
                     model_provider="openai",
-                    api_key=os.getenv("OPENAI_API_KEY")
+                    api_key=ENV.get("OPENAI_API_KEY")
                 )
                 
                 prompt = ChatPromptTemplate.from_messages([
@@ -162,6 +165,8 @@ Respect content guidelines and community standards."""
                 print("- 'metadata <audio_url>' - Extract music metadata")
                 print("- 'status' - Show AI agent status")
                 print("- 'quit' - Exit")
+                # Readiness sentinel for the launcher supervisor
+                print("AGENT_READY", flush=True)
                 
                 while True:
                     try:
@@ -22,6 +22,9 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once .env is loaded; reads below are dict lookups
+from env_cache import ENV
+
 # Configuration
 base_url = "http://localhost:5555/devmode/exampleApplication/privkey/session1/sse"
 params = {
@@ -126,7 +129,7 @@ async def main():
                 model = ChatOpenAI(
                     model="gpt-4o",
                     model_provider="openai",
-                    api_key=os.getenv("OPENAI_API_KEY")
+                    api_key=ENV.get("OPENAI_API_KEY")
                 )
                 
                 prompt = ChatPromptTemplate.from_messages([
@@ -170,6 +173,8 @@ Always coordinate workflows step by step, ensuring each agent completes its task
                 print("- 'both <upload_limit> <comment_limit>' - Run both workflows")
                 print("- 'status' - Check system status")
                 print("- 'quit' - Exit")
+                # Readiness sentinel for the launcher supervisor
+                print("AGENT_READY", flush=True)
                 
                 while True:
                     try:
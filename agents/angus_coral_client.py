@@ -31,6 +31,7 @@ from tools.ai_tools import (
     analyze_music_content, generate_comment_response, extract_music_metadata,
     analyze_comment_sentiment, generate_song_description, suggest_video_tags
 )
+from config.agent_config import get_workflow_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -39,6 +40,9 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once .env is loaded; reads below are dict lookups
+from env_cache import ENV
+
 # Configuration for Coral server connection (following Team Angus guide)
 base_url = "http://coral.pushcollective.club:5555/devmode/exampleApplication/privkey/session1/sse"
 params = {
@@ -97,37 +101,48 @@ async def upload_workflow(song_limit: int = 5) -> str:
         logger.error(f"Upload workflow failed: {e}")
         return f"Upload workflow failed: {str(e)}"
 
+# Per-video work is independent, so process videos concurrently up to the
+# workflow's max_parallel (MAX_PARALLEL env var overrides the config value)
+_COMMENT_MAX_PARALLEL = int(
+    ENV.get("MAX_PARALLEL", get_workflow_config("process_comments").get("max_parallel", 5))
+)
+
 async def comment_processing_workflow(reply_limit: int = 10) -> str:
     """
     Execute the complete comment processing workflow.
-    
+
     Args:
         reply_limit: Maximum number of replies to post
-        
+
     Returns:
         Status message about the comment processing workflow
     """
     try:
         logger.info(f"Starting comment processing workflow for {reply_limit} replies")
-        
+
         # Get uploaded videos
         videos = await get_uploaded_videos(reply_limit)
         if not videos:
             return "No uploaded videos found for comment processing"
-        
-        processed_count = 0
-        for video in videos:
-            try:
-                # Process comments for this video
-                result = await process_video_comments(video['video_id'], reply_limit)
-                if result:
-                    processed_count += 1
-                    logger.info(f"Successfully processed comments for video {video['video_id']}")
-            except Exception as e:
-                logger.error(f"Error processing comments for video {video['video_id']}: {e}")
-        
+
+        semaphore = asyncio.Semaphore(_COMMENT_MAX_PARALLEL)
+
+        async def _process_one(video) -> bool:
+            async with semaphore:
+                try:
+                    result = await process_video_comments(video['video_id'], reply_limit)
+                    if result:
+                        logger.info(f"Successfully processed comments for video {video['video_id']}")
+                        return True
+                except Exception as e:
+                    logger.error(f"Error processing comments for video {video['video_id']}: {e}")
+                return False
+
+        results = await asyncio.gather(*(_process_one(video) for video in videos))
+        processed_count = sum(results)
+
         return f"Comment processing completed: processed comments for {processed_count}/{len(videos)} videos"
-        
+
     except Exception as e:
         logger.error(f"Comment processing workflow failed: {e}")
         return f"Comment processing workflow failed: {str(e)}"
@@ -384,7 +399,7 @@ async def main():
             # Create the Agent Angus (fixed: removed invalid model_provider parameter)
             model = ChatOpenAI(
                 model="gpt-4o",
-                api_key=os.getenv("OPENAI_API_KEY")
+                api_key=ENV.get("OPENAI_API_KEY")
             )
             
             prompt = ChatPromptTemplate.from_messages([
@@ -29,6 +29,9 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once .env is loaded; reads below are dict lookups
+from env_cache import ENV
+
 # Configuration
 base_url = "http://localhost:5555/devmode/exampleApplication/privkey/session1/sse"
 params = {
@@ -122,7 +125,7 @@ async def main():
                 model = ChatOpenAI(
                     model="gpt-4o",
                     model_provider="openai",
-                    api_key=os.getenv("OPENAI_API_KEY")
+                    api_key=ENV.get("OPENAI_API_KEY")
                 )
                 
                 prompt = ChatPromptTemplate.from_messages([
@@ -167,6 +170,8 @@ Handle errors gracefully and log all significant database activities."""
                 print("- 'log <level> <message>' - Log an activity")
                 print("- 'stats' - Show database statistics")
                 print("- 'quit' - Exit")
+                # Readiness sentinel for the launcher supervisor
+                print("AGENT_READY", flush=True)
                 
                 while True:
                     try:
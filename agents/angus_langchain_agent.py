@@ -338,6 +338,10 @@ Log the activity and provide a detailed summary."""
                 # Check if it's time to run comment workflow
                 if current_time - last_comment_time >= comment_interval:
                     logger.info("Running scheduled comment workflow...")
+                    # Drop memoized DB lookups so this run sees rows
+                    # written by other agents since the last pass
+                    from tools.supabase_tools import clear_caches
+                    clear_caches()
                     await self.run_comment_processing_workflow(max_replies=5)
                     last_comment_time = current_time
                 
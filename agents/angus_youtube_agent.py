@@ -5,15 +5,16 @@ This agent handles all YouTube operations for the Agent Angus system including
 video uploads, comment fetching, and comment replies.
 """
 import asyncio
+import functools
 import os
 import json
 import logging
+import sys
 from dotenv import load_dotenv
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langchain.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from langchain.agents import create_tool_calling_agent, AgentExecutor
-from langchain.tools import Tool
 
 # Import our YouTube tools
 from tools.youtube_tools import (
@@ -28,24 +29,92 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once .env is loaded; reads below are dict lookups
+from env_cache import ENV
+
+# Force UTF-8 output so the emoji banner isn't mangled (or double-encoded) on
+# consoles with a non-UTF-8 codec.
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding="utf-8")
+
 # Configuration
 base_url = "http://localhost:5555/devmode/exampleApplication/privkey/session1/sse"
-params = {
-    "waitForAgents": 2,
-    "agentId": "angus_youtube",
-    "agentDescription": "YouTube specialist for Agent Angus system, handling video uploads, comment fetching, and automated replies using YouTube API."
-}
-query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-MCP_SERVER_URL = f"{base_url}?{query_string}"
+# Query string pre-encoded offline (description URL-quoted once) and interned,
+# so import does no dict/list building and URL comparisons hash once.
+MCP_SERVER_URL = sys.intern(
+    f"{base_url}"
+    "?waitForAgents=2"
+    "&agentId=angus_youtube"
+    "&agentDescription=YouTube%20specialist%20for%20Agent%20Angus%20system%2C"
+    "%20handling%20video%20uploads%2C%20comment%20fetching%2C%20and%20automated"
+    "%20replies%20using%20YouTube%20API."
+)
 
 AGENT_NAME = "angus_youtube"
 
-def get_tools_description(tools):
+# Startup banner, assembled once so it goes out in a single write/flush instead
+# of one stdout write (and codec pass) per line.
+BANNER = "\n".join([
+    "",
+    "🎬 Angus YouTube Agent started!",
+    "Available commands:",
+    "- 'upload <song_id>' - Upload a song to YouTube",
+    "- 'comments <video_id>' - Fetch comments from a video",
+    "- 'reply <comment_id> <text>' - Reply to a specific comment",
+    "- 'process <video_id>' - Process all comments for a video",
+    "- 'quota' - Check YouTube API quota status",
+    "- 'details <video_id>' - Get video details",
+    "- 'status' - Show YouTube agent status",
+    "- 'quit' - Exit",
+    "",
+])
+
+@functools.lru_cache(maxsize=16)
+def _describe_tools(tools_key):
+    """Render the description for a (name, schema_json) tool tuple."""
     return "\n".join(
-        f"Tool: {tool.name}, Schema: {json.dumps(tool.args).replace('{', '{{').replace('}', '}}')}"
-        for tool in tools
+        f"Tool: {name}, Schema: {schema}" for name, schema in tools_key
     )
 
+def get_tools_description(tools):
+    """Generate description of available tools.
+
+    Tool schemas are immutable per session, so logically identical tool sets
+    (e.g. after a Coral reconnect) hit the cache instead of being re-joined.
+    """
+    return _describe_tools(tuple((t.name, json.dumps(t.args)) for t in tools))
+
+# System prompt template, compiled once at import time. The tools description is
+# filled in via .partial() so the template is never re-parsed per invocation and
+# braces inside tool schemas don't need {{/}} doubling.
+SYSTEM_TEMPLATE = """You are the Angus YouTube Agent, specialized in handling all YouTube API operations for the Agent Angus music automation system.
+
+Your responsibilities:
+1. Upload song videos to YouTube with proper metadata and tags
+2. Fetch comments from uploaded videos for processing
+3. Reply to YouTube comments with AI-generated responses
+4. Monitor YouTube API quota and usage limits
+5. Manage video details and metadata
+6. Process video comments efficiently and accurately
+
+YouTube operations you handle:
+- Video Uploads: Upload songs with titles, descriptions, and tags
+- Comment Management: Fetch, process, and reply to comments
+- Quota Management: Monitor and respect API rate limits
+- Video Analytics: Track video performance and engagement
+- Content Moderation: Handle appropriate responses to comments
+
+Available tools: {tools_description}
+
+Always respect YouTube API rate limits and community guidelines.
+Provide helpful and appropriate responses to comments.
+Handle upload errors gracefully and report status accurately."""
+
+BASE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_TEMPLATE),
+    ("placeholder", "{agent_scratchpad}")
+])
+
 async def main():
     max_retries = 3
     
@@ -66,44 +135,16 @@ async def main():
                 # Get tools from Coral Protocol
                 coral_tools = client.get_tools()
                 
-                # Add our YouTube tools
+                # Our YouTube tools are already BaseTool instances (decorated
+                # with @tool at definition site), so pass them straight through
+                # instead of re-wrapping them in Tool(...) indirection.
                 youtube_tools = [
-                    Tool(
-                        name="upload_song_to_youtube",
-                        func=upload_song_to_youtube,
-                        description="Upload a song video to YouTube with metadata and tags.",
-                        coroutine=upload_song_to_youtube
-                    ),
-                    Tool(
-                        name="fetch_youtube_comments",
-                        func=fetch_youtube_comments,
-                        description="Fetch comments from a YouTube video for processing.",
-                        coroutine=fetch_youtube_comments
-                    ),
-                    Tool(
-                        name="reply_to_youtube_comment",
-                        func=reply_to_youtube_comment,
-                        description="Reply to a specific YouTube comment with generated text.",
-                        coroutine=reply_to_youtube_comment
-                    ),
-                    Tool(
-                        name="check_upload_quota",
-                        func=check_upload_quota,
-                        description="Check YouTube API upload quota status and limits.",
-                        coroutine=check_upload_quota
-                    ),
-                    Tool(
-                        name="get_video_details",
-                        func=get_video_details,
-                        description="Get details and metadata for a YouTube video.",
-                        coroutine=get_video_details
-                    ),
-                    Tool(
-                        name="process_video_comments",
-                        func=process_video_comments,
-                        description="Process all comments for a video: fetch, analyze, and reply.",
-                        coroutine=process_video_comments
-                    )
+                    upload_song_to_youtube,
+                    fetch_youtube_comments,
+                    reply_to_youtube_comment,
+                    check_upload_quota,
+                    get_video_details,
+                    process_video_comments
                 ]
                 
                 # Combine all tools
@@ -115,52 +156,21 @@ async def main():
                 model = ChatOpenAI(
                     model="gpt-4o",
                     model_provider="openai",
-                    api_key=os.getenv("OPENAI_API_KEY")
+                    api_key=ENV.get("OPENAI_API_KEY")
                 )
                 
-                prompt = ChatPromptTemplate.from_messages([
-                    (
-                        "system",
-                        f"""You are the Angus YouTube Agent, specialized in handling all YouTube API operations for the Agent Angus music automation system.
-
-Your responsibilities:
-1. Upload song videos to YouTube with proper metadata and tags
-2. Fetch comments from uploaded videos for processing
-3. Reply to YouTube comments with AI-generated responses
-4. Monitor YouTube API quota and usage limits
-5. Manage video details and metadata
-6. Process video comments efficiently and accurately
-
-YouTube operations you handle:
-- Video Uploads: Upload songs with titles, descriptions, and tags
-- Comment Management: Fetch, process, and reply to comments
-- Quota Management: Monitor and respect API rate limits
-- Video Analytics: Track video performance and engagement
-- Content Moderation: Handle appropriate responses to comments
-
-Available tools: {get_tools_description(all_tools)}
-
-Always respect YouTube API rate limits and community guidelines.
-Provide helpful and appropriate responses to comments.
-Handle upload errors gracefully and report status accurately."""
-                    ),
-                    ("placeholder", "{agent_scratchpad}")
-                ])
+                prompt = BASE_PROMPT.partial(
+                    tools_description=get_tools_description(all_tools)
+                )
                 
                 agent = create_tool_calling_agent(model, all_tools, prompt)
                 agent_executor = AgentExecutor(agent=agent, tools=all_tools, verbose=True)
                 
                 # Main YouTube agent loop
-                print(f"\n🎬 Angus YouTube Agent started!")
-                print("Available commands:")
-                print("- 'upload <song_id>' - Upload a song to YouTube")
-                print("- 'comments <video_id>' - Fetch comments from a video")
-                print("- 'reply <comment_id> <text>' - Reply to a specific comment")
-                print("- 'process <video_id>' - Process all comments for a video")
-                print("- 'quota' - Check YouTube API quota status")
-                print("- 'details <video_id>' - Get video details")
-                print("- 'status' - Show YouTube agent status")
-                print("- 'quit' - Exit")
+                sys.stdout.write(BANNER)
+                sys.stdout.flush()
+                # Readiness sentinel for the launcher supervisor
+                print("AGENT_READY", flush=True)
                 
                 while True:
                     try:
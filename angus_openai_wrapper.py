@@ -7,19 +7,35 @@ through an OpenAI-compatible REST API interface for Coraliser integration.
 
 import asyncio
 import logging
-import uuid
-from datetime import datetime
+import os
+import re
+import time
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from pydantic import BaseModel, Field
-import uvicorn
+
+# Prefer uvloop when available - it roughly halves event-loop overhead on the
+# I/O-bound endpoints here. install() also covers imports under gunicorn.
+try:
+    import uvloop
+    uvloop.install()
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Import Agent Angus MCP client
 try:
-    from coral_integration.mcp_client import create_angus_mcp_client, AngusMultiServerMCPClient
+    from coral_integration.mcp_client import (
+        create_angus_mcp_client,
+        AngusMultiServerMCPClient,
+        shutdown_client_pool
+    )
     MCP_AVAILABLE = True
 except ImportError:
     MCP_AVAILABLE = False
@@ -29,54 +45,189 @@ logger = logging.getLogger(__name__)
 # Global MCP client instance
 mcp_client: Optional[AngusMultiServerMCPClient] = None
 
+# Cap on concurrent in-flight MCP task executions - unbounded fan-out causes
+# tail-latency blowups when the downstream (MCP, YouTube, OpenAI, Supabase)
+# rate-limits or queues. Created in lifespan() so it binds to the right loop.
+MCP_MAX_INFLIGHT = int(os.getenv("MCP_MAX_INFLIGHT", "32"))
+_mcp_sem: Optional[asyncio.Semaphore] = None
+
+# TTL cache for MCP tool discovery - tool metadata rarely changes, so status
+# and tools endpoints shouldn't pay a tools/list round-trip on every request.
+# With REDIS_URL set the cache is shared across gunicorn workers so expiry
+# doesn't multiply tools/list traffic by the worker count.
+TOOLS_CACHE_TTL = float(os.getenv("MCP_TOOLS_CACHE_TTL", "60"))
+_tools_cache: Dict[str, Any] = {"tools": None, "expires_at": 0.0}
+_tools_cache_lock = asyncio.Lock()
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+_redis = None
+_TOOLS_CACHE_KEY = "mcp:tools:v1"
+_TOOLS_LOCK_KEY = "mcp:tools:v1:lock"
+
+def _store_tools_local(tools: List[str]) -> None:
+    """Refresh the in-process copy (also backs the tool-hint regex)."""
+    global _tool_hint_pattern
+    _tools_cache["tools"] = tools
+    _tools_cache["expires_at"] = time.monotonic() + TOOLS_CACHE_TTL
+    # Rebuild the tool-hint pattern lazily on next use
+    _tool_hint_pattern = None
+
+async def _get_tools_cached_redis() -> List[str]:
+    """Shared-cache path: read from Redis, single-flighting refresh via SETNX."""
+    cached = await _redis.get(_TOOLS_CACHE_KEY)
+    if cached is not None:
+        tools = orjson.loads(cached)
+        _store_tools_local(tools)
+        return tools
+
+    # Stampede guard: only one worker refreshes per expiry
+    got_lock = await _redis.set(_TOOLS_LOCK_KEY, "1", nx=True, ex=30)
+    if got_lock:
+        try:
+            # get_available_tools returns a frozenset; sort for a stable,
+            # JSON-serializable list
+            tools = sorted(await mcp_client.get_available_tools())
+            await _redis.set(_TOOLS_CACHE_KEY, orjson.dumps(tools), ex=max(int(TOOLS_CACHE_TTL), 1))
+            _store_tools_local(tools)
+            return tools
+        finally:
+            await _redis.delete(_TOOLS_LOCK_KEY)
+
+    # Another worker is refreshing - give it a beat, then re-read or fetch
+    await asyncio.sleep(0.05)
+    cached = await _redis.get(_TOOLS_CACHE_KEY)
+    if cached is not None:
+        tools = orjson.loads(cached)
+    else:
+        tools = sorted(await mcp_client.get_available_tools())
+    _store_tools_local(tools)
+    return tools
+
+async def _get_tools_cached() -> List[str]:
+    """Get the available tool list, refreshing at most once per TTL window."""
+    if _tools_cache["tools"] is not None and time.monotonic() < _tools_cache["expires_at"]:
+        return _tools_cache["tools"]
+
+    if _redis is not None:
+        try:
+            return await _get_tools_cached_redis()
+        except Exception as e:
+            logger.warning(f"Redis tools cache unavailable, using in-process cache: {e}")
+
+    # Single-flight: only one coroutine refreshes on expiry
+    async with _tools_cache_lock:
+        if _tools_cache["tools"] is not None and time.monotonic() < _tools_cache["expires_at"]:
+            return _tools_cache["tools"]
+
+        tools = sorted(await mcp_client.get_available_tools())
+        _store_tools_local(tools)
+        return tools
+
+# Compiled alternation of known tool names, rebuilt when the tool set changes
+_tool_hint_pattern: Optional["re.Pattern"] = None
+
+def _extract_tool_hint(message: str) -> Optional[str]:
+    """Return a known tool name mentioned in the message, if any.
+
+    Lets narrow requests route through a single-tool executor in the MCP
+    client instead of presenting the full tool set to the model.
+    """
+    global _tool_hint_pattern
+    tools = _tools_cache["tools"]
+    if not tools:
+        return None
+    if _tool_hint_pattern is None:
+        _tool_hint_pattern = re.compile(
+            "|".join(re.escape(name) for name in sorted(tools, key=len, reverse=True))
+        )
+    match = _tool_hint_pattern.search(message)
+    return match.group(0) if match else None
+
+def _log_warmup_result(task: "asyncio.Task") -> None:
+    """Log the outcome of the background tool-discovery warmup."""
+    if task.cancelled():
+        return
+    if task.exception():
+        logger.warning(f"Tool discovery warmup failed: {task.exception()}")
+    else:
+        logger.info(f"Available tools: {task.result()}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan - startup and shutdown."""
-    global mcp_client
-    
+    global mcp_client, _mcp_sem, _redis
+
     # Startup
     logger.info("Starting Agent Angus OpenAI-compatible wrapper...")
+    _mcp_sem = asyncio.Semaphore(MCP_MAX_INFLIGHT)
+
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url and REDIS_AVAILABLE:
+        _redis = aioredis.from_url(redis_url)
+        logger.info("Using Redis-backed shared MCP tool cache")
     
     if not MCP_AVAILABLE:
         logger.error("MCP client not available - check dependencies")
         yield
         return
     
+    warmup_task = None
     try:
-        # Initialize MCP client
+        # Initialize the one MCP client this process will ever build; every
+        # request handler reuses it, so per-request cost is the model call,
+        # not client bootstrap and tool discovery
         mcp_client = await create_angus_mcp_client()
+        app.state.mcp_client = mcp_client
         logger.info("MCP client initialized successfully")
-        
-        # Get available tools
-        tools = await mcp_client.get_available_tools()
-        logger.info(f"Available tools: {tools}")
-        
+
+        # Warm the tools cache concurrently with the rest of startup so the
+        # server starts accepting requests without blocking on discovery
+        warmup_task = asyncio.create_task(_get_tools_cached())
+        warmup_task.add_done_callback(_log_warmup_result)
+
     except Exception as e:
         logger.error(f"Failed to initialize MCP client: {str(e)}")
         mcp_client = None
-    
+        app.state.mcp_client = None
+
     yield
+
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+
+    if _redis is not None:
+        await _redis.aclose()
     
     # Shutdown
     if mcp_client:
         await mcp_client.close()
+        await shutdown_client_pool()
         logger.info("MCP client closed")
 
-# Create FastAPI app
+# Create FastAPI app - orjson as the default encoder for every JSON response
 app = FastAPI(
     title="Agent Angus OpenAI-Compatible API",
     description="OpenAI-compatible wrapper for Agent Angus music automation tools",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware - explicit method/header lists short-circuit the
+# middleware's matching, and max_age lets browsers cache preflights for a
+# day instead of re-preflighting. Origins stay configurable via env.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=os.getenv("CORS_ALLOW_ORIGINS", "*").split(","),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,
 )
 
 # Pydantic models for OpenAI-compatible API
@@ -93,67 +244,120 @@ class ChatCompletionRequest(BaseModel):
     stream: Optional[bool] = Field(default=False)
     stop: Optional[List[str]] = Field(default=None)
 
-class ChatCompletionChoice(BaseModel):
-    index: int
-    message: Message
-    finish_reason: str
-
-class ChatCompletionUsage(BaseModel):
-    prompt_tokens: int
-    completion_tokens: int
-    total_tokens: int
-
-class ChatCompletionResponse(BaseModel):
-    id: str
-    object: str = "chat.completion"
-    created: int
-    model: str
-    choices: List[ChatCompletionChoice]
-    usage: ChatCompletionUsage
-
 class ErrorResponse(BaseModel):
     error: Dict[str, Any]
 
+# Deep health probes are cached briefly so aggressive health checkers
+# don't turn into MCP traffic
+_deep_health_cache: Dict[str, Any] = {"result": None, "expires_at": 0.0}
+
 # Health check endpoint
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
+async def health_check(deep: bool = False):
+    """Health check endpoint.
+
+    get_status() below reads cached client state only (no I/O), so it is
+    deliberately left synchronous - it never blocks the event loop. Pass
+    ?deep=1 to actually probe the MCP client, cached for 5 seconds.
+    """
     global mcp_client
-    
+
     status = {
         "status": "healthy" if mcp_client else "unhealthy",
         "mcp_available": MCP_AVAILABLE,
         "mcp_client_ready": mcp_client is not None,
-        "timestamp": datetime.utcnow().isoformat()
+        "mcp_inflight": MCP_MAX_INFLIGHT - _mcp_sem._value if _mcp_sem else 0,
+        "mcp_max_inflight": MCP_MAX_INFLIGHT,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
     
     if mcp_client:
         mcp_status = mcp_client.get_status()
         status.update(mcp_status)
-    
+
+        if deep:
+            if time.monotonic() >= _deep_health_cache["expires_at"]:
+                try:
+                    tools = await mcp_client.get_available_tools()
+                    _deep_health_cache["result"] = {"reachable": True, "tools_count": len(tools)}
+                except Exception as e:
+                    _deep_health_cache["result"] = {"reachable": False, "error": str(e)}
+                _deep_health_cache["expires_at"] = time.monotonic() + 5.0
+            status["deep"] = _deep_health_cache["result"]
+
     return status
 
+# Static response bodies, serialized once at import time. The model `created`
+# timestamp is frozen at process start, matching OpenAI's own behavior.
+_MODELS_BODY: bytes = orjson.dumps({
+    "object": "list",
+    "data": [
+        {
+            "id": "angus-v1",
+            "object": "model",
+            "created": int(time.time()),
+            "owned_by": "agent-angus",
+            "permission": [],
+            "root": "angus-v1",
+            "parent": None
+        }
+    ]
+})
+
+_ROOT_BODY: bytes = orjson.dumps({
+    "name": "Agent Angus OpenAI-Compatible API",
+    "version": "1.0.0",
+    "description": "OpenAI-compatible wrapper for Agent Angus music automation",
+    "endpoints": {
+        "chat_completions": "/v1/chat/completions",
+        "models": "/v1/models",
+        "health": "/health",
+        "status": "/v1/agent/status",
+        "tools": "/v1/agent/tools"
+    },
+    "documentation": "/docs"
+})
+
 # List models endpoint (OpenAI compatibility)
 @app.get("/v1/models")
 async def list_models():
     """List available models."""
-    return {
-        "object": "list",
-        "data": [
-            {
-                "id": "angus-v1",
-                "object": "model",
-                "created": int(datetime.utcnow().timestamp()),
-                "owned_by": "agent-angus",
-                "permission": [],
-                "root": "angus-v1",
-                "parent": None
-            }
-        ]
-    }
+    return Response(content=_MODELS_BODY, media_type="application/json")
+
+# Static skeleton for chat-completion bodies; handlers copy it and fill the
+# per-request fields, avoiding rebuilding constant keys/values per call
+_CHAT_COMPLETION_SKELETON: Dict[str, Any] = {
+    "id": None,
+    "object": "chat.completion",
+    "created": 0,
+    "model": None,
+    "choices": None,
+    "usage": None
+}
+
+async def _sse_stream(user_message: str, tool_hint: Optional[str],
+                      response_id: str, created: int, model: str):
+    """Yield OpenAI-style chat.completion.chunk SSE frames for a task."""
+    def frame(delta: Dict[str, Any], finish_reason: Optional[str]) -> bytes:
+        return b"data: " + orjson.dumps({
+            "id": response_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }) + b"\n\n"
+
+    async with _mcp_sem:
+        # Token-level stream: first frame goes out on the model's first
+        # token, not after the full generation completes
+        async for chunk in mcp_client.stream_task(user_message, tool_hint=tool_hint):
+            yield frame({"role": "assistant", "content": chunk}, None)
+
+    yield frame({}, "stop")
+    yield b"data: [DONE]\n\n"
 
 # Main chat completions endpoint
-@app.post("/v1/chat/completions", response_model=ChatCompletionResponse)
+@app.post("/v1/chat/completions", response_class=ORJSONResponse)
 async def chat_completions(request: ChatCompletionRequest):
     """
     Create a chat completion using Agent Angus.
@@ -189,12 +393,12 @@ async def chat_completions(request: ChatCompletionRequest):
                 }
             )
         
-        # Get the last user message
-        user_message = None
-        for msg in reversed(request.messages):
-            if msg.role == "user":
-                user_message = msg.content
-                break
+        # Get the last user message - index scan, no reversed() iterator
+        msgs = request.messages
+        user_message = next(
+            (msgs[i].content for i in range(len(msgs) - 1, -1, -1) if msgs[i].role == "user"),
+            None
+        )
         
         if not user_message:
             raise HTTPException(
@@ -208,42 +412,51 @@ async def chat_completions(request: ChatCompletionRequest):
                 }
             )
         
-        # Execute the task using Agent Angus MCP client
+        # Execute the task using Agent Angus MCP client, routing narrowly
+        # when the message names a specific tool
         logger.info(f"Executing task: {user_message}")
-        result = await mcp_client.execute_task(user_message)
-        
-        # Create response in OpenAI format
-        response_id = f"chatcmpl-angus-{uuid.uuid4().hex[:8]}"
-        created_timestamp = int(datetime.utcnow().timestamp())
+        tool_hint = _extract_tool_hint(user_message)
+
+        response_id = f"chatcmpl-angus-{os.urandom(4).hex()}"
+        created_timestamp = int(time.time())
+
+        if request.stream:
+            # SSE streaming: clients render chunks while the agent works
+            return StreamingResponse(
+                _sse_stream(user_message, tool_hint, response_id, created_timestamp, request.model),
+                media_type="text/event-stream"
+            )
+
+        async with _mcp_sem:
+            result = await mcp_client.execute_task(user_message, tool_hint=tool_hint)
         
-        # Estimate token usage (rough approximation)
-        prompt_tokens = sum(len(msg.content.split()) for msg in request.messages)
-        completion_tokens = len(result.split())
+        # Estimate token usage (rough approximation) - count separators
+        # instead of materializing a word list per message
+        prompt_tokens = sum(msg.content.count(" ") + 1 for msg in request.messages)
+        completion_tokens = result.count(" ") + 1
         total_tokens = prompt_tokens + completion_tokens
         
-        response = ChatCompletionResponse(
-            id=response_id,
-            created=created_timestamp,
-            model=request.model,
-            choices=[
-                ChatCompletionChoice(
-                    index=0,
-                    message=Message(
-                        role="assistant",
-                        content=result
-                    ),
-                    finish_reason="stop"
-                )
-            ],
-            usage=ChatCompletionUsage(
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens
-            )
-        )
-        
+        # Plain dict + orjson, skipping Pydantic output validation - input
+        # validation on ChatCompletionRequest is where Pydantic pays off
+        body = _CHAT_COMPLETION_SKELETON.copy()
+        body["id"] = response_id
+        body["created"] = created_timestamp
+        body["model"] = request.model
+        body["choices"] = [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": result},
+                "finish_reason": "stop"
+            }
+        ]
+        body["usage"] = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": total_tokens
+        }
+
         logger.info(f"Task completed successfully: {response_id}")
-        return response
+        return ORJSONResponse(content=body)
         
     except Exception as e:
         logger.error(f"Error processing chat completion: {str(e)}")
@@ -272,7 +485,7 @@ async def agent_status():
         }
     
     try:
-        tools = await mcp_client.get_available_tools()
+        tools = await _get_tools_cached()
         status = mcp_client.get_status()
         
         return {
@@ -305,7 +518,7 @@ async def list_agent_tools():
         return {"tools": [], "error": "MCP client not available"}
     
     try:
-        tools = await mcp_client.get_available_tools()
+        tools = await _get_tools_cached()
         return {"tools": tools}
         
     except Exception as e:
@@ -316,35 +529,51 @@ async def list_agent_tools():
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "name": "Agent Angus OpenAI-Compatible API",
-        "version": "1.0.0",
-        "description": "OpenAI-compatible wrapper for Agent Angus music automation",
-        "endpoints": {
-            "chat_completions": "/v1/chat/completions",
-            "models": "/v1/models",
-            "health": "/health",
-            "status": "/v1/agent/status",
-            "tools": "/v1/agent/tools"
-        },
-        "documentation": "/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 def main():
     """Main entry point for running the server."""
+    # Server-only imports stay out of module scope so importing the app
+    # (tests, tooling, gunicorn workers) doesn't pay for them
+    import argparse
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Agent Angus OpenAI-compatible wrapper")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(os.cpu_count() or 1, 4),
+        help="Number of worker processes (default: min(cpu_count, 4))"
+    )
+    args = parser.parse_args()
+
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
     logger.info("Starting Agent Angus OpenAI-compatible wrapper server...")
-    
+
+    if args.workers > 1:
+        # Multi-core: hand off to gunicorn with uvicorn workers. Each worker
+        # runs lifespan() and owns its own MCP client - MCP sessions are not
+        # fork-safe, so a per-worker client is what we want.
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(args.workers),
+            "-b", "0.0.0.0:8001",
+            "angus_openai_wrapper:app"
+        ])
+
     uvicorn.run(
         "angus_openai_wrapper:app",
         host="0.0.0.0",
         port=8001,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop="uvloop" if UVLOOP_AVAILABLE else "auto",
+        http="httptools"
     )
 
 if __name__ == "__main__":
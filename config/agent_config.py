@@ -3,7 +3,8 @@ Agent configuration for Agent Angus LangChain implementation.
 
 This module defines configuration for each agent in the multi-agent system.
 """
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 # Coordinator Agent Configuration
 COORDINATOR_AGENT_CONFIG = {
@@ -207,59 +208,60 @@ MONITORING_CONFIG = {
     }
 }
 
-def get_agent_config(agent_type: str) -> Dict[str, Any]:
+# Shared empty config so lookups for unknown types don't allocate
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+def get_agent_config(agent_type: str) -> Mapping[str, Any]:
     """
     Get configuration for a specific agent type.
-    
+
     Args:
         agent_type: Type of agent (coordinator, youtube, database, ai)
-        
+
     Returns:
-        Configuration dictionary for the agent
+        Configuration mapping for the agent
     """
-    configs = {
-        "coordinator": COORDINATOR_AGENT_CONFIG,
-        "youtube": YOUTUBE_AGENT_CONFIG,
-        "database": DATABASE_AGENT_CONFIG,
-        "ai": AI_AGENT_CONFIG
-    }
-    
-    return configs.get(agent_type, {})
+    return ALL_AGENT_CONFIGS.get(agent_type, _EMPTY_CONFIG)
 
-def get_workflow_config(workflow_name: str) -> Dict[str, Any]:
+def get_workflow_config(workflow_name: str) -> Mapping[str, Any]:
     """
     Get configuration for a specific workflow.
-    
+
     Args:
         workflow_name: Name of the workflow
-        
+
     Returns:
-        Configuration dictionary for the workflow
+        Configuration mapping for the workflow
     """
-    return WORKFLOW_CONFIGS.get(workflow_name, {})
+    return WORKFLOW_CONFIGS.get(workflow_name, _EMPTY_CONFIG)
 
-def validate_agent_config(config: Dict[str, Any]) -> bool:
+# Fields every agent config must carry
+_REQUIRED_AGENT_FIELDS = frozenset({"name", "description", "type", "tools", "timeout"})
+
+def validate_agent_config(config: Mapping[str, Any]) -> bool:
     """
     Validate an agent configuration.
-    
+
     Args:
-        config: Agent configuration dictionary
-        
+        config: Agent configuration mapping
+
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["name", "description", "type", "tools", "timeout"]
-    
-    for field in required_fields:
-        if field not in config:
-            return False
-    
-    return True
+    return _REQUIRED_AGENT_FIELDS.issubset(config)
+
+# Freeze shared configuration mappings so hot paths can hand them out
+# without defensive copies and callers can't mutate shared state
+COORDINATOR_AGENT_CONFIG = MappingProxyType(COORDINATOR_AGENT_CONFIG)
+YOUTUBE_AGENT_CONFIG = MappingProxyType(YOUTUBE_AGENT_CONFIG)
+DATABASE_AGENT_CONFIG = MappingProxyType(DATABASE_AGENT_CONFIG)
+AI_AGENT_CONFIG = MappingProxyType(AI_AGENT_CONFIG)
+WORKFLOW_CONFIGS = MappingProxyType(WORKFLOW_CONFIGS)
 
 # Export all configurations
-ALL_AGENT_CONFIGS = {
+ALL_AGENT_CONFIGS = MappingProxyType({
     "coordinator": COORDINATOR_AGENT_CONFIG,
     "youtube": YOUTUBE_AGENT_CONFIG,
     "database": DATABASE_AGENT_CONFIG,
     "ai": AI_AGENT_CONFIG
-}
+})
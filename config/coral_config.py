@@ -3,7 +3,12 @@ Coral Protocol configuration for Agent Angus LangChain implementation.
 
 This module defines configuration for Coral Protocol server and agent registry.
 """
-from typing import Dict, Any, List
+import functools
+import os
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Mapping
 from .environment import CORAL_SERVER_HOST, CORAL_SERVER_PORT, CORAL_SERVER_URL
 
 # Coral Server Configuration
@@ -34,6 +39,10 @@ CORAL_SERVER_CONFIG = {
     }
 }
 
+# Registry backend selection: "memory" (per-process dicts) or "redis"
+# (shared across coordinator replicas, survives restarts)
+REGISTRY_BACKEND = os.getenv("ANGUS_REGISTRY_BACKEND", "memory")
+
 # Agent Registry Configuration
 AGENT_REGISTRY_CONFIG = {
     "registration_timeout": 30,  # seconds
@@ -45,6 +54,7 @@ AGENT_REGISTRY_CONFIG = {
     "health_check_interval": 60,  # seconds
     "registration_retry_attempts": 3,
     "registration_retry_delay": 5,  # seconds
+    "skip_heartbeat_if_active": True,  # recent API activity already proves liveness
     "agent_metadata_schema": {
         "required_fields": ["name", "type", "version", "capabilities"],
         "optional_fields": ["description", "tags", "endpoints"]
@@ -52,80 +62,84 @@ AGENT_REGISTRY_CONFIG = {
 }
 
 # Message Routing Configuration
-MESSAGE_ROUTING_CONFIG = {
-    "default_timeout": 30,  # seconds
-    "max_retries": 3,
-    "retry_delay": 2,  # seconds
-    "message_ttl": 300,  # 5 minutes
-    "max_message_size": 1048576,  # 1MB
-    "compression_enabled": True,
-    "encryption_enabled": False,
-    "priority_queue_enabled": True,
-    "dead_letter_queue_enabled": True,
-    "routing_strategies": {
-        "round_robin": True,
-        "load_balanced": True,
-        "priority_based": True,
-        "capability_based": True
+def _build_message_routing_config() -> Dict[str, Any]:
+    return {
+        "default_timeout": 30,  # seconds
+        "max_retries": 3,
+        "retry_delay": 2,  # seconds
+        "message_ttl": 300,  # 5 minutes
+        "max_message_size": 1048576,  # 1MB
+        "compression_enabled": True,
+        "encryption_enabled": False,
+        "priority_queue_enabled": True,
+        "dead_letter_queue_enabled": True,
+        "routing_strategies": {
+            "round_robin": True,
+            "load_balanced": True,
+            "priority_based": True,
+            "capability_based": True
+        }
     }
-}
 
 # Load Balancing Configuration
-LOAD_BALANCING_CONFIG = {
-    "strategy": "round_robin",  # round_robin, least_connections, weighted
-    "health_check_enabled": True,
-    "health_check_interval": 30,  # seconds
-    "unhealthy_threshold": 3,  # failed health checks
-    "recovery_threshold": 2,  # successful health checks
-    "circuit_breaker_enabled": True,
-    "circuit_breaker_threshold": 5,  # failures
-    "circuit_breaker_timeout": 60,  # seconds
-    "weights": {
-        "coordinator": 1.0,
-        "youtube": 1.0,
-        "database": 1.5,  # Higher weight for database operations
-        "ai": 0.8  # Lower weight due to longer processing times
+def _build_load_balancing_config() -> Dict[str, Any]:
+    return {
+        "strategy": "round_robin",  # round_robin, least_connections, weighted
+        "health_check_enabled": True,
+        "health_check_interval": 30,  # seconds
+        "unhealthy_threshold": 3,  # failed health checks
+        "recovery_threshold": 2,  # successful health checks
+        "circuit_breaker_enabled": True,
+        "circuit_breaker_threshold": 5,  # failures
+        "circuit_breaker_timeout": 60,  # seconds
+        "weights": {
+            "coordinator": 1.0,
+            "youtube": 1.0,
+            "database": 1.5,  # Higher weight for database operations
+            "ai": 0.8  # Lower weight due to longer processing times
+        }
     }
-}
 
 # Security Configuration
-SECURITY_CONFIG = {
-    "authentication_enabled": False,  # Set to True in production
-    "authorization_enabled": False,   # Set to True in production
-    "api_key_required": False,
-    "rate_limiting_enabled": True,
-    "rate_limits": {
-        "requests_per_minute": 1000,
-        "requests_per_hour": 10000,
-        "burst_size": 100
-    },
-    "allowed_origins": ["*"],  # Restrict in production
-    "allowed_methods": ["GET", "POST", "PUT", "DELETE"],
-    "max_request_size": 10485760,  # 10MB
-    "session_timeout": 3600,  # 1 hour
-    "token_expiry": 86400  # 24 hours
-}
+def _build_security_config() -> Dict[str, Any]:
+    return {
+        "authentication_enabled": False,  # Set to True in production
+        "authorization_enabled": False,   # Set to True in production
+        "api_key_required": False,
+        "rate_limiting_enabled": True,
+        "rate_limits": {
+            "requests_per_minute": 1000,
+            "requests_per_hour": 10000,
+            "burst_size": 100
+        },
+        "allowed_origins": ["*"],  # Restrict in production
+        "allowed_methods": ["GET", "POST", "PUT", "DELETE"],
+        "max_request_size": 10485760,  # 10MB
+        "session_timeout": 3600,  # 1 hour
+        "token_expiry": 86400  # 24 hours
+    }
 
 # Monitoring and Observability Configuration
-MONITORING_CONFIG = {
-    "metrics_enabled": True,
-    "tracing_enabled": True,
-    "logging_enabled": True,
-    "prometheus_endpoint": "/metrics",
-    "health_endpoint": "/health",
-    "status_endpoint": "/status",
-    "metrics_collection_interval": 30,  # seconds
-    "log_level": "INFO",
-    "log_format": "json",
-    "trace_sampling_rate": 0.1,  # 10% of requests
-    "custom_metrics": [
-        "agent_registration_count",
-        "message_routing_latency",
-        "workflow_execution_time",
-        "error_rate_by_agent",
-        "throughput_by_endpoint"
-    ]
-}
+def _build_monitoring_config() -> Dict[str, Any]:
+    return {
+        "metrics_enabled": True,
+        "tracing_enabled": True,
+        "logging_enabled": True,
+        "prometheus_endpoint": "/metrics",
+        "health_endpoint": "/health",
+        "status_endpoint": "/status",
+        "metrics_collection_interval": 30,  # seconds
+        "log_level": "INFO",
+        "log_format": "json",
+        "trace_sampling_rate": 0.1,  # 10% of requests
+        "custom_metrics": [
+            "agent_registration_count",
+            "message_routing_latency",
+            "workflow_execution_time",
+            "error_rate_by_agent",
+            "throughput_by_endpoint"
+        ]
+    }
 
 # Workflow Orchestration Configuration
 WORKFLOW_CONFIG = {
@@ -146,13 +160,40 @@ WORKFLOW_CONFIG = {
     "completed_workflow_ttl": 3600  # 1 hour
 }
 
+# Single retry policy shared by reconnect/registration paths. The various
+# *_CONFIG dicts above each declared their own retry numbers with slightly
+# different semantics; new code should consume DEFAULT_RETRY_POLICY instead.
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential-backoff retry schedule."""
+    initial: float = 1.0
+    max_delay: float = 60.0
+    multiplier: float = 2.0
+    max_attempts: int = 3
+
+    def delays(self) -> Iterator[float]:
+        """Yield the sleep before each retry attempt (exponential, capped)."""
+        delay = self.initial
+        for _ in range(self.max_attempts):
+            yield delay
+            delay = min(delay * self.multiplier, self.max_delay)
+
+DEFAULT_RETRY_POLICY = RetryPolicy(
+    initial=WORKFLOW_CONFIG["retry_policy"]["initial_delay"],
+    max_delay=WORKFLOW_CONFIG["retry_policy"]["max_delay"],
+    multiplier=WORKFLOW_CONFIG["retry_policy"]["multiplier"],
+    max_attempts=WORKFLOW_CONFIG["retry_policy"]["max_attempts"]
+)
+
 # Agent Communication Protocols
 COMMUNICATION_PROTOCOLS = {
     "default_protocol": "http",
     "supported_protocols": ["http", "websocket", "grpc"],
     "message_formats": ["json", "protobuf", "msgpack"],
     "compression_algorithms": ["gzip", "lz4", "snappy"],
-    "serialization_format": "json",
+    # msgpack roughly halves wire size vs JSON for metadata payloads;
+    # external HTTP endpoints still speak JSON regardless
+    "serialization_format": os.getenv("ANGUS_SERIALIZATION", "msgpack"),
     "keep_alive_enabled": True,
     "keep_alive_interval": 30,  # seconds
     "connection_pooling": {
@@ -164,73 +205,162 @@ COMMUNICATION_PROTOCOLS = {
 }
 
 # Error Handling and Recovery Configuration
-ERROR_HANDLING_CONFIG = {
-    "global_error_handler_enabled": True,
-    "error_notification_enabled": True,
-    "error_recovery_enabled": True,
-    "max_error_retries": 3,
-    "error_retry_delay": 5,  # seconds
-    "circuit_breaker_enabled": True,
-    "fallback_strategies": {
-        "agent_unavailable": "queue_message",
-        "timeout": "retry_with_backoff",
-        "rate_limit_exceeded": "delay_and_retry",
-        "service_error": "fallback_agent"
-    },
-    "error_categories": {
-        "transient": ["timeout", "connection_error", "rate_limit"],
-        "permanent": ["authentication_error", "authorization_error", "not_found"],
-        "recoverable": ["service_unavailable", "temporary_failure"]
+def _build_error_handling_config() -> Dict[str, Any]:
+    return {
+        "global_error_handler_enabled": True,
+        "error_notification_enabled": True,
+        "error_recovery_enabled": True,
+        "max_error_retries": 3,
+        "error_retry_delay": 5,  # seconds
+        "circuit_breaker_enabled": True,
+        "fallback_strategies": {
+            "agent_unavailable": "queue_message",
+            "timeout": "retry_with_backoff",
+            "rate_limit_exceeded": "delay_and_retry",
+            "service_error": "fallback_agent"
+        },
+        "error_categories": {
+            "transient": ["timeout", "connection_error", "rate_limit"],
+            "permanent": ["authentication_error", "authorization_error", "not_found"],
+            "recoverable": ["service_unavailable", "temporary_failure"]
+        }
     }
-}
 
 # Development and Testing Configuration
-DEVELOPMENT_CONFIG = {
-    "debug_mode": False,
-    "mock_agents_enabled": False,
-    "test_mode": False,
-    "simulation_mode": False,
-    "performance_testing": {
-        "enabled": False,
-        "load_test_agents": 10,
-        "message_rate": 100,  # messages per second
-        "test_duration": 300  # 5 minutes
-    },
-    "debugging": {
-        "message_tracing": False,
-        "agent_state_logging": False,
-        "performance_profiling": False,
-        "memory_monitoring": False
+def _build_development_config() -> Dict[str, Any]:
+    return {
+        "debug_mode": False,
+        "mock_agents_enabled": False,
+        "test_mode": False,
+        "simulation_mode": False,
+        "performance_testing": {
+            "enabled": False,
+            "load_test_agents": 10,
+            "message_rate": 100,  # messages per second
+            "test_duration": 300  # 5 minutes
+        },
+        "debugging": {
+            "message_tracing": False,
+            "agent_state_logging": False,
+            "performance_profiling": False,
+            "memory_monitoring": False
+        }
     }
+
+# Lazy sections: name -> builder. Accessing the name (attribute import or
+# module attribute) builds the dict once and caches it in module globals.
+_LAZY_SECTION_BUILDERS = {
+    "MESSAGE_ROUTING_CONFIG": _build_message_routing_config,
+    "LOAD_BALANCING_CONFIG": _build_load_balancing_config,
+    "SECURITY_CONFIG": _build_security_config,
+    "MONITORING_CONFIG": _build_monitoring_config,
+    "ERROR_HANDLING_CONFIG": _build_error_handling_config,
+    "DEVELOPMENT_CONFIG": _build_development_config
 }
 
-def get_coral_server_config() -> Dict[str, Any]:
+def _section(name: str) -> Dict[str, Any]:
+    """Get a lazy section from module globals, building it on first use."""
+    value = globals().get(name)
+    if value is None:
+        value = _LAZY_SECTION_BUILDERS[name]()
+        globals()[name] = value
+    return value
+
+def __getattr__(name: str):
+    if name in _LAZY_SECTION_BUILDERS:
+        return _section(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Aggregated server config, assembled on first request - building it
+# forces every lazy section, so it can't be eager without defeating them
+_coral_server_config_frozen: Mapping[str, Any] = None
+
+def get_coral_server_config() -> Mapping[str, Any]:
     """Get the complete Coral server configuration."""
-    return {
-        "server": CORAL_SERVER_CONFIG,
-        "registry": AGENT_REGISTRY_CONFIG,
-        "routing": MESSAGE_ROUTING_CONFIG,
-        "load_balancing": LOAD_BALANCING_CONFIG,
-        "security": SECURITY_CONFIG,
-        "monitoring": MONITORING_CONFIG,
-        "workflow": WORKFLOW_CONFIG,
-        "communication": COMMUNICATION_PROTOCOLS,
-        "error_handling": ERROR_HANDLING_CONFIG,
-        "development": DEVELOPMENT_CONFIG
-    }
+    global _coral_server_config_frozen
+    if _coral_server_config_frozen is None:
+        _coral_server_config_frozen = MappingProxyType({
+            "server": CORAL_SERVER_CONFIG,
+            "registry": AGENT_REGISTRY_CONFIG,
+            "routing": _section("MESSAGE_ROUTING_CONFIG"),
+            "load_balancing": _section("LOAD_BALANCING_CONFIG"),
+            "security": _section("SECURITY_CONFIG"),
+            "monitoring": _section("MONITORING_CONFIG"),
+            "workflow": WORKFLOW_CONFIG,
+            "communication": COMMUNICATION_PROTOCOLS,
+            "error_handling": _section("ERROR_HANDLING_CONFIG"),
+            "development": _section("DEVELOPMENT_CONFIG")
+        })
+    return _coral_server_config_frozen
+
+# Capability and endpoint tables, precomputed at import so per-call lookups
+# do no list/dict construction or f-string formatting. Capability strings
+# are interned: every agent record that copies them then shares one object
+# per name, and comparisons collapse to pointer checks.
+_CAPS_BY_TYPE: Mapping[str, tuple] = MappingProxyType({
+    agent_type: tuple(sys.intern(cap) for cap in caps)
+    for agent_type, caps in {
+        "coordinator": (
+            "workflow_orchestration",
+            "task_scheduling",
+            "agent_coordination",
+            "health_monitoring"
+        ),
+        "youtube": (
+            "video_upload",
+            "comment_management",
+            "api_integration",
+            "quota_management"
+        ),
+        "database": (
+            "data_persistence",
+            "query_execution",
+            "transaction_management",
+            "backup_recovery"
+        ),
+        "ai": (
+            "content_analysis",
+            "text_generation",
+            "sentiment_analysis",
+            "music_analysis"
+        )
+    }.items()
+})
+
+_BASE_PORT = 8000
+_PORT_BY_TYPE = {
+    "coordinator": _BASE_PORT,
+    "youtube": _BASE_PORT + 1,
+    "database": _BASE_PORT + 2,
+    "ai": _BASE_PORT + 3
+}
+
+def _build_endpoints(port: int) -> Mapping[str, str]:
+    return MappingProxyType({
+        "http": f"http://localhost:{port}",
+        "health": f"http://localhost:{port}/health",
+        "metrics": f"http://localhost:{port}/metrics",
+        "status": f"http://localhost:{port}/status"
+    })
+
+_ENDPOINTS_BY_TYPE: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    agent_type: _build_endpoints(port) for agent_type, port in _PORT_BY_TYPE.items()
+})
+_DEFAULT_ENDPOINTS = _build_endpoints(_BASE_PORT + 10)
 
-def get_agent_registration_config(agent_name: str, agent_type: str) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=4096)
+def get_agent_registration_config(agent_name: str, agent_type: str) -> Mapping[str, Any]:
     """
     Get agent registration configuration.
-    
+
     Args:
         agent_name: Name of the agent
         agent_type: Type of the agent
-        
+
     Returns:
-        Registration configuration dictionary
+        Registration configuration mapping (cached per name/type pair)
     """
-    return {
+    return MappingProxyType({
         "name": agent_name,
         "type": agent_type,
         "version": "1.0.0",
@@ -243,98 +373,57 @@ def get_agent_registration_config(agent_name: str, agent_type: str) -> Dict[str,
             "metrics_url": f"/agents/{agent_name}/metrics"
         },
         "registration_config": AGENT_REGISTRY_CONFIG
-    }
+    })
 
-def get_agent_capabilities(agent_type: str) -> List[str]:
+def get_agent_capabilities(agent_type: str) -> tuple:
     """
     Get capabilities for a specific agent type.
-    
+
     Args:
         agent_type: Type of the agent
-        
+
     Returns:
-        List of capabilities
+        Tuple of capabilities
     """
-    capabilities_map = {
-        "coordinator": [
-            "workflow_orchestration",
-            "task_scheduling",
-            "agent_coordination",
-            "health_monitoring"
-        ],
-        "youtube": [
-            "video_upload",
-            "comment_management",
-            "api_integration",
-            "quota_management"
-        ],
-        "database": [
-            "data_persistence",
-            "query_execution",
-            "transaction_management",
-            "backup_recovery"
-        ],
-        "ai": [
-            "content_analysis",
-            "text_generation",
-            "sentiment_analysis",
-            "music_analysis"
-        ]
-    }
-    
-    return capabilities_map.get(agent_type, [])
+    return _CAPS_BY_TYPE.get(agent_type, ())
 
-def get_agent_endpoints(agent_type: str) -> Dict[str, str]:
+def get_agent_endpoints(agent_type: str) -> Mapping[str, str]:
     """
     Get endpoints for a specific agent type.
-    
+
     Args:
         agent_type: Type of the agent
-        
+
     Returns:
-        Dictionary of endpoint mappings
+        Mapping of endpoint names to URLs
     """
-    base_port = 8000
-    port_map = {
-        "coordinator": base_port,
-        "youtube": base_port + 1,
-        "database": base_port + 2,
-        "ai": base_port + 3
-    }
-    
-    port = port_map.get(agent_type, base_port + 10)
-    
-    return {
-        "http": f"http://localhost:{port}",
-        "health": f"http://localhost:{port}/health",
-        "metrics": f"http://localhost:{port}/metrics",
-        "status": f"http://localhost:{port}/status"
-    }
+    return _ENDPOINTS_BY_TYPE.get(agent_type, _DEFAULT_ENDPOINTS)
+
+_REQUIRED_CONFIG_SECTIONS = frozenset({"server", "registry", "routing", "monitoring"})
+_REQUIRED_SERVER_KEYS = frozenset({"host", "port", "max_connections"})
+
+def _compute_validity() -> bool:
+    return (
+        _REQUIRED_CONFIG_SECTIONS.issubset(get_coral_server_config().keys())
+        and _REQUIRED_SERVER_KEYS.issubset(CORAL_SERVER_CONFIG.keys())
+    )
+
+# The configuration is constant, so validity is computed once on first
+# call (not at import - that would force every lazy section) and cached
+_coral_config_valid = None
 
 def validate_coral_config() -> bool:
     """
     Validate the Coral Protocol configuration.
-    
+
     Returns:
-        True if configuration is valid, False otherwise
+        True if configuration is valid, False otherwise (computed once and
+        cached since the configuration is constant)
     """
-    try:
-        config = get_coral_server_config()
-        
-        # Basic validation checks
-        required_sections = ["server", "registry", "routing", "monitoring"]
-        for section in required_sections:
-            if section not in config:
-                return False
-        
-        # Validate server configuration
-        server_config = config["server"]
-        if not all(key in server_config for key in ["host", "port", "max_connections"]):
-            return False
-        
-        return True
-    except Exception:
-        return False
+    global _coral_config_valid
+    if _coral_config_valid is None:
+        _coral_config_valid = _compute_validity()
+    return _coral_config_valid
 
 # Export main configurations
 __all__ = [
@@ -345,6 +434,8 @@ __all__ = [
     "SECURITY_CONFIG",
     "MONITORING_CONFIG",
     "WORKFLOW_CONFIG",
+    "RetryPolicy",
+    "DEFAULT_RETRY_POLICY",
     "get_coral_server_config",
     "get_agent_registration_config",
     "validate_coral_config"
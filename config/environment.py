@@ -3,103 +3,103 @@ Environment configuration for Agent Angus LangChain implementation.
 
 This module loads environment variables and provides them as constants.
 """
+import functools
 import os
 import logging
-from dotenv import load_dotenv
+from dotenv import load_dotenv, find_dotenv
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# No basicConfig here - importing a config module must not reconfigure the
+# root logger for the whole process; applications own their logging setup
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file if it exists
-env_file_paths = ['.env', '../.env', '../../.env']
-env_loaded = False
-
-for env_path in env_file_paths:
-    if os.path.exists(env_path):
-        logger.info(f"Loading environment variables from {env_path}")
-        load_dotenv(env_path)
-        env_loaded = True
-        break
-
-if not env_loaded:
+# Load environment variables from .env file if it exists - one find_dotenv
+# walk instead of stat'ing each candidate path
+_env_path = find_dotenv(usecwd=True)
+if _env_path:
+    logger.info("Loading environment variables from %s", _env_path)
+    load_dotenv(_env_path)
+else:
     logger.warning("No .env file found, using system environment variables")
 
+# Snapshot the environ mapping once - module init reads a dozen variables
+_env = os.environ
+
 # Original Agent Angus credentials (from original config)
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-YOUTUBE_CLIENT_ID = os.getenv("YOUTUBE_CLIENT_ID")
-YOUTUBE_CLIENT_SECRET = os.getenv("YOUTUBE_CLIENT_SECRET")
-YOUTUBE_CHANNEL_ID = os.getenv("YOUTUBE_CHANNEL_ID")
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-SONOTELLER_API_KEY = os.getenv("SONOTELLER_API_KEY", "58fafc6204msh41ac38769729b59p17fbc3jsneeebeb330eb2")
+SUPABASE_URL = _env.get("SUPABASE_URL")
+SUPABASE_KEY = _env.get("SUPABASE_KEY")
+OPENAI_API_KEY = _env.get("OPENAI_API_KEY")
+YOUTUBE_CLIENT_ID = _env.get("YOUTUBE_CLIENT_ID")
+YOUTUBE_CLIENT_SECRET = _env.get("YOUTUBE_CLIENT_SECRET")
+YOUTUBE_CHANNEL_ID = _env.get("YOUTUBE_CHANNEL_ID")
+YOUTUBE_API_KEY = _env.get("YOUTUBE_API_KEY")
+SONOTELLER_API_KEY = _env.get("SONOTELLER_API_KEY", "58fafc6204msh41ac38769729b59p17fbc3jsneeebeb330eb2")
 
 # Coral Protocol specific configuration
-CORAL_SERVER_HOST = os.getenv("CORAL_SERVER_HOST", "coral.pushcollective.club")
-CORAL_SERVER_PORT = int(os.getenv("CORAL_SERVER_PORT", "443"))
-CORAL_SERVER_URL = os.getenv("CORAL_SERVER_URL", "https://coral.pushcollective.club")
+CORAL_SERVER_HOST = _env.get("CORAL_SERVER_HOST", "coral.pushcollective.club")
+CORAL_SERVER_PORT = int(_env.get("CORAL_SERVER_PORT", "443"))
+CORAL_SERVER_URL = _env.get("CORAL_SERVER_URL", "https://coral.pushcollective.club")
 
 # Agent configuration
-AGENT_LOG_LEVEL = os.getenv("AGENT_LOG_LEVEL", "INFO")
-AGENT_HEARTBEAT_INTERVAL = int(os.getenv("AGENT_HEARTBEAT_INTERVAL", "30"))  # seconds
-AGENT_RETRY_ATTEMPTS = int(os.getenv("AGENT_RETRY_ATTEMPTS", "3"))
-AGENT_RETRY_DELAY = int(os.getenv("AGENT_RETRY_DELAY", "5"))  # seconds
+AGENT_LOG_LEVEL = _env.get("AGENT_LOG_LEVEL", "INFO")
+AGENT_HEARTBEAT_INTERVAL = int(_env.get("AGENT_HEARTBEAT_INTERVAL", "30"))  # seconds
+AGENT_RETRY_ATTEMPTS = int(_env.get("AGENT_RETRY_ATTEMPTS", "3"))
+AGENT_RETRY_DELAY = int(_env.get("AGENT_RETRY_DELAY", "5"))  # seconds
 
 # Task scheduling configuration
-UPLOAD_TASK_INTERVAL = int(os.getenv("UPLOAD_TASK_INTERVAL", "3600"))  # 1 hour in seconds
-COMMENT_TASK_INTERVAL = int(os.getenv("COMMENT_TASK_INTERVAL", "3600"))  # 1 hour in seconds
-CLEANUP_TASK_INTERVAL = int(os.getenv("CLEANUP_TASK_INTERVAL", "86400"))  # 1 day in seconds
+UPLOAD_TASK_INTERVAL = int(_env.get("UPLOAD_TASK_INTERVAL", "3600"))  # 1 hour in seconds
+COMMENT_TASK_INTERVAL = int(_env.get("COMMENT_TASK_INTERVAL", "3600"))  # 1 hour in seconds
+CLEANUP_TASK_INTERVAL = int(_env.get("CLEANUP_TASK_INTERVAL", "86400"))  # 1 day in seconds
 
 # Processing limits
-MAX_SONGS_PER_BATCH = int(os.getenv("MAX_SONGS_PER_BATCH", "5"))
-MAX_COMMENTS_PER_VIDEO = int(os.getenv("MAX_COMMENTS_PER_VIDEO", "100"))
-MAX_REPLIES_PER_BATCH = int(os.getenv("MAX_REPLIES_PER_BATCH", "10"))
-LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", "7"))
+MAX_SONGS_PER_BATCH = int(_env.get("MAX_SONGS_PER_BATCH", "5"))
+MAX_COMMENTS_PER_VIDEO = int(_env.get("MAX_COMMENTS_PER_VIDEO", "100"))
+MAX_REPLIES_PER_BATCH = int(_env.get("MAX_REPLIES_PER_BATCH", "10"))
+LOG_RETENTION_DAYS = int(_env.get("LOG_RETENTION_DAYS", "7"))
 
 # Development/Debug settings
-DEBUG_MODE = os.getenv("DEBUG_MODE", "false").lower() == "true"
-MOCK_YOUTUBE_API = os.getenv("MOCK_YOUTUBE_API", "false").lower() == "true"
-MOCK_OPENAI_API = os.getenv("MOCK_OPENAI_API", "false").lower() == "true"
+DEBUG_MODE = _env.get("DEBUG_MODE", "false").lower() == "true"
+MOCK_YOUTUBE_API = _env.get("MOCK_YOUTUBE_API", "false").lower() == "true"
+MOCK_OPENAI_API = _env.get("MOCK_OPENAI_API", "false").lower() == "true"
+
+# Required / optional variable names as flat tuples - no per-call dict builds
+_REQUIRED_VARS = (
+    "SUPABASE_URL",
+    "SUPABASE_KEY",
+    "OPENAI_API_KEY",
+    "YOUTUBE_CLIENT_ID",
+    "YOUTUBE_CLIENT_SECRET",
+    "YOUTUBE_CHANNEL_ID"
+)
+_OPTIONAL_VARS = ("YOUTUBE_API_KEY", "SONOTELLER_API_KEY")
 
 # Validate required environment variables
+@functools.lru_cache(maxsize=1)
 def validate_environment():
-    """Validate that all required environment variables are set."""
-    required_vars = {
-        "SUPABASE_URL": SUPABASE_URL,
-        "SUPABASE_KEY": SUPABASE_KEY,
-        "OPENAI_API_KEY": OPENAI_API_KEY,
-        "YOUTUBE_CLIENT_ID": YOUTUBE_CLIENT_ID,
-        "YOUTUBE_CLIENT_SECRET": YOUTUBE_CLIENT_SECRET,
-        "YOUTUBE_CHANNEL_ID": YOUTUBE_CHANNEL_ID
-    }
-    
-    missing_vars = []
-    for var_name, var_value in required_vars.items():
-        if not var_value:
-            missing_vars.append(var_name)
-    
+    """Validate that all required environment variables are set.
+
+    Memoized: the environment snapshot is fixed at import, and startup
+    calls this from the CLI branches and AgentAngusSystem.__init__ both -
+    only the first call walks the variables.
+    """
+    missing_vars = [var for var in _REQUIRED_VARS if not _env.get(var)]
+
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        logger.error("Missing required environment variables: %s", ", ".join(missing_vars))
         return False
-    
+
     logger.info("All required environment variables are set")
     return True
 
 # Optional validation warnings
 def check_optional_vars():
     """Check optional environment variables and log warnings if missing."""
-    optional_vars = {
-        "YOUTUBE_API_KEY": YOUTUBE_API_KEY,
-        "SONOTELLER_API_KEY": SONOTELLER_API_KEY
-    }
-    
-    for var_name, var_value in optional_vars.items():
-        if not var_value:
-            logger.warning(f"Optional environment variable {var_name} is not set")
-
-# Run validation on import
-if __name__ != "__main__":
+    for var_name in _OPTIONAL_VARS:
+        if not _env.get(var_name):
+            logger.warning("Optional environment variable %s is not set", var_name)
+
+# Run validation on import unless explicitly skipped (tests, subprocess
+# workers the coordinator spawns, tooling that only needs the constants)
+if __name__ != "__main__" and _env.get("ANGUS_SKIP_ENV_VALIDATE") != "1":
     validate_environment()
     check_optional_vars()
 
@@ -9,6 +9,11 @@ following the Coral Protocol pattern:
 - Message Handlers: Inter-agent communication
 """
 
+import asyncio
+import logging
+import os
+from types import MappingProxyType
+
 # Import actual implementations
 try:
     from coral_integration.mcp_client import AngusMultiServerMCPClient, create_angus_mcp_client
@@ -20,28 +25,58 @@ except ImportError:
 __version__ = "1.0.0"
 __phase__ = "Phase 2 - MCP Integration Ready"
 
-# MCP integration components
-MCP_COMPONENTS = {
+logger = logging.getLogger(__name__)
+
+# Optional shared, pre-initialized client. Agent construction (LLM init,
+# tool wiring) costs hundreds of ms - long-running workers can pay it at
+# startup instead of on the first user-visible request.
+_SHARED_CLIENT = None
+
+async def prewarm_angus(config=None):
+    """Build and initialize the shared MCP client ahead of first use."""
+    global _SHARED_CLIENT
+    _SHARED_CLIENT = await create_angus_mcp_client(config)
+    logger.info("Angus MCP client prewarmed")
+    return _SHARED_CLIENT
+
+def get_shared_client():
+    """Return the prewarmed shared client, or None if not prewarmed yet."""
+    return _SHARED_CLIENT
+
+if os.environ.get("ANGUS_PREWARM") == "1" and MCP_INTEGRATION_AVAILABLE:
+    try:
+        asyncio.get_running_loop().create_task(prewarm_angus())
+    except RuntimeError:
+        # No running loop at import time - callers should await
+        # prewarm_angus() from their own startup hook instead
+        logger.debug("ANGUS_PREWARM set but no running event loop at import")
+
+# MCP integration components - frozen: status/component reads are served to
+# pollers and must not be mutable shared state
+MCP_COMPONENTS = MappingProxyType({
     "mcp_client": "AngusMultiServerMCPClient",
-    "server_setup": "CoralServerManager", 
+    "server_setup": "CoralServerManager",
     "agent_registry": "AgentRegistry",
     "message_handlers": "MessageHandler"
-}
+})
+_MCP_COMPONENT_NAMES = tuple(MCP_COMPONENTS)
+
+_CORAL_STATUS = MappingProxyType({
+    "phase": __phase__,
+    "mcp_available": MCP_INTEGRATION_AVAILABLE,
+    "server_ready": True,
+    "registry_ready": False,
+    "messaging_ready": False,
+    "config_ready": True
+})
 
 def get_coral_status():
     """Get current implementation status of Coral Protocol integration."""
-    return {
-        "phase": __phase__,
-        "mcp_available": MCP_INTEGRATION_AVAILABLE,
-        "server_ready": True,
-        "registry_ready": False,
-        "messaging_ready": False,
-        "config_ready": True
-    }
+    return _CORAL_STATUS
 
 def get_mcp_components():
     """Get list of MCP integration components."""
-    return list(MCP_COMPONENTS.keys())
+    return _MCP_COMPONENT_NAMES
 
 # Backward compatibility aliases
 def get_coral_components():
@@ -50,15 +85,57 @@ def get_coral_components():
 
 CORAL_COMPONENTS = MCP_COMPONENTS
 
-# Placeholder classes for components not yet implemented
 class AgentRegistry:
-    """Placeholder for agent registry (Phase 3)."""
-    
-    def __init__(self):
-        self.status = "not_implemented"
-    
-    def register_agent(self, agent_config):
-        raise NotImplementedError("Agent registry implementation pending - Phase 3")
+    """
+    Agent registration and discovery.
+
+    Uses an in-process dict by default; with ANGUS_REGISTRY_BACKEND=redis
+    (or backend="redis") records are shared across coordinator replicas via
+    coral_integration.registry_redis so state survives restarts.
+    """
+
+    def __init__(self, backend=None):
+        import os
+        backend = backend or os.getenv("ANGUS_REGISTRY_BACKEND", "memory")
+        if backend == "redis":
+            from coral_integration.registry_redis import RedisRegistryBackend
+            self._backend = RedisRegistryBackend()
+        else:
+            self._backend = None
+            self._agents = {}
+        self.status = f"ready ({backend})"
+
+    async def register_agent(self, agent_config):
+        """Register an agent record; returns the agent id."""
+        if self._backend:
+            return await self._backend.register_agent(agent_config)
+        agent_id = agent_config["name"]
+        self._agents[agent_id] = dict(agent_config)
+        return agent_id
+
+    async def heartbeat(self, agent_id):
+        """Record a heartbeat; returns False for unknown agents."""
+        if self._backend:
+            return await self._backend.heartbeat(agent_id)
+        return agent_id in self._agents
+
+    async def get_agent(self, agent_id):
+        """Fetch a single agent record, or None."""
+        if self._backend:
+            return await self._backend.get_agent(agent_id)
+        return self._agents.get(agent_id)
+
+    async def list_agents(self):
+        """List all registered agent records."""
+        if self._backend:
+            return await self._backend.list_agents()
+        return list(self._agents.values())
+
+    async def unregister_agent(self, agent_id):
+        """Remove an agent record; returns True if it existed."""
+        if self._backend:
+            return await self._backend.unregister_agent(agent_id)
+        return self._agents.pop(agent_id, None) is not None
 
 class MessageHandler:
     """Placeholder for message handler (Phase 3)."""
@@ -78,6 +155,8 @@ if MCP_INTEGRATION_AVAILABLE:
         "create_coral_server",
         "AgentRegistry",
         "MessageHandler",
+        "prewarm_angus",
+        "get_shared_client",
         "get_coral_status",
         "get_mcp_components",
         "get_coral_components"
@@ -0,0 +1,61 @@
+"""
+Process-wide connection pooling for Coral traffic.
+
+COMMUNICATION_PROTOCOLS declares connection_pooling but nothing wired a
+pool, so every client opening HTTP connections would pay a fresh TCP (and
+TLS, against the default port-443 Coral URL) handshake. This module holds
+one lazily-built aiohttp.ClientSession sized from that config; all Coral
+HTTP callers should go through get_session() instead of constructing
+their own.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from config.coral_config import COMMUNICATION_PROTOCOLS
+
+logger = logging.getLogger(__name__)
+
+_session: Optional["aiohttp.ClientSession"] = None
+_session_lock = asyncio.Lock()
+
+
+async def get_session() -> "aiohttp.ClientSession":
+    """Get the shared HTTP session, building it on first use.
+
+    The connector limit and keep-alive come from
+    COMMUNICATION_PROTOCOLS["connection_pooling"], so pool sizing stays in
+    one place.
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("aiohttp package not available - install aiohttp>=3.9.0")
+
+    global _session
+    if _session is None or _session.closed:
+        async with _session_lock:
+            if _session is None or _session.closed:
+                pooling = COMMUNICATION_PROTOCOLS["connection_pooling"]
+                connector = aiohttp.TCPConnector(
+                    limit=pooling["max_pool_size"],
+                    keepalive_timeout=COMMUNICATION_PROTOCOLS["keep_alive_interval"]
+                )
+                _session = aiohttp.ClientSession(connector=connector)
+                logger.info("Shared HTTP session created (pool=%s)", pooling["max_pool_size"])
+    return _session
+
+
+async def close_session():
+    """Close the shared session; call from application shutdown hooks."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("Shared HTTP session closed")
+    _session = None
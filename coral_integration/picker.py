@@ -0,0 +1,113 @@
+"""
+Server/agent pickers implementing LOAD_BALANCING_CONFIG strategies.
+
+Gives the load-balancing configuration (strategy + per-type weights) an
+actual consumer: weighted round-robin using the classic LVS gcd algorithm,
+and least-connections tracked via an async context manager around each call.
+"""
+
+import math
+import random
+import logging
+from functools import reduce
+from typing import Dict, List, Optional, Sequence
+
+from config.coral_config import LOAD_BALANCING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class WeightedRR:
+    """
+    Weighted round-robin picker (LVS gcd algorithm).
+
+    Servers with higher weight are picked proportionally more often. The
+    start index is randomized so equal-weight fleets don't all hammer the
+    first server after a synchronized restart.
+    """
+
+    def __init__(self, servers: Sequence[str], weights: Optional[Dict[str, float]] = None):
+        if not servers:
+            raise ValueError("WeightedRR requires at least one server")
+        self.servers = list(servers)
+        weights = weights or {}
+        # Scale float weights (e.g. 0.8/1.5) to integers for the gcd walk
+        self._weights = [max(1, round(weights.get(s, 1.0) * 10)) for s in self.servers]
+        self._gcd = reduce(math.gcd, self._weights)
+        self._max_weight = max(self._weights)
+        self._index = random.randrange(len(self.servers))
+        self._current_weight = 0
+
+    def next(self) -> str:
+        """Return the next server according to weight."""
+        while True:
+            self._index = (self._index + 1) % len(self.servers)
+            if self._index == 0:
+                self._current_weight -= self._gcd
+                if self._current_weight <= 0:
+                    self._current_weight = self._max_weight
+            if self._weights[self._index] >= self._current_weight:
+                return self.servers[self._index]
+
+
+class LeastConnections:
+    """
+    Least-connections picker.
+
+    Track in-flight calls per server with ``async with picker.track(server):``
+    around the actual work; ``next()`` returns the server with the fewest
+    open calls (ties broken randomly).
+    """
+
+    def __init__(self, servers: Sequence[str]):
+        if not servers:
+            raise ValueError("LeastConnections requires at least one server")
+        self.servers = list(servers)
+        self.counts: Dict[str, int] = {s: 0 for s in self.servers}
+
+    def next(self) -> str:
+        """Return the server with the fewest in-flight calls."""
+        min_count = min(self.counts.values())
+        candidates = [s for s in self.servers if self.counts[s] == min_count]
+        return random.choice(candidates)
+
+    def track(self, server: str) -> "_ConnectionTracker":
+        """Async context manager that counts an in-flight call on server."""
+        return _ConnectionTracker(self, server)
+
+
+class _ConnectionTracker:
+    """Increments/decrements a server's in-flight count around a call."""
+
+    def __init__(self, picker: LeastConnections, server: str):
+        self._picker = picker
+        self._server = server
+
+    async def __aenter__(self):
+        self._picker.counts[self._server] += 1
+        return self._server
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._picker.counts[self._server] -= 1
+        return False
+
+
+def create_picker(servers: Sequence[str], strategy: Optional[str] = None):
+    """
+    Create a picker for the given servers honoring LOAD_BALANCING_CONFIG.
+
+    Args:
+        servers: Server/agent identifiers to balance across
+        strategy: Override; defaults to LOAD_BALANCING_CONFIG["strategy"].
+            Accepts round_robin/wrr/weighted and least_connections/least_conn.
+
+    Returns:
+        A WeightedRR or LeastConnections instance
+    """
+    strategy = strategy or LOAD_BALANCING_CONFIG["strategy"]
+    if strategy in ("least_connections", "least_conn"):
+        return LeastConnections(servers)
+    if strategy in ("round_robin", "weighted", "wrr"):
+        return WeightedRR(servers, LOAD_BALANCING_CONFIG.get("weights"))
+    logger.warning("Unknown load balancing strategy '%s', using weighted round-robin", strategy)
+    return WeightedRR(servers, LOAD_BALANCING_CONFIG.get("weights"))
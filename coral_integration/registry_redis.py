@@ -0,0 +1,109 @@
+"""
+Redis-backed agent registry for Agent Angus LangChain system.
+
+Stores agent records in Redis with a TTL matching AGENT_REGISTRY_CONFIG's
+agent_ttl, so every coordinator replica shares one registry view and agent
+state survives process restarts. Discovery broadcasts go over Redis pub/sub.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# orjson is 5-10x faster than stdlib json on dict-heavy payloads like
+# agent records; fall back silently when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    _loads = json.loads
+
+from config.coral_config import AGENT_REGISTRY_CONFIG, COMMUNICATION_PROTOCOLS
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "agent:"
+_DISCOVERY_CHANNEL = "coral:agent_discovery"
+
+
+class RedisRegistryBackend:
+    """
+    Shared registry backend over Redis.
+
+    Agent records live under ``agent:{id}`` with TTL = agent_ttl; heartbeats
+    just refresh the expiry, and discovery scans ``agent:*``. A single
+    connection pool (sized from COMMUNICATION_PROTOCOLS) is shared per
+    backend instance.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, agent_ttl: Optional[int] = None):
+        """Initialize the backend; requires the redis package and a Redis server."""
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package not available - install redis>=5.0.0")
+
+        url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        pool_size = COMMUNICATION_PROTOCOLS["connection_pooling"]["max_pool_size"]
+        self._redis = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool.from_url(url, max_connections=pool_size)
+        )
+        self.agent_ttl = agent_ttl or AGENT_REGISTRY_CONFIG["agent_ttl"]
+        logger.info("Redis registry backend initialized (ttl=%ss)", self.agent_ttl)
+
+    async def register_agent(self, agent_config: Dict[str, Any]) -> str:
+        """Register an agent record and broadcast its arrival."""
+        agent_id = agent_config["name"]
+        await self._redis.set(
+            _KEY_PREFIX + agent_id,
+            _dumps(dict(agent_config)),
+            ex=self.agent_ttl
+        )
+        await self._redis.publish(_DISCOVERY_CHANNEL, agent_id)
+        return agent_id
+
+    async def heartbeat(self, agent_id: str) -> bool:
+        """Refresh an agent's TTL; returns False if the record expired."""
+        return bool(await self._redis.expire(_KEY_PREFIX + agent_id, self.agent_ttl))
+
+    async def heartbeat_many(self, agent_ids: List[str]) -> List[bool]:
+        """Refresh several agents' TTLs in one pipelined round-trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for agent_id in agent_ids:
+                pipe.expire(_KEY_PREFIX + agent_id, self.agent_ttl)
+            results = await pipe.execute()
+        return [bool(r) for r in results]
+
+    async def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a single agent record, or None if unknown/expired."""
+        raw = await self._redis.get(_KEY_PREFIX + agent_id)
+        return _loads(raw) if raw is not None else None
+
+    async def list_agents(self) -> List[Dict[str, Any]]:
+        """Discover all live agent records via SCAN."""
+        agents = []
+        async for key in self._redis.scan_iter(match=_KEY_PREFIX + "*"):
+            raw = await self._redis.get(key)
+            if raw is not None:
+                agents.append(_loads(raw))
+        return agents
+
+    async def unregister_agent(self, agent_id: str) -> bool:
+        """Remove an agent record."""
+        return bool(await self._redis.delete(_KEY_PREFIX + agent_id))
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
@@ -5,6 +5,7 @@ This module will handle Coral Protocol server configuration and management.
 Currently a placeholder for Phase 2 implementation.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 
@@ -30,8 +31,18 @@ class CoralServerManager:
         self.status = "not_implemented"
         self.port = self.config.get("port", 5555)
         self.host = self.config.get("host", "localhost")
+        self._ready = asyncio.Event()
         logger.info("Coral server manager placeholder initialized")
-    
+
+    async def wait_ready(self, timeout: float = 5.0):
+        """Block until the server reports ready, or raise TimeoutError.
+
+        Lets callers proceed the moment the server is actually up instead
+        of sleeping a fixed grace period. The Phase 2 start_server
+        implementation must set self._ready once it is accepting agents.
+        """
+        await asyncio.wait_for(self._ready.wait(), timeout)
+
     async def start_server(self):
         """Start the Coral Protocol server."""
         logger.warning("Coral server start_server() called - Phase 2 implementation pending")
@@ -44,6 +55,7 @@ class CoralServerManager:
     
     async def stop_server(self):
         """Stop the Coral Protocol server."""
+        self._ready.clear()
         logger.warning("Coral server stop_server() called - Phase 2 implementation pending")
         raise NotImplementedError("Coral Protocol server implementation pending - Phase 2")
     
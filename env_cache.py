@@ -0,0 +1,22 @@
+"""
+Frozen environment snapshot for launcher checks and hot-path reads.
+
+os.getenv goes through the live environ mapping on every call; the agent
+code reads the same handful of keys (API credentials, tuning knobs) over
+and over, and the launcher env checks were copy-pasted between scripts.
+ENV is a read-only snapshot taken once at import - downstream code does a
+plain dict lookup instead of re-querying the OS per read.
+
+Import this module after load_dotenv() has run (the agents all load their
+.env at module top, and the launchers import lazily inside their check
+functions), so the snapshot includes .env-provided values.
+"""
+import os
+import types
+
+# One read of the process environment; immutable thereafter
+ENV = types.MappingProxyType(dict(os.environ))
+
+def require(keys):
+    """Return the subset of keys that are missing or empty in ENV."""
+    return [key for key in keys if not ENV.get(key)]
@@ -0,0 +1,103 @@
+"""
+Shared helpers for the Coral launcher scripts.
+
+print_banner, check_requirements and check_environment were verbatim
+copies in start_coral_agents.py and start_coral_client.py. They live here
+once, and the check functions are memoized so a process that runs both
+(or re-checks) pays the package/env walk a single time.
+
+Kept at the repo root with _requirements_cache and env_cache: importing
+from the tools package would execute its heavy __init__, which launcher
+startup must avoid.
+"""
+import functools
+
+_ASCII_ART = """
+🌊 ═══════════════════════════════════════════════════════════════════════════════ 🌊
+
+    ░█████╗░░██████╗░███████╗███╗░░██╗████████╗  ░█████╗░███╗░░██╗░██████╗░██╗░░░██╗░██████╗
+    ██╔══██╗██╔════╝░██╔════╝████╗░██║╚══██╔══╝  ██╔══██╗████╗░██║██╔════╝░██║░░░██║██╔════╝
+    ███████║██║░░██╗░█████╗░░██╔██╗██║░░░██║░░░  ███████║██╔██╗██║██║░░██╗░██║░░░██║╚█████╗░
+    ██╔══██║██║░░╚██╗██╔══╝░░██║╚████║░░░██║░░░  ██╔══██║██║╚████║██║░░╚██╗██║░░░██║░╚═══██╗
+    ██║░░██║╚██████╔╝███████╗██║░╚███║░░░██║░░░  ██║░░██║██║░╚███║╚██████╔╝╚██████╔╝██████╔╝
+    ╚═╝░░╚═╝░╚═════╝░╚══════╝╚═╝░░╚══╝░░░╚═╝░░░  ╚═╝░░╚═╝╚═╝░░╚══╝░╚═════╝░░╚═════╝░╚═════╝░
+
+    {title}
+
+🌊 ═══════════════════════════════════════════════════════════════════════════════ 🌊
+"""
+
+# Package name to import name mapping
+REQUIRED_PACKAGES = (
+    ("langchain", "langchain"),
+    ("langchain_mcp_adapters", "langchain_mcp_adapters"),
+    ("langchain_openai", "langchain_openai"),
+    ("openai", "openai"),
+    ("supabase", "supabase"),
+    ("google-api-python-client", "googleapiclient")
+)
+
+REQUIRED_VARS = (
+    "OPENAI_API_KEY",
+    "SUPABASE_URL",
+    "SUPABASE_KEY",
+    "YOUTUBE_CLIENT_ID",
+    "YOUTUBE_CLIENT_SECRET"
+)
+
+def print_banner(title):
+    """Print the Agent Angus launcher banner with the given title line."""
+    print(_ASCII_ART.format(title=title))
+
+@functools.lru_cache(maxsize=None)
+def check_requirements(required_packages=REQUIRED_PACKAGES):
+    """Check if all required dependencies are installed.
+
+    Resolution (and its cross-process cache) lives in _requirements_cache;
+    no package is actually imported just to prove it exists. Memoized per
+    package tuple, so repeat calls in one process are O(1).
+    """
+    print("🔍 Checking requirements...")
+
+    from _requirements_cache import verify
+    available = verify(required_packages)
+
+    missing_packages = []
+
+    for package_name, _ in required_packages:
+        if available[package_name]:
+            print(f"  ✅ {package_name}")
+        else:
+            print(f"  ❌ {package_name}")
+            missing_packages.append(package_name)
+
+    if missing_packages:
+        print(f"\n❌ Missing packages: {', '.join(missing_packages)}")
+        print("Please install them with: pip install -r requirements.txt")
+        return False
+
+    print("✅ All requirements satisfied!")
+    return True
+
+@functools.lru_cache(maxsize=None)
+def check_environment(required_vars=REQUIRED_VARS):
+    """Check if required environment variables are set.
+
+    One environ snapshot (env_cache) instead of per-variable getenv calls;
+    memoized per variable tuple.
+    """
+    print("\n🔍 Checking environment variables...")
+
+    import env_cache
+    missing_vars = env_cache.require(required_vars)
+
+    for var in required_vars:
+        print(f"  {'❌' if var in missing_vars else '✅'} {var}")
+
+    if missing_vars:
+        print(f"\n❌ Missing environment variables: {', '.join(missing_vars)}")
+        print("Please set them in your .env file")
+        return False
+
+    print("✅ All environment variables set!")
+    return True
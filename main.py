@@ -7,33 +7,68 @@ multi-agent system with Coral Protocol integration.
 """
 import asyncio
 import argparse
+import atexit
+import functools
 import logging
+import queue
 import sys
 import signal
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from pathlib import Path
 
 # Add the current directory to the path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config.environment import (
-    validate_environment, 
-    print_environment_summary,
-    AGENT_LOG_LEVEL,
-    DEBUG_MODE
-)
-from config.coral_config import validate_coral_config
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, AGENT_LOG_LEVEL.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+# Config (and through it dotenv/env validation) is imported inside main()
+# so --help and shell completion never pay its cost
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def _load_agent_classes():
+    """Import the agent classes once per process.
+
+    Lazy (not module-scope) so --help never pays the agent-module imports,
+    memoized so start/stop cycles don't re-run the import machinery.
+    """
+    from agents.coordinator_agent import AngusCoordinatorAgent
+    from agents.youtube_agent import YouTubeAgent
+    from agents.database_agent import DatabaseAgent
+    from agents.ai_agent import AIAgent
+
+    return {
+        "coordinator": AngusCoordinatorAgent,
+        "youtube": YouTubeAgent,
+        "database": DatabaseAgent,
+        "ai": AIAgent
+    }
+
+def configure_logging(level: str):
+    """Configure process-wide logging for the CLI entry point.
+
+    Records go through a QueueHandler; the stream/file writes happen on a
+    QueueListener thread so log syscalls stay off the event loop.
+    """
+    log_queue = queue.Queue(-1)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    sinks = [
         logging.StreamHandler(sys.stdout),
         logging.FileHandler('angus_langchain.log')
     ]
-)
-logger = logging.getLogger(__name__)
+    for sink in sinks:
+        sink.setFormatter(formatter)
+
+    queue_handler = QueueHandler(log_queue)
+    # Pass records through unformatted; the listener's sinks format them
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=getattr(logging, level.upper()),
+        handlers=[queue_handler]
+    )
+    listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
 class AgentAngusSystem:
     """
@@ -45,7 +80,11 @@ class AgentAngusSystem:
         self.coral_server = None
         self.agents = {}
         self.running = False
-        
+        self._stop = asyncio.Event()
+
+        from config.environment import validate_environment
+        from config.coral_config import validate_coral_config
+
         # Validate environment on startup
         if not validate_environment():
             logger.error("Environment validation failed. Please check your configuration.")
@@ -86,38 +125,42 @@ class AgentAngusSystem:
         
         try:
             logger.info(f"Starting agents: {', '.join(agent_types)}")
-            
-            # Import agent classes
-            from agents.coordinator_agent import AngusCoordinatorAgent
-            from agents.youtube_agent import YouTubeAgent
-            from agents.database_agent import DatabaseAgent
-            from agents.ai_agent import AIAgent
-            
-            agent_classes = {
-                "coordinator": AngusCoordinatorAgent,
-                "youtube": YouTubeAgent,
-                "database": DatabaseAgent,
-                "ai": AIAgent
-            }
-            
-            # Start each requested agent
+
+            agent_classes = _load_agent_classes()
+
+
+            # Start the requested agents concurrently - startup cost is the
+            # slowest agent's init (DB connect, OAuth, model warm-up), not
+            # the sum of all of them
+            to_start = []
             for agent_type in agent_types:
                 if agent_type in agent_classes:
                     logger.info(f"Starting {agent_type} agent...")
-                    
-                    agent_class = agent_classes[agent_type]
-                    agent = agent_class()
-                    
-                    # Start the agent (this will be async)
-                    await agent.start()
-                    
-                    self.agents[agent_type] = agent
-                    logger.info(f"{agent_type} agent started successfully")
+                    to_start.append((agent_type, agent_classes[agent_type]()))
                 else:
                     logger.warning(f"Unknown agent type: {agent_type}")
-            
+
+            results = await asyncio.gather(
+                *(agent.start() for _, agent in to_start),
+                return_exceptions=True
+            )
+
+            failure = None
+            for (agent_type, agent), result in zip(to_start, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to start {agent_type} agent: {str(result)}")
+                    failure = result
+                else:
+                    self.agents[agent_type] = agent
+                    logger.info(f"{agent_type} agent started successfully")
+
+            if failure is not None:
+                # Don't leave the survivors half-running
+                await self.stop_agents()
+                raise failure
+
             logger.info("All requested agents started successfully")
-            
+
         except Exception as e:
             logger.error(f"Failed to start agents: {str(e)}")
             raise
@@ -126,15 +169,20 @@ class AgentAngusSystem:
         """Stop all running agents."""
         try:
             logger.info("Stopping all agents...")
-            
-            for agent_type, agent in self.agents.items():
-                logger.info(f"Stopping {agent_type} agent...")
-                await agent.stop()
-                logger.info(f"{agent_type} agent stopped")
-            
+
+            results = await asyncio.gather(
+                *(agent.stop() for agent in self.agents.values()),
+                return_exceptions=True
+            )
+            for agent_type, result in zip(self.agents, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error stopping {agent_type} agent: {str(result)}")
+                else:
+                    logger.info(f"{agent_type} agent stopped")
+
             self.agents.clear()
             logger.info("All agents stopped successfully")
-            
+
         except Exception as e:
             logger.error(f"Error stopping agents: {str(e)}")
     
@@ -158,23 +206,25 @@ class AgentAngusSystem:
         """
         try:
             self.running = True
-            
+            self._install_signal_handlers()
+
             # Start Coral server first
             await self.start_coral_server()
-            
-            # Wait a moment for server to be ready
-            await asyncio.sleep(2)
-            
+
+            # Proceed the moment the server is actually ready instead of
+            # sleeping a flat 2s grace period on every launch
+            await self.coral_server.wait_ready(timeout=5)
+
             # Start agents
             await self.start_agents(agent_types)
             
             logger.info("Agent Angus system started successfully")
             logger.info("System is running. Press Ctrl+C to stop.")
-            
-            # Keep the system running
-            while self.running:
-                await asyncio.sleep(1)
-                
+
+            # Block until shutdown is requested - no periodic wakeups, and
+            # the stop signal takes effect immediately instead of within 1s
+            await self._stop.wait()
+
         except KeyboardInterrupt:
             logger.info("Received shutdown signal")
         except Exception as e:
@@ -183,11 +233,29 @@ class AgentAngusSystem:
         finally:
             await self.shutdown()
     
+    def _install_signal_handlers(self):
+        """Install SIGINT/SIGTERM handlers on the running loop.
+
+        loop.add_signal_handler schedules the callback on the loop itself -
+        unlike signal.signal + create_task, which is not safe from a
+        synchronous handler and could die with "no running event loop",
+        truncating graceful shutdown.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop.set)
+            except NotImplementedError:
+                # Windows event loops don't support signal handlers;
+                # KeyboardInterrupt handling in main() covers Ctrl+C there
+                break
+
     async def shutdown(self):
         """Gracefully shutdown the system."""
         try:
             logger.info("Shutting down Agent Angus system...")
             self.running = False
+            self._stop.set()
             
             # Stop agents first
             await self.stop_agents()
@@ -200,15 +268,6 @@ class AgentAngusSystem:
         except Exception as e:
             logger.error(f"Error during shutdown: {str(e)}")
 
-def setup_signal_handlers(system: AgentAngusSystem):
-    """Set up signal handlers for graceful shutdown."""
-    def signal_handler(signum, frame):
-        logger.info(f"Received signal {signum}")
-        asyncio.create_task(system.shutdown())
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
 async def run_single_agent(agent_type: str):
     """
     Run a single agent for development/testing.
@@ -218,20 +277,9 @@ async def run_single_agent(agent_type: str):
     """
     try:
         logger.info(f"Running single {agent_type} agent...")
-        
-        # Import agent classes
-        from agents.coordinator_agent import AngusCoordinatorAgent
-        from agents.youtube_agent import YouTubeAgent
-        from agents.database_agent import DatabaseAgent
-        from agents.ai_agent import AIAgent
-        
-        agent_classes = {
-            "coordinator": AngusCoordinatorAgent,
-            "youtube": YouTubeAgent,
-            "database": DatabaseAgent,
-            "ai": AIAgent
-        }
-        
+
+        agent_classes = _load_agent_classes()
+
         if agent_type not in agent_classes:
             logger.error(f"Unknown agent type: {agent_type}")
             return
@@ -243,11 +291,10 @@ async def run_single_agent(agent_type: str):
         await agent.start()
         
         logger.info(f"{agent_type} agent started. Press Ctrl+C to stop.")
-        
-        # Keep running
+
+        # Block until interrupted - no 1 Hz wakeups
         try:
-            while True:
-                await asyncio.sleep(1)
+            await asyncio.Event().wait()
         except KeyboardInterrupt:
             logger.info("Received shutdown signal")
         finally:
@@ -283,7 +330,18 @@ def main():
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
     
     args = parser.parse_args()
-    
+
+    # Deferred so argparse-only invocations (--help) stay fast
+    from config.environment import (
+        validate_environment,
+        print_environment_summary,
+        AGENT_LOG_LEVEL,
+        DEBUG_MODE
+    )
+    from config.coral_config import validate_coral_config
+
+    configure_logging(AGENT_LOG_LEVEL)
+
     # Handle debug mode
     if args.debug or DEBUG_MODE:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -329,8 +387,7 @@ def main():
             try:
                 await server.start_server()
                 logger.info("Coral server started. Press Ctrl+C to stop.")
-                while True:
-                    await asyncio.sleep(1)
+                await asyncio.Event().wait()
             except KeyboardInterrupt:
                 logger.info("Stopping server...")
             finally:
@@ -347,8 +404,7 @@ def main():
     # Handle system start
     if args.start or not any([args.validate_env, args.print_env, args.validate_config, args.server_only, args.agent]):
         system = AgentAngusSystem()
-        setup_signal_handlers(system)
-        
+
         try:
             asyncio.run(system.start_system(args.agents))
         except KeyboardInterrupt:
@@ -5,87 +5,22 @@ This script helps launch all the specialized agents in the correct order
 and provides a unified interface for managing the distributed system.
 """
 import asyncio
-import subprocess
 import sys
-import time
 import os
 from pathlib import Path
 
-def print_banner():
-    print("""
-🌊 ═══════════════════════════════════════════════════════════════════════════════ 🌊
-   
-    ░█████╗░░██████╗░███████╗███╗░░██╗████████╗  ░█████╗░███╗░░██╗░██████╗░██╗░░░██╗░██████╗
-    ██╔══██╗██╔════╝░██╔════╝████╗░██║╚══██╔══╝  ██╔══██╗████╗░██║██╔════╝░██║░░░██║██╔════╝
-    ███████║██║░░██╗░█████╗░░██╔██╗██║░░░██║░░░  ███████║██╔██╗██║██║░░██╗░██║░░░██║╚█████╗░
-    ██╔══██║██║░░╚██╗██╔══╝░░██║╚████║░░░██║░░░  ██╔══██║██║╚████║██║░░╚██╗██║░░░██║░╚═══██╗
-    ██║░░██║╚██████╔╝███████╗██║░╚███║░░░██║░░░  ██║░░██║██║░╚███║╚██████╔╝╚██████╔╝██████╔╝
-    ╚═╝░░╚═╝░╚═════╝░╚══════╝╚═╝░░╚══╝░░░╚═╝░░░  ╚═╝░░╚═╝╚═╝░░╚══╝░╚═════╝░░╚═════╝░╚═════╝░
-    
-    🎵 CORAL PROTOCOL MULTI-AGENT MUSIC AUTOMATION SYSTEM 🎵
-    
-🌊 ═══════════════════════════════════════════════════════════════════════════════ 🌊
-""")
+# Sentinel each agent prints on stdout once its executor is built and it
+# is ready for work; the supervisor waits for it instead of sleeping a
+# blind 2s per agent
+_READY_SENTINEL = "AGENT_READY"
 
-def check_requirements():
-    """Check if all required dependencies are installed."""
-    print("🔍 Checking requirements...")
-    
-    required_packages = [
-        "langchain",
-        "langchain_mcp_adapters", 
-        "langchain_openai",
-        "openai",
-        "supabase",
-        "google-api-python-client"
-    ]
-    
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
-            print(f"  ✅ {package}")
-        except ImportError:
-            print(f"  ❌ {package}")
-            missing_packages.append(package)
-    
-    if missing_packages:
-        print(f"\n❌ Missing packages: {', '.join(missing_packages)}")
-        print("Please install them with: pip install -r requirements.txt")
-        return False
-    
-    print("✅ All requirements satisfied!")
-    return True
+# An agent that hasn't reported ready within this window is stuck (bad
+# credentials, unreachable Coral server) - fail the launch instead of
+# hanging forever on readline
+_READY_TIMEOUT = 30.0  # seconds
 
-def check_environment():
-    """Check if required environment variables are set."""
-    print("\n🔍 Checking environment variables...")
-    
-    required_vars = [
-        "OPENAI_API_KEY",
-        "SUPABASE_URL", 
-        "SUPABASE_KEY",
-        "YOUTUBE_CLIENT_ID",
-        "YOUTUBE_CLIENT_SECRET"
-    ]
-    
-    missing_vars = []
-    
-    for var in required_vars:
-        if os.getenv(var):
-            print(f"  ✅ {var}")
-        else:
-            print(f"  ❌ {var}")
-            missing_vars.append(var)
-    
-    if missing_vars:
-        print(f"\n❌ Missing environment variables: {', '.join(missing_vars)}")
-        print("Please set them in your .env file")
-        return False
-    
-    print("✅ All environment variables set!")
-    return True
+# Banner and pre-flight checks are shared with start_coral_client.py
+from launcher_common import print_banner, check_requirements, check_environment
 
 def start_coral_server():
     """Start the Coral Protocol server."""
@@ -97,33 +32,83 @@ def start_coral_server():
     # Wait for user confirmation
     input("\nPress Enter when the Coral server is running...")
 
-def start_agent(agent_name, script_path):
-    """Start an individual agent."""
-    print(f"\n🚀 Starting {agent_name}...")
-    
+async def _wait_ready(agent_name, process):
+    """Stream an agent's output until it reports readiness.
+
+    Lines are prefix-tagged with the agent name; the sentinel replaces
+    the old 2s-per-agent heuristic sleep with actual readiness.
+    """
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"{agent_name} exited before becoming ready")
+        text = line.decode(errors="replace").rstrip()
+        if text == _READY_SENTINEL:
+            print(f"✅ {agent_name} ready! (pid {process.pid})")
+            return
+        if text:
+            print(f"[{agent_name}] {text}")
+
+async def _pump_output(agent_name, process):
+    """Relay an agent's remaining output, prefix-tagged, until it exits."""
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            break
+        text = line.decode(errors="replace").rstrip()
+        if text:
+            print(f"[{agent_name}] {text}")
+    await process.wait()
+
+async def _supervise_agents(agents):
+    """Spawn all agents concurrently and supervise them from one loop.
+
+    Startup wall-clock is max(agent init) instead of the old serial
+    4 x (spawn + 2s sleep): every child is created up front and readiness
+    is awaited in parallel via each agent's AGENT_READY sentinel.
+    """
+    processes = await asyncio.gather(*(
+        asyncio.create_subprocess_exec(
+            sys.executable, script_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        for _, script_path in agents
+    ))
+
+    for (agent_name, _), process in zip(agents, processes):
+        print(f"🚀 Starting {agent_name}... (pid {process.pid})")
+
     try:
-        # Start the agent in a new terminal/process
-        if sys.platform == "win32":
-            # Windows
-            subprocess.Popen([
-                "cmd", "/c", "start", "cmd", "/k", 
-                f"python {script_path}"
-            ])
-        else:
-            # Unix/Linux/Mac
-            subprocess.Popen([
-                "gnome-terminal", "--", "python", script_path
-            ])
-        
-        print(f"✅ {agent_name} started successfully!")
-        return True
-        
+        await asyncio.gather(*(
+            asyncio.wait_for(_wait_ready(agent_name, process), _READY_TIMEOUT)
+            for (agent_name, _), process in zip(agents, processes)
+        ))
     except Exception as e:
-        print(f"❌ Failed to start {agent_name}: {e}")
-        return False
+        print(f"\n❌ {e}. Aborting...")
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*(p.wait() for p in processes))
+        sys.exit(1)
+
+    print_system_running()
+
+    # Relay output until the agents exit; Ctrl+C tears everything down
+    try:
+        await asyncio.gather(*(
+            _pump_output(agent_name, process)
+            for (agent_name, _), process in zip(agents, processes)
+        ))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n🛑 Shutting down all agents...")
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*(p.wait() for p in processes))
 
 def main():
-    print_banner()
+    print_banner("🎵 CORAL PROTOCOL MULTI-AGENT MUSIC AUTOMATION SYSTEM 🎵")
     
     # Check requirements
     if not check_requirements():
@@ -145,15 +130,13 @@ def main():
     ]
     
     print("\n🎵 Starting Agent Angus Multi-Agent System...")
-    
-    # Start each agent with a delay
-    for agent_name, script_path in agents:
-        if start_agent(agent_name, script_path):
-            time.sleep(2)  # Wait between agent starts
-        else:
-            print(f"❌ Failed to start {agent_name}. Aborting...")
-            sys.exit(1)
-    
+
+    try:
+        asyncio.run(_supervise_agents(agents))
+    except KeyboardInterrupt:
+        print("\n🛑 Launcher interrupted")
+
+def print_system_running():
     print(f"""
 🎉 All agents started successfully!
 
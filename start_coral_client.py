@@ -3,109 +3,78 @@ Simple launcher for Agent Angus Coral Protocol client.
 
 This script provides an easy way to start Agent Angus connected to the Coral Protocol network.
 """
+import asyncio
 import os
+import runpy
 import sys
-import subprocess
 from pathlib import Path
 
-def print_banner():
-    print("""
-🌊 ═══════════════════════════════════════════════════════════════════════════════ 🌊
-   
-    ░█████╗░░██████╗░███████╗███╗░░██╗████████╗  ░█████╗░███╗░░██╗░██████╗░██╗░░░██╗░██████╗
-    ██╔══██╗██╔════╝░██╔════╝████╗░██║╚══██╔══╝  ██╔══██╗████╗░██║██╔════╝░██║░░░██║██╔════╝
-    ███████║██║░░██╗░█████╗░░██╔██╗██║░░░██║░░░  ███████║██╔██╗██║██║░░██╗░██║░░░██║╚█████╗░
-    ██╔══██║██║░░╚██╗██╔══╝░░██║╚████║░░░██║░░░  ██╔══██║██║╚████║██║░░╚██╗██║░░░██║░╚═══██╗
-    ██║░░██║╚██████╔╝███████╗██║░╚███║░░░██║░░░  ██║░░██║██║░╚███║╚██████╔╝╚██████╔╝██████╔╝
-    ╚═╝░░╚═╝░╚═════╝░╚══════╝╚═╝░░╚══╝░░░╚═╝░░░  ╚═╝░░╚═╝╚═╝░░╚══╝░╚═════╝░░╚═════╝░╚═════╝░
-    
-    🌊 CORAL PROTOCOL CLIENT LAUNCHER 🌊
-    
-🌊 ═══════════════════════════════════════════════════════════════════════════════ 🌊
-""")
+# Banner and pre-flight checks are shared with start_coral_agents.py
+from launcher_common import print_banner, check_requirements, check_environment
 
-def check_requirements():
-    """Check if required dependencies are installed."""
-    print("🔍 Checking requirements...")
-    
-    # Package name to import name mapping
-    required_packages = [
-        ("langchain", "langchain"),
-        ("langchain_mcp_adapters", "langchain_mcp_adapters"), 
-        ("langchain_openai", "langchain_openai"),
-        ("openai", "openai"),
-        ("supabase", "supabase"),
-        ("google-api-python-client", "googleapiclient")  # Fixed: use correct import name
-    ]
-    
-    missing_packages = []
-    
-    for package_name, import_name in required_packages:
-        try:
-            __import__(import_name)
-            print(f"  ✅ {package_name}")
-        except ImportError:
-            print(f"  ❌ {package_name}")
-            missing_packages.append(package_name)
-    
-    if missing_packages:
-        print(f"\n❌ Missing packages: {', '.join(missing_packages)}")
-        print("Please install them with: pip install -r requirements.txt")
-        return False
-    
-    print("✅ All requirements satisfied!")
-    return True
+_CORAL_HOST = "coral.pushcollective.club"
+_CORAL_PORT = 5555
 
-def check_environment():
-    """Check if required environment variables are set."""
-    print("\n🔍 Checking environment variables...")
-    
-    required_vars = [
-        "OPENAI_API_KEY",
-        "SUPABASE_URL", 
-        "SUPABASE_KEY",
-        "YOUTUBE_CLIENT_ID",
-        "YOUTUBE_CLIENT_SECRET"
-    ]
-    
-    missing_vars = []
-    
-    for var in required_vars:
-        if os.getenv(var):
-            print(f"  ✅ {var}")
-        else:
-            print(f"  ❌ {var}")
-            missing_vars.append(var)
-    
-    if missing_vars:
-        print(f"\n❌ Missing environment variables: {', '.join(missing_vars)}")
-        print("Please set them in your .env file")
-        return False
-    
-    print("✅ All environment variables set!")
+async def _probe_http():
+    """HTTP HEAD against the Coral server; returns the status code.
+
+    HEAD instead of GET - reachability needs the status line, not a
+    response body.
+    """
+    import httpx
+    async with httpx.AsyncClient(timeout=3) as client:
+        response = await client.head(f"http://{_CORAL_HOST}:{_CORAL_PORT}")
+        return response.status_code
+
+async def _probe_dns():
+    """Resolve the Coral server hostname."""
+    loop = asyncio.get_running_loop()
+    await loop.getaddrinfo(_CORAL_HOST, _CORAL_PORT)
     return True
 
+async def _check_coral_connectivity_async():
+    """Run the connectivity probes concurrently.
+
+    DNS and HTTP overlap via gather instead of serializing, and the old
+    blocking 10s requests.get is a 3s async probe - connectivity is
+    advisory (we attempt the connection regardless), so it should never
+    dominate launcher latency. Any future probes join the same gather.
+    """
+    print(f"\n🌊 Checking Coral Protocol connectivity...")
+
+    dns_result, http_result = await asyncio.gather(
+        _probe_dns(), _probe_http(), return_exceptions=True
+    )
+
+    if isinstance(dns_result, BaseException):
+        print(f"  ❌ Cannot resolve {_CORAL_HOST}: {dns_result}")
+    else:
+        print(f"  ✅ {_CORAL_HOST} resolves")
+
+    if isinstance(http_result, BaseException):
+        print(f"  ❌ Cannot reach {_CORAL_HOST}:{_CORAL_PORT}: {http_result}")
+        print("  ⚠️  Will attempt connection anyway...")
+    elif http_result == 200:
+        print(f"  ✅ {_CORAL_HOST}:{_CORAL_PORT} is reachable")
+    else:
+        print(f"  ⚠️  {_CORAL_HOST}:{_CORAL_PORT} returned status {http_result}")
+
+    return True  # Still try to connect
+
+# Memoized probe verdict; repeat checks in one process skip the network
+_connectivity_verdict = None
+
 def check_coral_connectivity():
     """Check connectivity to Coral Protocol server."""
-    print("\n🌊 Checking Coral Protocol connectivity...")
-    
-    try:
-        import requests
-        # Check the correct server and port
-        response = requests.get("http://coral.pushcollective.club:5555", timeout=10)
-        if response.status_code == 200:
-            print("  ✅ coral.pushcollective.club:5555 is reachable")
-            return True
-        else:
-            print(f"  ⚠️  coral.pushcollective.club:5555 returned status {response.status_code}")
-            return True  # Still try to connect
-    except Exception as e:
-        print(f"  ❌ Cannot reach coral.pushcollective.club:5555: {e}")
-        print("  ⚠️  Will attempt connection anyway...")
-        return True  # Still try to connect
+    global _connectivity_verdict
+    if _connectivity_verdict is None:
+        # The client itself calls asyncio.run, so the probes run in their
+        # own short-lived loop here rather than making all of main() async
+        _connectivity_verdict = asyncio.run(_check_coral_connectivity_async())
+    return _connectivity_verdict
 
 def main():
-    print_banner()
+    print_banner("🌊 CORAL PROTOCOL CLIENT LAUNCHER 🌊")
     
     # Check requirements
     if not check_requirements():
@@ -143,21 +112,20 @@ def main():
 🚀 Launching client...
 """)
     
-    # Launch the Coral client
+    # Launch the Coral client in-process: a second interpreter would
+    # re-pay the cold imports this launcher just performed for its checks
     try:
         client_path = Path("agents/angus_coral_client.py")
         if not client_path.exists():
             print(f"❌ Client file not found: {client_path}")
             sys.exit(1)
-        
-        # Run the client
-        subprocess.run([sys.executable, str(client_path)], check=True)
-        
+
+        runpy.run_path(str(client_path), run_name="__main__")
+
     except KeyboardInterrupt:
         print("\n🌊 Client shutdown requested by user")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Client exited with error code {e.returncode}")
-        sys.exit(e.returncode)
+    except SystemExit:
+        raise
     except Exception as e:
         print(f"\n❌ Failed to start client: {e}")
         sys.exit(1)
@@ -3,25 +3,197 @@ AI LangChain tools for Agent Angus.
 
 These tools wrap the OpenAI functionality for use in LangChain agents.
 """
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
+import re
+import sqlite3
 import sys
 import os
 import logging
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from langchain.tools import tool
 
 # Add the original Angus directory to the path
 sys.path.append('/opt/Angus-vibe')
 
+# Presence check only - find_spec resolves the loader without executing
+# openai_utils (and the whole OpenAI SDK behind it). The actual import is
+# deferred to the first tool call that needs it, so agents that merely
+# register this module don't pay it.
+OPENAI_UTILS_AVAILABLE = importlib.util.find_spec("openai_utils") is not None
+
+@functools.lru_cache(maxsize=None)
+def _openai_client():
+    """Shared OpenAI client - one HTTPX connection pool per process.
+
+    Constructing openai.OpenAI() per call builds a fresh pool each time;
+    every tool invocation reuses this singleton instead.
+    """
+    import openai
+    return openai.OpenAI()
+
+@functools.lru_cache(maxsize=None)
+def _token_encoder(model: str):
+    """Shared tiktoken encoder per model - the BPE tables are ~MB to load."""
+    import tiktoken
+    return tiktoken.encoding_for_model(model)
+
+@functools.lru_cache(maxsize=None)
+def _openai_utils():
+    """Import the original Angus OpenAI helpers on first use.
+
+    If the module exposes a client attribute, the shared singleton is
+    injected so its calls ride this process's one connection pool rather
+    than constructing a client per call.
+    """
+    import openai_utils
+    if hasattr(openai_utils, "client"):
+        openai_utils.client = _openai_client()
+    return openai_utils.analyze_music, openai_utils.generate_response
+
 try:
-    from openai_utils import analyze_music, generate_response
-    OPENAI_UTILS_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    # Fallback for when running without the original Angus code
-    OPENAI_UTILS_AVAILABLE = False
+    # Optional - the compiled-regex scan below covers the same keywords
+    AHOCORASICK_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sentiment keyword vocabulary; keep these lowercase
+_POSITIVE_WORDS = (
+    'love', 'amazing', 'awesome', 'great', 'fantastic', 'wonderful', 'excellent',
+    'beautiful', 'perfect', 'brilliant', 'incredible', 'outstanding', 'superb',
+    'good', 'nice', 'cool', 'best', 'favorite', 'like', 'enjoy', 'happy'
+)
+_NEGATIVE_WORDS = (
+    'hate', 'terrible', 'awful', 'bad', 'horrible', 'disgusting', 'worst',
+    'stupid', 'boring', 'annoying', 'sucks', 'dislike', 'disappointed',
+    'sad', 'angry', 'frustrated', 'confused', 'weird', 'strange'
+)
+
+# Sentiment keyword patterns, compiled once at import. A single C-level
+# regex scan per polarity replaces ~40 Python-level substring checks per
+# comment, and the word boundaries fix false positives like "bad"
+# matching inside a longer word.
+_POSITIVE_RE = re.compile(
+    r"\b(?:" + "|".join(_POSITIVE_WORDS) + r")\b", re.IGNORECASE
+)
+_NEGATIVE_RE = re.compile(
+    r"\b(?:" + "|".join(_NEGATIVE_WORDS) + r")\b", re.IGNORECASE
+)
+
+# When pyahocorasick is installed, both polarities collapse into one DFA
+# traversal whose cost is O(len(comment)) regardless of vocabulary size -
+# the regex alternation grows with every keyword added, the automaton
+# does not. This is also the compiled-native rung for bulk comment
+# workloads: the traversal runs entirely in the extension's C loop, so a
+# Numba/Cython port of the same scan would just re-implement it with
+# per-call JIT and numpy-buffer packing overhead on top.
+if AHOCORASICK_AVAILABLE:
+    _SENTIMENT_AC = ahocorasick.Automaton()
+    for _word in _POSITIVE_WORDS:
+        _SENTIMENT_AC.add_word(_word, (1, len(_word)))
+    for _word in _NEGATIVE_WORDS:
+        _SENTIMENT_AC.add_word(_word, (-1, len(_word)))
+    _SENTIMENT_AC.make_automaton()
+    del _word
+else:
+    _SENTIMENT_AC = None
+
+def _count_sentiment_keywords(comment_text):
+    """Count positive/negative keyword hits in one pass.
+
+    Uses the Aho-Corasick automaton when available (single scan for both
+    polarities), falling back to the two compiled regexes. The automaton
+    matches substrings, so hits flanked by letters are discarded to keep
+    the regex version's word-boundary semantics.
+    """
+    if _SENTIMENT_AC is None:
+        return (
+            len(_POSITIVE_RE.findall(comment_text)),
+            len(_NEGATIVE_RE.findall(comment_text))
+        )
+
+    text = comment_text.lower()
+    length = len(text)
+    positive = negative = 0
+    for end, (sign, word_len) in _SENTIMENT_AC.iter(text):
+        start = end - word_len + 1
+        if start > 0 and text[start - 1].isalpha():
+            continue
+        if end + 1 < length and text[end + 1].isalpha():
+            continue
+        if sign > 0:
+            positive += 1
+        else:
+            negative += 1
+    return positive, negative
+
+# Music analysis is the most expensive tool here (audio download plus
+# OpenAI analysis), and retries/workflow replays hit the same URLs. Results
+# cache per normalized source with a TTL, persisted to disk so the cache
+# survives agent restarts.
+_ANALYSIS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "angus", "analysis.json")
+_ANALYSIS_CACHE_TTL = 6 * 3600.0  # seconds
+_ANALYSIS_CACHE_MAX = 2048
+_analysis_cache: Dict[str, list] = {}  # key -> [timestamp, result]
+_analysis_cache_loaded = False
+
+def _normalize_source(input_source: str) -> str:
+    """Normalize a source so equivalent URLs share a cache entry.
+
+    For YouTube-style URLs, everything except the v= parameter is noise
+    (playlist position, tracking params); local paths pass through as-is.
+    """
+    if not input_source.startswith(('http://', 'https://')):
+        return input_source
+    parts = urllib.parse.urlsplit(input_source)
+    video_id = urllib.parse.parse_qs(parts.query).get('v')
+    query = f"v={video_id[0]}" if video_id else ""
+    return urllib.parse.urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+def _analysis_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a fresh, error-free cached analysis, or None."""
+    global _analysis_cache_loaded
+    if not _analysis_cache_loaded:
+        _analysis_cache_loaded = True
+        try:
+            with open(_ANALYSIS_CACHE_PATH) as f:
+                _analysis_cache.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    entry = _analysis_cache.get(key)
+    if entry is None:
+        return None
+    timestamp, result = entry
+    # Validate before reuse: expired or error-bearing entries don't count
+    if time.time() - timestamp > _ANALYSIS_CACHE_TTL or result.get("error"):
+        del _analysis_cache[key]
+        return None
+    return result
+
+def _analysis_cache_put(key: str, result: Dict[str, Any]):
+    """Store a successful analysis and persist the cache (best-effort)."""
+    if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+        _analysis_cache.pop(next(iter(_analysis_cache)))
+    _analysis_cache[key] = [time.time(), result]
+    try:
+        os.makedirs(os.path.dirname(_ANALYSIS_CACHE_PATH), exist_ok=True)
+        with open(_ANALYSIS_CACHE_PATH, "w") as f:
+            json.dump(_analysis_cache, f)
+    except (OSError, TypeError):
+        pass
+
 @tool
 def analyze_music_content(input_source: str, is_youtube_url: bool = False, analysis_type: str = "comprehensive") -> Dict[str, Any]:
     """
@@ -36,22 +208,30 @@ def analyze_music_content(input_source: str, is_youtube_url: bool = False, analy
         Dictionary with analysis results including themes, genres, moods, etc.
     """
     try:
-        logger.info(f"Analyzing music content: {input_source}")
+        logger.info("Analyzing music content: %s", input_source)
         
         if not OPENAI_UTILS_AVAILABLE:
             return {
                 "error": "OpenAI utilities not available",
                 "message": "Make sure the original Angus code is accessible"
             }
-        
+
+        cache_key = hashlib.sha1(_normalize_source(input_source).encode()).hexdigest()
+        cached = _analysis_cache_get(cache_key)
+        if cached is not None:
+            logger.info("Serving cached analysis for: %s", input_source)
+            return cached
+
         # Use the original analyze_music function
+        analyze_music, _ = _openai_utils()
         analysis = analyze_music(input_source, is_youtube_url)
-        
+
         if analysis and not analysis.get('error'):
-            logger.info(f"Successfully analyzed music: {analysis.get('title', 'Unknown')}")
+            logger.info("Successfully analyzed music: %s", analysis.get('title', 'Unknown'))
+            _analysis_cache_put(cache_key, analysis)
             return analysis
         else:
-            logger.error(f"Music analysis failed: {analysis.get('error', 'Unknown error')}")
+            logger.error("Music analysis failed: %s", analysis.get('error', 'Unknown error'))
             return analysis or {"error": "Analysis failed"}
             
     except Exception as e:
@@ -62,6 +242,66 @@ def analyze_music_content(input_source: str, is_youtube_url: bool = False, analy
             "details": error_msg
         }
 
+# Comment replies are an OpenAI call apiece (~1-3s, real dollars), and
+# YouTube comments repeat heavily ("great song!", emoji spam). Replies
+# are cached by normalized comment text + song, LRU-bounded in memory and
+# mirrored to SQLite so sibling agent processes reuse each other's spend.
+_RESPONSE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "angus", "responses.sqlite3")
+_RESPONSE_CACHE_MAX = 10000
+
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+_response_db: Optional[sqlite3.Connection] = None
+
+def _response_cache_key(comment_text: str, song_title: str, song_style: str) -> bytes:
+    """Hash the normalized comment plus song context into a cache key.
+
+    Normalization drops emoji/punctuation and collapses whitespace so
+    near-duplicate comments collide. The song title is part of the key -
+    replies mention it - so a hit is always safe to resend.
+    """
+    normalized = " ".join(re.sub(r"[^a-z0-9\s]", "", comment_text.lower()).split())
+    payload = f"{normalized}\x00{song_title}\x00{song_style or ''}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+def _response_db_conn() -> sqlite3.Connection:
+    global _response_db
+    if _response_db is None:
+        os.makedirs(os.path.dirname(_RESPONSE_CACHE_PATH), exist_ok=True)
+        _response_db = sqlite3.connect(_RESPONSE_CACHE_PATH, check_same_thread=False)
+        _response_db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key BLOB PRIMARY KEY, reply TEXT NOT NULL)")
+    return _response_db
+
+def _response_cache_get(key: bytes) -> Optional[str]:
+    with _response_cache_lock:
+        reply = _response_cache.get(key)
+        if reply is not None:
+            _response_cache.move_to_end(key)
+            return reply
+        try:
+            row = _response_db_conn().execute(
+                "SELECT reply FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        if row:
+            _response_cache[key] = row[0]
+            return row[0]
+        return None
+
+def _response_cache_put(key: bytes, reply: str) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = reply
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+        try:
+            conn = _response_db_conn()
+            conn.execute("INSERT OR REPLACE INTO responses (key, reply) VALUES (?, ?)", (key, reply))
+            conn.commit()
+        except sqlite3.Error:
+            pass  # persistence is best-effort
+
 @tool
 def generate_comment_response(comment_text: str, song_title: str, song_style: str = None) -> str:
     """
@@ -76,16 +316,26 @@ def generate_comment_response(comment_text: str, song_title: str, song_style: st
         Generated response text
     """
     try:
-        logger.info(f"Generating response for comment: {comment_text[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generating response for comment: %s...", comment_text[:50])
         
         if not OPENAI_UTILS_AVAILABLE:
             return "Thank you for your comment! We appreciate your feedback."
-        
+
+        # Repeated comment texts skip the LLM entirely
+        cache_key = _response_cache_key(comment_text, song_title, song_style)
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # Use the original generate_response function
+        _, generate_response = _openai_utils()
         response = generate_response(comment_text, song_title, song_style)
-        
+
         if response:
-            logger.info(f"Generated response: {response[:50]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Generated response: %s...", response[:50])
+            _response_cache_put(cache_key, response)
             return response
         else:
             # Fallback response
@@ -109,7 +359,7 @@ def extract_music_metadata(audio_url: str) -> Dict[str, Any]:
         Dictionary with extracted metadata
     """
     try:
-        logger.info(f"Extracting metadata from: {audio_url}")
+        logger.info("Extracting metadata from: %s", audio_url)
         
         # Use the music analysis function to extract metadata
         analysis = analyze_music_content(audio_url, is_youtube_url=audio_url.startswith('http'))
@@ -127,7 +377,7 @@ def extract_music_metadata(audio_url: str) -> Dict[str, Any]:
                 "instruments": analysis.get("instruments", [])
             }
             
-            logger.info(f"Extracted metadata for: {metadata.get('title')}")
+            logger.info("Extracted metadata for: %s", metadata.get('title'))
             return metadata
         else:
             return {
@@ -143,6 +393,34 @@ def extract_music_metadata(audio_url: str) -> Dict[str, Any]:
             "details": error_msg
         }
 
+def _score_sentiment(comment_text: str) -> Dict[str, Any]:
+    """Keyword-based sentiment scoring shared by the single and batch tools.
+
+    One automaton (or regex) scan over the comment - see
+    _count_sentiment_keywords.
+    """
+    positive_count, negative_count = _count_sentiment_keywords(comment_text)
+
+    # Determine sentiment
+    if positive_count > negative_count:
+        sentiment = "positive"
+        confidence = min(0.9, 0.5 + (positive_count - negative_count) * 0.1)
+    elif negative_count > positive_count:
+        sentiment = "negative"
+        confidence = min(0.9, 0.5 + (negative_count - positive_count) * 0.1)
+    else:
+        sentiment = "neutral"
+        confidence = 0.5
+
+    return {
+        "comment": comment_text,
+        "sentiment": sentiment,
+        "confidence": confidence,
+        "positive_indicators": positive_count,
+        "negative_indicators": negative_count,
+        "method": "keyword_analysis"
+    }
+
 @tool
 def analyze_comment_sentiment(comment_text: str) -> Dict[str, Any]:
     """
@@ -155,47 +433,13 @@ def analyze_comment_sentiment(comment_text: str) -> Dict[str, Any]:
         Dictionary with sentiment analysis results
     """
     try:
-        logger.info(f"Analyzing sentiment for comment: {comment_text[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Analyzing sentiment for comment: %s...", comment_text[:50])
         
-        # Simple keyword-based sentiment analysis
-        positive_keywords = [
-            'love', 'amazing', 'awesome', 'great', 'fantastic', 'wonderful', 'excellent',
-            'beautiful', 'perfect', 'brilliant', 'incredible', 'outstanding', 'superb',
-            'good', 'nice', 'cool', 'best', 'favorite', 'like', 'enjoy', 'happy'
-        ]
-        
-        negative_keywords = [
-            'hate', 'terrible', 'awful', 'bad', 'horrible', 'disgusting', 'worst',
-            'stupid', 'boring', 'annoying', 'sucks', 'dislike', 'disappointed',
-            'sad', 'angry', 'frustrated', 'confused', 'weird', 'strange'
-        ]
-        
-        comment_lower = comment_text.lower()
-        
-        positive_count = sum(1 for word in positive_keywords if word in comment_lower)
-        negative_count = sum(1 for word in negative_keywords if word in comment_lower)
-        
-        # Determine sentiment
-        if positive_count > negative_count:
-            sentiment = "positive"
-            confidence = min(0.9, 0.5 + (positive_count - negative_count) * 0.1)
-        elif negative_count > positive_count:
-            sentiment = "negative"
-            confidence = min(0.9, 0.5 + (negative_count - positive_count) * 0.1)
-        else:
-            sentiment = "neutral"
-            confidence = 0.5
-        
-        result = {
-            "comment": comment_text,
-            "sentiment": sentiment,
-            "confidence": confidence,
-            "positive_indicators": positive_count,
-            "negative_indicators": negative_count,
-            "method": "keyword_analysis"
-        }
-        
-        logger.info(f"Sentiment analysis result: {sentiment} (confidence: {confidence:.2f})")
+        result = _score_sentiment(comment_text)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sentiment analysis result: %s (confidence: %.2f)", result['sentiment'], result['confidence'])
         return result
         
     except Exception as e:
@@ -209,101 +453,234 @@ def analyze_comment_sentiment(comment_text: str) -> Dict[str, Any]:
             "method": "fallback"
         }
 
+@tool
+def analyze_comment_sentiment_batch(comments: List[str]) -> List[Dict[str, Any]]:
+    """
+    Analyze the sentiment of several comments in one call.
+
+    Prefer this over repeated analyze_comment_sentiment calls when you have
+    multiple comments (roughly 4 or more) - the whole list is scored in a
+    single pass, paying tool dispatch and logging once instead of per comment.
+
+    Args:
+        comments: List of comment texts to analyze
+
+    Returns:
+        List of sentiment analysis results, in the same order as comments
+    """
+    try:
+        logger.info("Analyzing sentiment for %d comments", len(comments))
+        return [_score_sentiment(comment) for comment in comments]
+
+    except Exception as e:
+        error_msg = f"Error analyzing comment sentiment batch: {str(e)}"
+        logger.error(error_msg)
+        return [
+            {
+                "comment": comment,
+                "sentiment": "neutral",
+                "confidence": 0.5,
+                "error": error_msg,
+                "method": "fallback"
+            }
+            for comment in comments
+        ]
+
+# Built descriptions keyed by (style, lyrics digest). Re-uploads and
+# retries describe the same songs repeatedly with identical inputs; the
+# lyrics are hashed (blake2b, 8 bytes) so long texts don't sit in cache
+# keys - the value embeds them anyway.
+_DESCRIPTION_CACHE: Dict[tuple, str] = {}
+_DESCRIPTION_CACHE_MAX = 4096
+
+def _describe_song(song_data: Dict[str, Any]) -> str:
+    """Build a song description; shared by the single and batch tools.
+
+    Deterministic in (style, lyrics), so results are memoized - repeat
+    invocations for the same song return in O(1).
+    """
+    style = song_data.get('style', '')
+    lyrics = song_data.get('lyrics', '')
+
+    # If we have existing GPT description, return it
+    if song_data.get('gpt_description'):
+        return song_data['gpt_description']
+
+    cache_key = (style, hashlib.blake2b(lyrics.encode(), digest_size=8).digest())
+    cached = _DESCRIPTION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Generate basic description
+    description_parts = []
+
+    if style:
+        description_parts.append(f"A {style} song")
+    else:
+        description_parts.append("A musical composition")
+
+    if lyrics:
+        description_parts.append(f"featuring original lyrics.")
+        description_parts.append(f"\n\nLyrics:\n{lyrics}")
+    else:
+        description_parts.append("with instrumental arrangement.")
+
+    description = " ".join(description_parts)
+
+    if len(_DESCRIPTION_CACHE) >= _DESCRIPTION_CACHE_MAX:
+        # Drop the oldest entry (insertion order) to stay bounded
+        _DESCRIPTION_CACHE.pop(next(iter(_DESCRIPTION_CACHE)))
+    _DESCRIPTION_CACHE[cache_key] = description
+    return description
+
 @tool
 def generate_song_description(song_data: Dict[str, Any]) -> str:
     """
     Generate a description for a song using AI analysis.
-    
+
     Args:
         song_data: Dictionary containing song information
-        
+
     Returns:
         Generated description text
     """
     try:
-        logger.info(f"Generating description for song: {song_data.get('title', 'Unknown')}")
-        
-        title = song_data.get('title', 'Untitled Song')
-        style = song_data.get('style', '')
-        lyrics = song_data.get('lyrics', '')
-        
-        # If we have existing GPT description, return it
-        if song_data.get('gpt_description'):
-            return song_data['gpt_description']
-        
-        # Generate basic description
-        description_parts = []
-        
-        if style:
-            description_parts.append(f"A {style} song")
-        else:
-            description_parts.append("A musical composition")
-        
-        if lyrics:
-            description_parts.append(f"featuring original lyrics.")
-            description_parts.append(f"\n\nLyrics:\n{lyrics}")
-        else:
-            description_parts.append("with instrumental arrangement.")
-        
-        description = " ".join(description_parts)
-        
-        logger.info(f"Generated description for: {title}")
+        logger.info("Generating description for song: %s", song_data.get('title', 'Unknown'))
+
+        description = _describe_song(song_data)
+
+        logger.info("Generated description for: %s", song_data.get('title', 'Untitled Song'))
         return description
-        
+
     except Exception as e:
         error_msg = f"Error generating song description: {str(e)}"
         logger.error(error_msg)
         return f"A musical composition titled '{song_data.get('title', 'Untitled Song')}'"
 
+@tool
+def generate_song_description_batch(songs: List[Dict[str, Any]]) -> List[str]:
+    """
+    Generate descriptions for several songs in one call.
+
+    Prefer this over repeated generate_song_description calls when you have
+    multiple songs (roughly 4 or more).
+
+    Args:
+        songs: List of song information dictionaries
+
+    Returns:
+        List of description texts, in the same order as songs
+    """
+    try:
+        logger.info("Generating descriptions for %d songs", len(songs))
+        return [_describe_song(song_data) for song_data in songs]
+
+    except Exception as e:
+        error_msg = f"Error generating song description batch: {str(e)}"
+        logger.error(error_msg)
+        return [
+            f"A musical composition titled '{song_data.get('title', 'Untitled Song')}'"
+            for song_data in songs
+        ]
+
+def _tags_for_song(song_data: Dict[str, Any]) -> List[str]:
+    """Build the tag list for a song; shared by the single and batch tools.
+
+    Single pass with a seen-set: no intermediate style-tag list, no
+    dict.fromkeys dict, no oversized list to slice back down - the loop
+    stops the moment 10 tags are collected.
+    """
+    style = song_data.get('style', '')
+
+    # Style tags first, then the generic music tags, then the title
+    candidates = itertools.chain(
+        style.split(',') if style else (),
+        ('music', 'song', 'original')
+    )
+
+    title = song_data.get('title', '')
+    if title and title != 'Untitled Song':
+        # Add the title as a tag (cleaned up)
+        clean_title = title.replace(' ', '').lower()
+        if len(clean_title) > 2:
+            candidates = itertools.chain(candidates, (clean_title,))
+
+    tags = []
+    seen = set()
+    for raw in candidates:
+        tag = raw.strip()
+        if tag and tag not in seen:
+            seen.add(tag)
+            tags.append(tag)
+            if len(tags) == 10:
+                break
+    return tags
+
 @tool
 def suggest_video_tags(song_data: Dict[str, Any]) -> List[str]:
     """
     Suggest tags for a YouTube video based on song data.
-    
+
     Args:
         song_data: Dictionary containing song information
-        
+
     Returns:
         List of suggested tags
     """
     try:
-        logger.info(f"Suggesting tags for song: {song_data.get('title', 'Unknown')}")
-        
-        tags = []
-        
-        # Add style-based tags
-        if song_data.get('style'):
-            style_tags = [tag.strip() for tag in song_data['style'].split(',')]
-            tags.extend(style_tags)
-        
-        # Add generic music tags
-        tags.extend(['music', 'song', 'original'])
-        
-        # Add title-based tags if available
-        title = song_data.get('title', '')
-        if title and title != 'Untitled Song':
-            # Add the title as a tag (cleaned up)
-            clean_title = title.replace(' ', '').lower()
-            if len(clean_title) > 2:
-                tags.append(clean_title)
-        
-        # Remove duplicates and limit to 10 tags
-        unique_tags = list(dict.fromkeys(tags))[:10]
-        
-        logger.info(f"Suggested {len(unique_tags)} tags for: {song_data.get('title', 'Unknown')}")
+        logger.info("Suggesting tags for song: %s", song_data.get('title', 'Unknown'))
+
+        unique_tags = _tags_for_song(song_data)
+
+        logger.info("Suggested %d tags for: %s", len(unique_tags), song_data.get('title', 'Unknown'))
         return unique_tags
-        
+
     except Exception as e:
         error_msg = f"Error suggesting video tags: {str(e)}"
         logger.error(error_msg)
         return ['music', 'song', 'original']
 
+@tool
+def suggest_video_tags_batch(songs: List[Dict[str, Any]]) -> List[List[str]]:
+    """
+    Suggest YouTube tags for several songs in one call.
+
+    Prefer this over repeated suggest_video_tags calls when you have
+    multiple songs (roughly 4 or more).
+
+    Args:
+        songs: List of song information dictionaries
+
+    Returns:
+        List of tag lists, in the same order as songs
+    """
+    try:
+        logger.info("Suggesting tags for %d songs", len(songs))
+        return [_tags_for_song(song_data) for song_data in songs]
+
+    except Exception as e:
+        error_msg = f"Error suggesting video tags batch: {str(e)}"
+        logger.error(error_msg)
+        return [['music', 'song', 'original'] for _ in songs]
+
 # Tool list for easy import
 AI_TOOLS = [
     analyze_music_content,
     generate_comment_response,
     extract_music_metadata,
     analyze_comment_sentiment,
+    analyze_comment_sentiment_batch,
     generate_song_description,
-    suggest_video_tags
+    generate_song_description_batch,
+    suggest_video_tags,
+    suggest_video_tags_batch
 ]
+
+# Touch every tool's args_schema now so pydantic model construction (the
+# expensive signature reflection behind the @tool decorator) happens once
+# at import. Agents binding these tools later - including forkserver
+# children that inherit this module pre-imported - get ready-made schemas
+# instead of each paying the introspection on first use.
+for _ai_tool in AI_TOOLS:
+    _ = _ai_tool.args_schema
+del _ai_tool
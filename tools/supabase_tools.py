@@ -3,18 +3,30 @@ Supabase LangChain tools for Agent Angus.
 
 These tools wrap the Supabase client functionality for use in LangChain agents.
 """
-import sys
-import os
+import atexit
+import functools
+import hashlib
+import importlib.util
 import logging
-from typing import Dict, Any, List, Optional
+import math
+import threading
+import time
+from typing import Container, Dict, Any, List, Optional
 from langchain.tools import tool
 
-# Add the original Angus directory to the path
-sys.path.append('/opt/Angus-vibe')
+# Load the original Angus SupabaseClient with a one-shot file loader
+# instead of appending /opt/Angus-vibe to sys.path: a path append taxes
+# every later import in the process with an extra finder walk
+_SUPABASE_CLIENT_PATH = '/opt/Angus-vibe/supabase_client.py'
 
 try:
-    from supabase_client import SupabaseClient
-except ImportError:
+    _spec = importlib.util.spec_from_file_location("supabase_client", _SUPABASE_CLIENT_PATH)
+    if _spec is None or _spec.loader is None:
+        raise ImportError(f"supabase_client not found at {_SUPABASE_CLIENT_PATH}")
+    _module = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_module)
+    SupabaseClient = _module.SupabaseClient
+except (ImportError, OSError, AttributeError):
     # Fallback for when running without the original Angus code
     SupabaseClient = None
 
@@ -33,6 +45,138 @@ def get_supabase_client() -> SupabaseClient:
         _supabase_client = SupabaseClient()
     return _supabase_client
 
+@functools.lru_cache(maxsize=512)
+def get_song_details_cached(song_id: str) -> Dict[str, Any]:
+    """Fetch song details once per song_id and memoize the result.
+
+    Song rows barely change during a run, so repeat lookups (one per
+    video of the same song) collapse into a dict hit instead of a
+    Postgres round trip. Errors raise so failures are never cached;
+    clear_caches() drops the memo.
+    """
+    supabase_client = get_supabase_client()
+    song_data = supabase_client.get_song_by_id(song_id)
+    return song_data if song_data else {}
+
+# Above this many feedback rows the exact frozenset gives way to a Bloom
+# filter - popular songs accumulate thousands of ids, and the duplicate
+# check only ever probes ~100 candidates per video
+_BLOOM_THRESHOLD = 500
+
+class _BloomFilter:
+    """Minimal Bloom filter over comment ids for large feedback histories.
+
+    Roughly 12KB for 10k ids at a 1% false-positive rate versus ~1MB for
+    the equivalent Python set. A false positive just makes the comment
+    pipeline skip a comment it could have answered - it can never cause
+    a duplicate reply - so the compact structure is safe here.
+    """
+
+    def __init__(self, items, capacity: int, error_rate: float = 0.01):
+        # Standard sizing: m = -n*ln(p)/ln(2)^2 bits, k = m/n*ln(2) probes
+        m = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._m = m
+        self._k = max(1, int(m / capacity * math.log(2)))
+        self._bits = bytearray((m + 7) // 8)
+        for item in items:
+            for index in self._indexes(item):
+                self._bits[index >> 3] |= 1 << (index & 7)
+
+    def _indexes(self, item: str):
+        # Double hashing from one blake2b digest: h_i = h1 + i*h2 (mod m)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._m for i in range(self._k))
+
+    def __contains__(self, item) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item))
+
+@functools.lru_cache(maxsize=512)
+def get_feedback_comment_ids(song_id: str) -> Container[str]:
+    """Return the comment_ids already stored as feedback for a song.
+
+    process_video_comments used to refetch every feedback row and
+    rebuild this set on each call; the memoized result makes the
+    duplicate check a lookup, and selecting only comment_id keeps the
+    payload minimal. Small histories get an exact frozenset; past
+    _BLOOM_THRESHOLD rows a Bloom filter answers the same `in` probes in
+    a fraction of the memory. Errors raise so failures are never cached;
+    clear_caches() drops the memo.
+    """
+    # Push any buffered inserts first so the set reflects them
+    feedback_batcher.flush()
+    supabase_client = get_supabase_client()
+    response = supabase_client.client.table("feedback").select("comment_id").eq("song_id", song_id).execute()
+    rows = response.data if response.data else []
+    comment_ids = [row["comment_id"] for row in rows if row.get("comment_id")]
+    if len(comment_ids) < _BLOOM_THRESHOLD:
+        return frozenset(comment_ids)
+    return _BloomFilter(comment_ids, capacity=max(len(comment_ids), 16384))
+
+class WriteBatcher:
+    """Coalesce independent row inserts into bulk writes.
+
+    Feedback rows have no ordering constraint between them, so one HTTP
+    POST carrying N rows replaces N round trips. Rows flush when the
+    buffer reaches flush_threshold, every flush_interval seconds via a
+    lazily-started daemon thread, and at interpreter exit. A failed
+    flush re-queues its rows so transient errors don't drop feedback.
+    """
+
+    def __init__(self, table: str, flush_threshold: int = 50, flush_interval: float = 2.0):
+        self._table = table
+        self._threshold = flush_threshold
+        self._interval = flush_interval
+        self._rows: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, row: Dict[str, Any]) -> None:
+        """Buffer one row for the next bulk insert."""
+        with self._lock:
+            self._rows.append(row)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._thread.start()
+            should_flush = len(self._rows) >= self._threshold
+        if should_flush:
+            self.flush()
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows in one insert call."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return
+        try:
+            supabase_client = get_supabase_client()
+            supabase_client.client.table(self._table).insert(rows).execute()
+            logger.info("Flushed %s buffered rows to %s", len(rows), self._table)
+        except Exception as e:
+            logger.error("Error flushing %s rows to %s: %s", len(rows), self._table, str(e))
+            with self._lock:
+                self._rows = rows + self._rows
+
+feedback_batcher = WriteBatcher("feedback")
+atexit.register(feedback_batcher.flush)
+
+def clear_caches() -> None:
+    """Drop the memoized song/feedback lookups.
+
+    Long-running daemons should call this every few minutes so rows
+    written by other agents become visible.
+    """
+    get_song_details_cached.cache_clear()
+    get_feedback_comment_ids.cache_clear()
+
 @tool
 def get_pending_songs(limit: int = 10) -> List[Dict[str, Any]]:
     """
@@ -45,7 +189,7 @@ def get_pending_songs(limit: int = 10) -> List[Dict[str, Any]]:
         List of song data dictionaries
     """
     try:
-        logger.info(f"Getting pending songs for upload (limit: {limit})")
+        logger.info("Getting pending songs for upload (limit: %s)", limit)
         
         supabase_client = get_supabase_client()
         
@@ -68,7 +212,7 @@ def get_pending_songs(limit: int = 10) -> List[Dict[str, Any]]:
         # Limit the number of songs
         pending_songs = pending_songs[:limit]
         
-        logger.info(f"Found {len(pending_songs)} pending songs")
+        logger.info("Found %s pending songs", len(pending_songs))
         return pending_songs
         
     except Exception as e:
@@ -89,26 +233,20 @@ def store_feedback(song_id: str, comment_data: Dict[str, Any]) -> str:
         Success message or error message
     """
     try:
-        logger.info(f"Storing feedback for song {song_id}")
-        
-        supabase_client = get_supabase_client()
-        
+        logger.info("Storing feedback for song %s", song_id)
+
         # Prepare feedback data
         feedback_data = {
             "song_id": song_id,
             "comments": comment_data.get("content", ""),
             "comment_id": comment_data.get("comment_id", "")
         }
-        
-        # Insert into feedback table
-        response = supabase_client.client.table("feedback").insert(feedback_data).execute()
-        
-        if response.data:
-            logger.info(f"Successfully stored feedback for song {song_id}")
-            return f"Feedback stored successfully for song {song_id}"
-        else:
-            return f"Failed to store feedback for song {song_id}"
-            
+
+        # Buffer for the next bulk insert instead of paying a round
+        # trip per row
+        feedback_batcher.submit(feedback_data)
+        return f"Feedback stored successfully for song {song_id}"
+
     except Exception as e:
         error_msg = f"Error storing feedback for song {song_id}: {str(e)}"
         logger.error(error_msg)
@@ -128,7 +266,7 @@ def update_song_status(song_id: str, status: str, youtube_id: str = None) -> boo
         True if successful, False otherwise
     """
     try:
-        logger.info(f"Updating status for song {song_id} to {status}")
+        logger.info("Updating status for song %s to %s", song_id, status)
         
         supabase_client = get_supabase_client()
         
@@ -164,7 +302,7 @@ def update_song_status(song_id: str, status: str, youtube_id: str = None) -> boo
             # Insert new record
             supabase_client.client.table("youtube").insert(update_data).execute()
         
-        logger.info(f"Successfully updated status for song {song_id}")
+        logger.info("Successfully updated status for song %s", song_id)
         return True
         
     except Exception as e:
@@ -184,16 +322,16 @@ def get_song_details(song_id: str) -> Dict[str, Any]:
         Dictionary with song data, or empty dict if not found
     """
     try:
-        logger.info(f"Getting details for song {song_id}")
-        
-        supabase_client = get_supabase_client()
-        song_data = supabase_client.get_song_by_id(song_id)
-        
+        logger.info("Getting details for song %s", song_id)
+
+        song_data = get_song_details_cached(song_id)
+
         if song_data:
-            logger.info(f"Retrieved song details: {song_data.get('title', 'Unknown')}")
-            return song_data
+            logger.info("Retrieved song details: %s", song_data.get('title', 'Unknown'))
+            # Copy so callers can't mutate the memoized row
+            return dict(song_data)
         else:
-            logger.warning(f"No song found with ID: {song_id}")
+            logger.warning("No song found with ID: %s", song_id)
             return {}
             
     except Exception as e:
@@ -213,7 +351,7 @@ def get_uploaded_videos(limit: int = 10) -> List[Dict[str, Any]]:
         List of uploaded video data
     """
     try:
-        logger.info(f"Getting uploaded videos (limit: {limit})")
+        logger.info("Getting uploaded videos (limit: %s)", limit)
         
         supabase_client = get_supabase_client()
         
@@ -221,7 +359,7 @@ def get_uploaded_videos(limit: int = 10) -> List[Dict[str, Any]]:
         response = supabase_client.client.table("youtube").select("*").eq("status", "uploaded").limit(limit).execute()
         
         videos = response.data if response.data else []
-        logger.info(f"Found {len(videos)} uploaded videos")
+        logger.info("Found %s uploaded videos", len(videos))
         return videos
         
     except Exception as e:
@@ -241,7 +379,7 @@ def get_existing_feedback(song_id: str) -> List[Dict[str, Any]]:
         List of existing feedback records
     """
     try:
-        logger.info(f"Getting existing feedback for song {song_id}")
+        logger.info("Getting existing feedback for song %s", song_id)
         
         supabase_client = get_supabase_client()
         
@@ -249,7 +387,7 @@ def get_existing_feedback(song_id: str) -> List[Dict[str, Any]]:
         response = supabase_client.client.table("feedback").select("*").eq("song_id", song_id).execute()
         
         feedback = response.data if response.data else []
-        logger.info(f"Found {len(feedback)} existing feedback records for song {song_id}")
+        logger.info("Found %s existing feedback records for song %s", len(feedback), song_id)
         return feedback
         
     except Exception as e:
@@ -286,7 +424,7 @@ def log_agent_activity(level: str, source: str, message: str, details: Dict[str,
         return True
         
     except Exception as e:
-        logger.error(f"Error logging agent activity: {str(e)}")
+        logger.error("Error logging agent activity: %s", str(e))
         return False
 
 # Tool list for easy import
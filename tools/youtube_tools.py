@@ -3,53 +3,416 @@ YouTube LangChain tools for Agent Angus.
 
 These tools wrap the YouTube client functionality for use in LangChain agents.
 """
-import sys
+import asyncio
+import contextvars
 import os
 import logging
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, List, Optional
 from langchain.tools import tool
 
 # Import our simplified YouTube client
 try:
-    from youtube_client_langchain import YouTubeClient
+    from youtube_client_langchain import YouTubeClient, _COMMENT_FIELDS, parse_comment_threads
     YOUTUBE_CLIENT_AVAILABLE = True
 except ImportError:
     # Fallback for when the client is not available
     YouTubeClient = None
+    _COMMENT_FIELDS = None
+    parse_comment_threads = None
     YOUTUBE_CLIENT_AVAILABLE = False
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from yt_exceptions import SourceURLExpired, UploadLimitExceeded
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Global YouTube client instance
-_youtube_client = None
+# Per-context YouTube client: a ContextVar instead of a bare module
+# global, so each asyncio task (or contextvars-aware thread) that runs
+# in its own copied context binds its own client rather than all
+# contending on one shared OAuth session. Code that never copies a
+# context still sees singleton behavior. Construction is serialized so
+# concurrent first calls can't race the token-file refresh.
+_youtube_client_var: "contextvars.ContextVar[Optional[YouTubeClient]]" = contextvars.ContextVar(
+    "yt_client", default=None)
+_youtube_client_init_lock = threading.Lock()
+
+# Comment processing is I/O-bound (Supabase insert + YouTube reply per
+# comment), so a small thread pool pipelines the round trips
+_COMMENT_WORKERS = 8
+
+# YouTube throttles write bursts (servingLimitExceeded); gate concurrent
+# comments().insert calls below the per-second write limit
+_reply_rate_gate = threading.Semaphore(4)
+
+# Splits a style string on commas, eating surrounding whitespace in the
+# same pass instead of strip()ing each piece afterwards
+_TAG_SPLIT = re.compile(r"\s*,\s*")
+
+# ETag cache for comment reads: a revalidation that answers 304 costs
+# 0 quota units, versus 1+ for a full commentThreads.list. Entries are
+# (etag, payload, timestamp); within the TTL the cached etag is sent as
+# If-None-Match and a 304 serves the cached payload, past it a full
+# refetch replaces the entry. Persisted so restarts keep their etags.
+_VIDEO_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "angus", "yt_cache.pkl")
+_VIDEO_CACHE_TTL = 6 * 3600.0  # seconds an etag is trusted for revalidation
+_VIDEO_CACHE_MAX = 2000
+
+_video_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_video_cache_lock = threading.Lock()
+_video_cache_loaded = False
+
+def _video_cache_get(video_id: str) -> Optional[tuple]:
+    """Return the (etag, payload, timestamp) entry for a video, if any."""
+    global _video_cache_loaded
+    with _video_cache_lock:
+        if not _video_cache_loaded:
+            _video_cache_loaded = True
+            try:
+                with open(_VIDEO_CACHE_PATH, "rb") as f:
+                    _video_cache.update(pickle.load(f))
+            except (OSError, pickle.PickleError, EOFError):
+                pass  # cold cache
+        entry = _video_cache.get(video_id)
+        if entry is not None:
+            _video_cache.move_to_end(video_id)
+        return entry
+
+def _video_cache_put(video_id: str, etag: str, payload: List[Dict[str, Any]]) -> None:
+    """Store a fresh etag + payload, evicting LRU entries past the cap."""
+    with _video_cache_lock:
+        _video_cache[video_id] = (etag, payload, time.time())
+        _video_cache.move_to_end(video_id)
+        while len(_video_cache) > _VIDEO_CACHE_MAX:
+            _video_cache.popitem(last=False)
+        try:
+            os.makedirs(os.path.dirname(_VIDEO_CACHE_PATH), exist_ok=True)
+            with open(_VIDEO_CACHE_PATH, "wb") as f:
+                pickle.dump(dict(_video_cache), f)
+        except OSError:
+            pass  # cache persistence is best-effort
+
+# Quota accounting: the 10,000 unit/day ceiling is the real scaling
+# limit - once hit, every call errors until midnight Pacific. Costs per
+# operation from the YouTube Data API pricing table.
+_QUOTA_COSTS = {
+    "comments.list": 1,
+    "comments.insert": 50,
+    "videos.list": 1,
+    "videos.insert": 1600
+}
+_DAILY_QUOTA_LIMIT = 10000
+
+class KeyPool:
+    """Round-robin pool of API keys with per-key quota budgets.
+
+    Each configured key carries its own daily quota, so N keys multiply
+    the effective read budget N-fold. The channel's OAuth identity is
+    tracked as its own bucket: writes (comment replies, uploads) are tied
+    to it and cannot rotate, but keyed public reads spread across the
+    pool and fail over when a key reports quotaExceeded. Budgets reset
+    with the API's midnight-Pacific rollover.
+    """
+
+    _OAUTH = "oauth"
+
+    def __init__(self, api_keys: List[str]):
+        self._keys = list(api_keys) + [self._OAUTH]
+        self._usage = {key: 0 for key in self._keys}
+        self._exhausted = set()
+        self._next = 0
+        self._reset_day = self._today()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _today() -> str:
+        # Quota resets at midnight Pacific (UTC-8, ignoring DST - an hour
+        # of slack either way just delays the reset, never overspends)
+        return time.strftime("%Y-%m-%d", time.gmtime(time.time() - 8 * 3600))
+
+    def _maybe_reset(self) -> None:
+        day = self._today()
+        if day != self._reset_day:
+            self._reset_day = day
+            self._exhausted.clear()
+            for key in self._usage:
+                self._usage[key] = 0
+
+    def borrow(self, units: int, oauth_only: bool = False) -> Optional[str]:
+        """Reserve units against a key's budget; None if all exhausted.
+
+        oauth_only calls (writes, and reads issued through the OAuth
+        googleapiclient transport) always charge the OAuth bucket.
+        Returns the API key to send, or KeyPool._OAUTH for
+        OAuth-authenticated calls.
+        """
+        with self._lock:
+            self._maybe_reset()
+            candidates = [self._OAUTH] if oauth_only else self._keys
+            for offset in range(len(candidates)):
+                if oauth_only:
+                    key = self._OAUTH
+                else:
+                    key = candidates[self._next % len(candidates)]
+                    self._next += 1
+                if key in self._exhausted:
+                    if oauth_only:
+                        break
+                    continue
+                if self._usage[key] + units > _DAILY_QUOTA_LIMIT:
+                    self._exhausted.add(key)
+                    if oauth_only:
+                        break
+                    continue
+                self._usage[key] += units
+                return key
+            return None
+
+    def refund(self, key: str, units: int) -> None:
+        """Return unspent units (e.g. a 304 revalidation cost nothing)."""
+        with self._lock:
+            if key in self._usage:
+                self._usage[key] = max(0, self._usage[key] - units)
+
+    def mark_exhausted(self, key: str) -> None:
+        """Take a key out of rotation until the daily reset."""
+        with self._lock:
+            self._exhausted.add(key)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current usage for check_upload_quota."""
+        with self._lock:
+            self._maybe_reset()
+            used = sum(self._usage.values())
+            total = _DAILY_QUOTA_LIMIT * len(self._keys)
+            return {
+                "status": "exhausted" if len(self._exhausted) == len(self._keys) else "available",
+                "quota_used": used,
+                "quota_remaining": total - used,
+                "daily_limit": total,
+                "keys": len(self._keys),
+                "keys_exhausted": len(self._exhausted),
+                "uploads_remaining": max(0, (_DAILY_QUOTA_LIMIT - self._usage[self._OAUTH])
+                                         // _QUOTA_COSTS["videos.insert"])
+            }
+
+_key_pool: Optional[KeyPool] = None
+
+def _get_key_pool() -> KeyPool:
+    """Get or create the process-wide key pool.
+
+    Extra read-only API keys come from YOUTUBE_API_KEYS (comma
+    separated); with none configured the pool is just the OAuth bucket
+    and still provides budget tracking.
+    """
+    global _key_pool
+    if _key_pool is None:
+        raw = os.getenv("YOUTUBE_API_KEYS", "")
+        _key_pool = KeyPool([key.strip() for key in raw.split(",") if key.strip()])
+    return _key_pool
+
+def _charge(op: str, oauth_only: bool = False) -> Optional[str]:
+    """Reserve quota for one API call.
+
+    Returns the API key to attach, or None for OAuth-authenticated
+    calls. Raises RuntimeError when the predicted cost would exceed the
+    remaining daily budget, so callers skip the doomed request entirely.
+    """
+    key = _get_key_pool().borrow(_QUOTA_COSTS[op], oauth_only=oauth_only)
+    if key is None:
+        raise RuntimeError(f"YouTube daily quota budget exhausted (op: {op})")
+    return None if key == KeyPool._OAUTH else key
+
+# Async read path: the googleapiclient transport (httplib2) is blocking
+# and opens connections per call; the async tool variants below talk to
+# the REST endpoints directly over one shared httpx client, so concurrent
+# reads multiplex over a single TCP+TLS connection (HTTP/2 when the h2
+# package is installed, keep-alive reuse otherwise)
+_YT_API_BASE = "https://www.googleapis.com/youtube/v3"
+
+_async_client = None
+
+# One semaphore shared by every raw YouTube HTTP call caps total QPS
+# across concurrent async tool invocations, so fanning work out over
+# many videos can't trip servingLimitExceeded. Created lazily so it
+# binds to the running event loop.
+_YT_SEM_LIMIT = 10
+_yt_semaphore = None
+
+def _get_yt_semaphore() -> "asyncio.Semaphore":
+    """Get or create the shared YouTube request semaphore."""
+    global _yt_semaphore
+    if _yt_semaphore is None:
+        _yt_semaphore = asyncio.Semaphore(_YT_SEM_LIMIT)
+    return _yt_semaphore
+
+def _get_async_client() -> "httpx.AsyncClient":
+    """Get or create the shared async HTTP client."""
+    global _async_client
+    if _async_client is None:
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx package not available - install httpx>=0.25.0")
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        try:
+            _async_client = httpx.AsyncClient(http2=True, limits=limits)
+        except ImportError:
+            # h2 not installed; HTTP/1.1 keep-alive still pools connections
+            _async_client = httpx.AsyncClient(limits=limits)
+    return _async_client
+
+def _decode_json(response) -> Dict[str, Any]:
+    """Decode an httpx response body, preferring orjson.
+
+    Comment payloads run tens of KB; orjson parses them several times
+    faster than the stdlib decoder httpx uses, straight from the raw
+    bytes with no intermediate str.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _auth_headers() -> Dict[str, str]:
+    """Bearer-token headers from the authenticated YouTube client."""
+    youtube_client = get_youtube_client()
+    token = getattr(youtube_client.credentials, "token", None)
+    if not token:
+        raise ValueError("YouTube credentials carry no bearer token")
+    return {"Authorization": f"Bearer {token}"}
+
+def _fetch_comments_cached(video_id: str, max_results: int = 100) -> List[Dict[str, Any]]:
+    """Fetch comments through the ETag cache.
+
+    Shared by the fetch_youtube_comments tool and process_video_comments
+    so both read paths benefit from 304 revalidation.
+    """
+    youtube_client = get_youtube_client()
+
+    try:
+        _charge("comments.list", oauth_only=True)
+    except RuntimeError as e:
+        logger.error("Skipping comment fetch for video %s: %s", video_id, str(e))
+        return []
+
+    cached = _video_cache_get(video_id)
+    if cached is not None:
+        etag, payload, ts = cached
+        if etag and time.time() - ts < _VIDEO_CACHE_TTL:
+            new_etag, comments = youtube_client.fetch_comments_conditional(
+                video_id, max_results, etag=etag)
+            if comments is None:
+                # 304 Not Modified - cached payload is current, 0 quota spent
+                _get_key_pool().refund(KeyPool._OAUTH, _QUOTA_COSTS["comments.list"])
+                logger.info("ETag cache hit for video %s (%s comments)", video_id, len(payload))
+                return payload
+            if new_etag:
+                _video_cache_put(video_id, new_etag, comments)
+            return comments
+
+    new_etag, comments = youtube_client.fetch_comments_conditional(video_id, max_results)
+    if new_etag and comments is not None:
+        _video_cache_put(video_id, new_etag, comments)
+    return comments if comments is not None else []
+
+# Memoized reference to tools.supabase_tools; the tool bodies used to
+# re-run `from tools.supabase_tools import ...` on every invocation,
+# taking the import lock and a sys.modules walk each time
+_supabase_tools = None
+
+def _get_supabase_tools():
+    """Import tools.supabase_tools once and cache the module reference.
+
+    Kept lazy so importing this module never forces the Supabase stack,
+    but the per-call import machinery is paid exactly once.
+    """
+    global _supabase_tools
+    if _supabase_tools is None:
+        import tools.supabase_tools
+        _supabase_tools = tools.supabase_tools
+    return _supabase_tools
 
 def get_youtube_client() -> YouTubeClient:
-    """Get or create a YouTube client instance."""
-    global _youtube_client
-    if _youtube_client is None:
+    """Get or create the YouTube client bound to the current context."""
+    client = _youtube_client_var.get()
+    if client is None:
         if YouTubeClient is None:
             raise ImportError("YouTubeClient not available. Make sure youtube_client_langchain.py is accessible.")
-        _youtube_client = YouTubeClient()
-    return _youtube_client
+        with _youtube_client_init_lock:
+            client = YouTubeClient()
+        _youtube_client_var.set(client)
+    return client
 
 def _get_song_details_direct(song_id: str) -> Dict[str, Any]:
     """Direct function to get song details without tool calling."""
     try:
-        from tools.supabase_tools import get_supabase_client
-        supabase_client = get_supabase_client()
-        song_data = supabase_client.get_song_by_id(song_id)
-        return song_data if song_data else {}
+        song_data = _get_supabase_tools().get_song_details_cached(song_id)
+        return dict(song_data) if song_data else {}
     except Exception as e:
-        logger.error(f"Error getting song details: {str(e)}")
+        logger.error("Error getting song details: %s", str(e))
         return {}
 
+def _store_and_reply(youtube_client, song_id: str, comment: Dict[str, Any], response_text: str) -> bool:
+    """Store feedback for one comment and post the reply.
+
+    Worker body for the process_video_comments thread pool: the Supabase
+    insert and the YouTube reply are independent network RPCs, so
+    pipelining comments across threads overlaps them instead of paying
+    each round trip serially.
+    """
+    comment_id = comment.get("comment_id")
+    comment_text = comment.get("content", "")
+
+    try:
+        # Buffer feedback for the batched bulk insert; the batcher turns
+        # N per-comment round trips into one POST
+        try:
+            feedback_data = {
+                "song_id": song_id,
+                "comments": comment.get("content", ""),
+                "comment_id": comment.get("comment_id", "")
+            }
+            _get_supabase_tools().feedback_batcher.submit(feedback_data)
+        except Exception as e:
+            logger.error("Error storing feedback: %s", str(e))
+
+        # Reply to comment using YouTube client, rate-gated so the pool
+        # can't burst past YouTube's write QPS
+        _charge("comments.insert", oauth_only=True)
+        with _reply_rate_gate:
+            reply_id = youtube_client.reply_to_comment(comment_id, response_text)
+
+        if reply_id:
+            logger.info("Successfully processed comment: %.50s...", comment_text)
+            return True
+        return False
+
+    except Exception as e:
+        logger.error("Error processing comment %s: %s", comment_id, str(e))
+        return False
+
 def _update_song_status_direct(song_id: str, status: str, youtube_id: str = None) -> bool:
     """Direct function to update song status without tool calling."""
     try:
-        from tools.supabase_tools import get_supabase_client
-        supabase_client = get_supabase_client()
-        
+        supabase_client = _get_supabase_tools().get_supabase_client()
+
         # Check if there are existing records for this song
         existing_response = supabase_client.client.table("youtube").select("id").eq("song_id", song_id).execute()
         existing_records = existing_response.data if existing_response.data else []
@@ -84,34 +447,39 @@ def _update_song_status_direct(song_id: str, status: str, youtube_id: str = None
         
         return True
     except Exception as e:
-        logger.error(f"Error updating song status: {str(e)}")
+        logger.error("Error updating song status: %s", str(e))
         return False
 
 @tool
-def upload_song_to_youtube(song_id: str, title: str = None, description: str = None, tags: List[str] = None, privacy: str = "public") -> str:
+def upload_song_to_youtube(song_id: str, title: str = None, description: str = None, tags: List[str] = None, privacy: str = "public", video_url: str = None) -> str:
     """
     Upload a song to YouTube.
-    
+
     Args:
         song_id: ID of the song to upload
         title: Video title (will be fetched from database if not provided)
         description: Video description (will be generated if not provided)
         tags: List of video tags (will be generated if not provided)
         privacy: Privacy setting (public, private, unlisted)
-        
+        video_url: Source video URL (will be fetched from database if not provided)
+
     Returns:
         YouTube video ID if successful, error message if failed
     """
     try:
-        logger.info(f"Uploading song {song_id} to YouTube")
-        
-        # Get song details from database using direct function
-        song_data = _get_song_details_direct(song_id)
-        
-        if not song_data or 'error' in song_data:
-            return f"Error: Could not retrieve song data for {song_id}"
-        
-        video_url = song_data.get('video_url')
+        logger.info("Uploading song %s to YouTube", song_id)
+
+        # Only hit the database when a needed field wasn't supplied by
+        # the caller; callers that pass video_url and title skip the
+        # lookup entirely
+        if video_url and title:
+            song_data = {}
+        else:
+            song_data = _get_song_details_direct(song_id)
+            if not song_data or 'error' in song_data:
+                return f"Error: Could not retrieve song data for {song_id}"
+
+        video_url = video_url or song_data.get('video_url')
         if not video_url:
             return f"Error: No video URL found for song {song_id}"
         
@@ -123,29 +491,41 @@ def upload_song_to_youtube(song_id: str, title: str = None, description: str = N
         if not upload_description and song_data.get('lyrics'):
             upload_description = f"Lyrics:\n\n{song_data['lyrics']}"
         
-        # Prepare tags
+        # Prepare tags: dedupe (styles often repeat genres) and cap at
+        # 30 - YouTube rejects uploads whose tag block tops 500 chars
         upload_tags = tags or []
         if not upload_tags and song_data.get('style'):
-            upload_tags = [tag.strip() for tag in song_data['style'].split(',')]
+            upload_tags = [tag for tag in _TAG_SPLIT.split(song_data['style'].strip()) if tag]
+        upload_tags = list(dict.fromkeys(upload_tags))[:30]
         
-        # Upload to YouTube using client
+        # Upload to YouTube using client; an upload costs 1600 units, so
+        # refuse up front rather than burn the transfer on a doomed call
+        try:
+            _charge("videos.insert", oauth_only=True)
+        except RuntimeError as e:
+            logger.error("Skipping upload for song %s: %s", song_id, str(e))
+            return f"Error: {str(e)}"
         youtube_client = get_youtube_client()
-        youtube_id = youtube_client.upload_video(
-            video_url=video_url,
-            title=upload_title,
-            description=upload_description,
-            tags=upload_tags
-        )
-        
-        if youtube_id == "URL_EXPIRED":
+        try:
+            youtube_id = youtube_client.upload_video(
+                video_url=video_url,
+                title=upload_title,
+                description=upload_description,
+                tags=upload_tags
+            )
+        except SourceURLExpired:
             # Update status in database using direct function
             _update_song_status_direct(song_id, "url_expired")
             return f"Error: Video URL expired for song {song_id}"
-        
+        except UploadLimitExceeded:
+            # Update status in database using direct function
+            _update_song_status_direct(song_id, "failed")
+            return "Error: YouTube upload limit exceeded"
+
         if youtube_id:
             # Update status in database using direct function
             _update_song_status_direct(song_id, "uploaded", youtube_id)
-            logger.info(f"Successfully uploaded song {song_id} to YouTube: {youtube_id}")
+            logger.info("Successfully uploaded song %s to YouTube: %s", song_id, youtube_id)
             return youtube_id
         else:
             # Update status in database using direct function
@@ -155,13 +535,6 @@ def upload_song_to_youtube(song_id: str, title: str = None, description: str = N
     except Exception as e:
         error_msg = f"Error uploading song {song_id}: {str(e)}"
         logger.error(error_msg)
-        
-        # Check if this is an upload limit exceeded error
-        if "uploadLimitExceeded" in str(e) or "The user has exceeded the number of videos they may upload" in str(e):
-            # Update status in database using direct function
-            _update_song_status_direct(song_id, "failed")
-            return f"Error: YouTube upload limit exceeded"
-        
         return error_msg
 
 @tool
@@ -177,12 +550,11 @@ def fetch_youtube_comments(video_id: str, max_results: int = 100) -> List[Dict[s
         List of comment data dictionaries
     """
     try:
-        logger.info(f"Fetching comments for YouTube video: {video_id}")
-        
-        youtube_client = get_youtube_client()
-        comments = youtube_client.fetch_comments(video_id, max_results)
-        
-        logger.info(f"Retrieved {len(comments)} comments for video {video_id}")
+        logger.info("Fetching comments for YouTube video: %s", video_id)
+
+        comments = _fetch_comments_cached(video_id, max_results)
+
+        logger.info("Retrieved %s comments for video %s", len(comments), video_id)
         return comments
         
     except Exception as e:
@@ -190,6 +562,84 @@ def fetch_youtube_comments(video_id: str, max_results: int = 100) -> List[Dict[s
         logger.error(error_msg)
         return []
 
+async def _afetch_comments(video_id: str, max_results: int = 100) -> List[Dict[str, Any]]:
+    """Async comment fetch body; recurses on key-exhaustion failover."""
+    # Reads can rotate across configured API keys; a keyed request
+    # charges that key's project quota, so the OAuth header is omitted
+    # for it
+    api_key = _charge("comments.list")
+    if api_key:
+        headers = {}
+    else:
+        headers = _auth_headers()
+    params = {
+        "part": "snippet,replies",
+        "videoId": video_id,
+        "maxResults": max_results,
+        "fields": _COMMENT_FIELDS
+    }
+    if api_key:
+        params["key"] = api_key
+
+    cached = _video_cache_get(video_id)
+    if cached is not None:
+        etag, payload, ts = cached
+        if etag and time.time() - ts < _VIDEO_CACHE_TTL:
+            headers["If-None-Match"] = etag
+
+    client = _get_async_client()
+    async with _get_yt_semaphore():
+        response = await client.get(f"{_YT_API_BASE}/commentThreads", params=params, headers=headers)
+
+    if response.status_code == 304:
+        # Cached payload is current, 0 quota spent
+        _get_key_pool().refund(api_key or KeyPool._OAUTH, _QUOTA_COSTS["comments.list"])
+        logger.info("ETag cache hit for video %s (%s comments)", video_id, len(cached[1]))
+        return cached[1]
+    if api_key and response.status_code == 403 and "quotaExceeded" in response.text:
+        # Key burned through its project quota; bench it and retry on
+        # whatever the pool offers next
+        _get_key_pool().mark_exhausted(api_key)
+        logger.warning("API key exhausted, retrying fetch for video %s", video_id)
+        return await _afetch_comments(video_id, max_results)
+    response.raise_for_status()
+
+    data = _decode_json(response)
+    comments = parse_comment_threads(data, get_youtube_client().channel_id)
+    if data.get("etag"):
+        _video_cache_put(video_id, data["etag"], comments)
+    return comments
+
+@tool
+async def afetch_youtube_comments(video_id: str, max_results: int = 100) -> List[Dict[str, Any]]:
+    """
+    Fetch comments from a YouTube video (async variant).
+
+    Reads go straight to the REST endpoint over the shared httpx client,
+    so concurrent fetches multiplex instead of serializing on the
+    blocking googleapiclient transport. Shares the ETag cache with the
+    sync tool.
+
+    Args:
+        video_id: YouTube video ID
+        max_results: Maximum number of comments to retrieve
+
+    Returns:
+        List of comment data dictionaries
+    """
+    try:
+        logger.info("Fetching comments for YouTube video: %s", video_id)
+
+        comments = await _afetch_comments(video_id, max_results)
+
+        logger.info("Retrieved %s comments for video %s", len(comments), video_id)
+        return comments
+
+    except Exception as e:
+        error_msg = f"Error fetching comments for video {video_id}: {str(e)}"
+        logger.error(error_msg)
+        return []
+
 @tool
 def reply_to_youtube_comment(comment_id: str, reply_text: str) -> str:
     """
@@ -203,13 +653,14 @@ def reply_to_youtube_comment(comment_id: str, reply_text: str) -> str:
         Reply ID if successful, error message if failed
     """
     try:
-        logger.info(f"Replying to YouTube comment: {comment_id}")
-        
+        logger.info("Replying to YouTube comment: %s", comment_id)
+
         youtube_client = get_youtube_client()
+        _charge("comments.insert", oauth_only=True)
         reply_id = youtube_client.reply_to_comment(comment_id, reply_text)
         
         if reply_id:
-            logger.info(f"Successfully replied to comment {comment_id}: {reply_id}")
+            logger.info("Successfully replied to comment %s: %s", comment_id, reply_id)
             return reply_id
         else:
             return f"Error: Failed to reply to comment {comment_id}"
@@ -219,6 +670,169 @@ def reply_to_youtube_comment(comment_id: str, reply_text: str) -> str:
         logger.error(error_msg)
         return error_msg
 
+@tool
+async def areply_to_youtube_comment(comment_id: str, reply_text: str) -> str:
+    """
+    Reply to a YouTube comment (async variant).
+
+    Posts directly to the REST endpoint over the shared httpx client so
+    concurrent replies share one connection.
+
+    Args:
+        comment_id: ID of the comment to reply to
+        reply_text: Text of the reply
+
+    Returns:
+        Reply ID if successful, error message if failed
+    """
+    try:
+        logger.info("Replying to YouTube comment: %s", comment_id)
+
+        _charge("comments.insert", oauth_only=True)
+        client = _get_async_client()
+        async with _get_yt_semaphore():
+            response = await client.post(
+                f"{_YT_API_BASE}/comments",
+                params={"part": "snippet"},
+                headers=_auth_headers(),
+                json={"snippet": {"parentId": comment_id, "textOriginal": reply_text}}
+            )
+        response.raise_for_status()
+
+        reply_id = _decode_json(response).get("id")
+        if reply_id:
+            logger.info("Successfully replied to comment %s: %s", comment_id, reply_id)
+            return reply_id
+        return f"Error: Failed to reply to comment {comment_id}"
+
+    except Exception as e:
+        error_msg = f"Error replying to comment {comment_id}: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
+
+async def _astore_and_reply(song_id: str, comment: Dict[str, Any], response_text: str) -> bool:
+    """Async worker body for aprocess_video_comments.
+
+    The Supabase side stays on the sync client from the original Angus
+    code, pushed to a worker thread; the YouTube reply goes straight to
+    the REST endpoint under the shared request semaphore.
+    """
+    comment_id = comment.get("comment_id")
+    comment_text = comment.get("content", "")
+
+    try:
+        feedback_data = {
+            "song_id": song_id,
+            "comments": comment_text,
+            "comment_id": comment.get("comment_id", "")
+        }
+        try:
+            await asyncio.to_thread(_get_supabase_tools().feedback_batcher.submit, feedback_data)
+        except Exception as e:
+            logger.error("Error storing feedback: %s", str(e))
+
+        _charge("comments.insert", oauth_only=True)
+        client = _get_async_client()
+        async with _get_yt_semaphore():
+            response = await client.post(
+                f"{_YT_API_BASE}/comments",
+                params={"part": "snippet"},
+                headers=_auth_headers(),
+                json={"snippet": {"parentId": comment_id, "textOriginal": response_text}}
+            )
+        response.raise_for_status()
+
+        if _decode_json(response).get("id"):
+            logger.info("Successfully processed comment: %.50s...", comment_text)
+            return True
+        return False
+
+    except Exception as e:
+        logger.error("Error processing comment %s: %s", comment_id, str(e))
+        return False
+
+@tool
+async def aprocess_video_comments(video_id: str, song_id: str = None, max_replies: int = 10) -> int:
+    """
+    Process comments for a YouTube video (async variant).
+
+    Same workflow as process_video_comments, but the per-comment
+    store+reply pairs run as concurrent coroutines under the shared
+    YouTube request semaphore, so an orchestrator can process several
+    videos at once without blocking the event loop or bursting past the
+    API's write QPS.
+
+    Args:
+        video_id: YouTube video ID
+        song_id: Song ID (will be looked up if not provided)
+        max_replies: Maximum number of replies to post
+
+    Returns:
+        Number of comments processed
+    """
+    try:
+        logger.info("Processing comments for video %s", video_id)
+
+        if not song_id:
+            def _lookup_song_id():
+                supabase_client = _get_supabase_tools().get_supabase_client()
+                response = supabase_client.client.table("youtube").select("song_id").eq("youtube_id", video_id).execute()
+                if response.data and len(response.data) > 0:
+                    return response.data[0].get('song_id')
+                return None
+            try:
+                song_id = await asyncio.to_thread(_lookup_song_id)
+            except Exception as e:
+                logger.error("Error getting song ID for video %s: %s", video_id, str(e))
+                return 0
+            if not song_id:
+                return 0
+
+        song_data = await asyncio.to_thread(_get_song_details_direct, song_id)
+        song_title = song_data.get('title', 'Unknown Song') if song_data else 'Unknown Song'
+
+        comments = await _afetch_comments(video_id, 100)
+        if not comments:
+            return 0
+
+        try:
+            existing_comment_ids = await asyncio.to_thread(
+                _get_supabase_tools().get_feedback_comment_ids, song_id)
+        except Exception as e:
+            logger.error("Error getting existing feedback: %s", str(e))
+            existing_comment_ids = frozenset()
+
+        pending = [
+            comment for comment in comments
+            if comment.get("comment_id") not in existing_comment_ids
+            and not comment.get("has_our_reply", False)
+        ][:max_replies]
+
+        if not pending:
+            logger.info("No new comments to process for video %s", video_id)
+            return 0
+
+        response_text = "Thank you for your comment! We appreciate your feedback."
+        if song_title and song_title != 'Unknown Song':
+            response_text = f"Thank you for listening to '{song_title}'! We're glad you enjoyed it."
+
+        results = await asyncio.gather(
+            *[_astore_and_reply(song_id, comment, response_text) for comment in pending],
+            return_exceptions=True
+        )
+        processed_count = sum(1 for result in results if result is True)
+
+        if processed_count:
+            _get_supabase_tools().get_feedback_comment_ids.cache_clear()
+
+        logger.info("Processed %s comments for video %s", processed_count, video_id)
+        return processed_count
+
+    except Exception as e:
+        error_msg = f"Error processing comments for video {video_id}: {str(e)}"
+        logger.error(error_msg)
+        return 0
+
 @tool
 def check_upload_quota() -> Dict[str, Any]:
     """
@@ -229,20 +843,137 @@ def check_upload_quota() -> Dict[str, Any]:
     """
     try:
         logger.info("Checking YouTube upload quota")
-        
-        # For now, return a basic status since the original client doesn't have this method
-        # This could be enhanced to actually check quota usage
+
+        # Real numbers from the in-process tracker: every charged call
+        # (fetches, replies, uploads) lands in the key pool's ledger
+        status = _get_key_pool().snapshot()
+        status["message"] = "Quota tracked locally from per-operation costs"
+        return status
+
+    except Exception as e:
+        error_msg = f"Error checking upload quota: {str(e)}"
+        logger.error(error_msg)
         return {
-            "status": "available",
-            "quota_remaining": "unknown",
-            "daily_limit": "10000",
-            "message": "Quota check available - using YouTube client"
+            "status": "error",
+            "message": error_msg
         }
-        
+
+# videos.list accepts up to 50 ids per request at the same 1-unit cost
+# as a single-id call; ask for only the fields the agents consume
+_VIDEO_DETAILS_FIELDS = "items(id,snippet/title,contentDetails/duration,status/embeddable)"
+_VIDEO_BATCH_MAX = 50
+_VIDEO_BATCH_DEBOUNCE = 0.05  # seconds to wait for more ids to coalesce
+
+def _parse_video_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a videos.list item into the tool's return shape."""
+    return {
+        "video_id": item.get("id"),
+        "status": "found",
+        "title": item.get("snippet", {}).get("title"),
+        "duration": item.get("contentDetails", {}).get("duration"),
+        "embeddable": item.get("status", {}).get("embeddable")
+    }
+
+class VideoDetailsBatcher:
+    """Coalesce per-id video-detail lookups into one videos.list call.
+
+    Concurrent aget_video_details calls within the debounce window (or
+    up to 50 queued ids) share a single request: same 1-unit quota cost
+    and one round trip instead of one per video. Unknown ids resolve to
+    a not_found dict rather than raising.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, "asyncio.Future"] = {}
+        self._lock = asyncio.Lock()
+        self._flusher = None
+
+    async def get(self, video_id: str) -> Dict[str, Any]:
+        """Queue one id and await its slice of the batched response."""
+        async with self._lock:
+            future = self._pending.get(video_id)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._pending[video_id] = future
+            if len(self._pending) >= _VIDEO_BATCH_MAX:
+                batch, self._pending = self._pending, {}
+                asyncio.ensure_future(self._flush(batch))
+            elif self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.ensure_future(self._delayed_flush())
+        return await future
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(_VIDEO_BATCH_DEBOUNCE)
+        async with self._lock:
+            batch, self._pending = self._pending, {}
+        if batch:
+            await self._flush(batch)
+
+    async def _flush(self, batch: Dict[str, "asyncio.Future"]) -> None:
+        try:
+            api_key = _charge("videos.list")
+            if api_key:
+                headers = {}
+            else:
+                headers = _auth_headers()
+            params = {
+                "part": "snippet,contentDetails,status",
+                "id": ",".join(batch.keys()),
+                "fields": _VIDEO_DETAILS_FIELDS
+            }
+            if api_key:
+                params["key"] = api_key
+            client = _get_async_client()
+            async with _get_yt_semaphore():
+                response = await client.get(f"{_YT_API_BASE}/videos", params=params, headers=headers)
+            response.raise_for_status()
+            items = {item.get("id"): item for item in _decode_json(response).get("items", [])}
+        except Exception as e:
+            logger.error("Error fetching video details batch: %s", str(e))
+            for video_id, future in batch.items():
+                if not future.done():
+                    future.set_result({"video_id": video_id, "status": "error", "message": str(e)})
+            return
+        for video_id, future in batch.items():
+            if future.done():
+                continue
+            item = items.get(video_id)
+            if item is None:
+                future.set_result({"video_id": video_id, "status": "not_found"})
+            else:
+                future.set_result(_parse_video_item(item))
+
+_video_details_batcher: Optional[VideoDetailsBatcher] = None
+
+def _get_video_details_batcher() -> VideoDetailsBatcher:
+    """Get or create the shared video-details batcher."""
+    global _video_details_batcher
+    if _video_details_batcher is None:
+        _video_details_batcher = VideoDetailsBatcher()
+    return _video_details_batcher
+
+@tool
+async def aget_video_details(video_id: str) -> Dict[str, Any]:
+    """
+    Get details of a YouTube video (async, batched).
+
+    Per-id calls issued within the batching window share one videos.list
+    request, so checking details for a page of videos costs one quota
+    unit and one round trip.
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        Dictionary with video details, or status not_found
+    """
+    try:
+        return await _get_video_details_batcher().get(video_id)
     except Exception as e:
-        error_msg = f"Error checking upload quota: {str(e)}"
+        error_msg = f"Error getting video details for {video_id}: {str(e)}"
         logger.error(error_msg)
         return {
+            "video_id": video_id,
             "status": "error",
             "message": error_msg
         }
@@ -251,25 +982,28 @@ def check_upload_quota() -> Dict[str, Any]:
 def get_video_details(video_id: str) -> Dict[str, Any]:
     """
     Get details of a YouTube video.
-    
+
     Args:
         video_id: YouTube video ID
-        
+
     Returns:
         Dictionary with video details
     """
     try:
-        logger.info(f"Getting details for YouTube video: {video_id}")
-        
+        logger.info("Getting details for YouTube video: %s", video_id)
+
+        _charge("videos.list", oauth_only=True)
         youtube_client = get_youtube_client()
-        
-        # Basic functionality - could be enhanced
-        return {
-            "video_id": video_id,
-            "status": "exists",
-            "message": "Video details retrieved using YouTube client"
-        }
-        
+        response = youtube_client.youtube.videos().list(
+            part="snippet,contentDetails,status",
+            id=video_id,
+            fields=_VIDEO_DETAILS_FIELDS
+        ).execute()
+        items = response.get("items", [])
+        if not items:
+            return {"video_id": video_id, "status": "not_found"}
+        return _parse_video_item(items[0])
+
     except Exception as e:
         error_msg = f"Error getting video details for {video_id}: {str(e)}"
         logger.error(error_msg)
@@ -293,20 +1027,19 @@ def process_video_comments(video_id: str, song_id: str = None, max_replies: int
         Number of comments processed
     """
     try:
-        logger.info(f"Processing comments for video {video_id}")
+        logger.info("Processing comments for video %s", video_id)
         
         # Get song info if not provided using direct database access
         if not song_id:
             try:
-                from tools.supabase_tools import get_supabase_client
-                supabase_client = get_supabase_client()
+                supabase_client = _get_supabase_tools().get_supabase_client()
                 response = supabase_client.client.table("youtube").select("song_id").eq("youtube_id", video_id).execute()
                 if response.data and len(response.data) > 0:
                     song_id = response.data[0].get('song_id')
                 else:
                     return 0
             except Exception as e:
-                logger.error(f"Error getting song ID for video {video_id}: {str(e)}")
+                logger.error("Error getting song ID for video %s: %s", video_id, str(e))
                 return 0
         
         # Get song details for context using direct function
@@ -314,75 +1047,56 @@ def process_video_comments(video_id: str, song_id: str = None, max_replies: int
         song_title = song_data.get('title', 'Unknown Song') if song_data else 'Unknown Song'
         song_style = song_data.get('style') if song_data else None
         
-        # Fetch comments using the tool
+        # Fetch comments through the ETag cache
         youtube_client = get_youtube_client()
-        comments = youtube_client.fetch_comments(video_id, max_results=100)
+        comments = _fetch_comments_cached(video_id, max_results=100)
         
         if not comments:
             return 0
         
-        # Get existing feedback to avoid duplicates using direct database access
+        # Get existing feedback to avoid duplicates; the comment-id set is
+        # memoized per song in supabase_tools
         try:
-            from tools.supabase_tools import get_supabase_client
-            supabase_client = get_supabase_client()
-            response = supabase_client.client.table("feedback").select("*").eq("song_id", song_id).execute()
-            existing_feedback = response.data if response.data else []
-            existing_comment_ids = set()
-            if existing_feedback:
-                for feedback in existing_feedback:
-                    if feedback.get('comment_id'):
-                        existing_comment_ids.add(feedback.get('comment_id'))
+            existing_comment_ids = _get_supabase_tools().get_feedback_comment_ids(song_id)
         except Exception as e:
-            logger.error(f"Error getting existing feedback: {str(e)}")
-            existing_comment_ids = set()
+            logger.error("Error getting existing feedback: %s", str(e))
+            existing_comment_ids = frozenset()
         
-        # Process comments
+        # Stage 1: filter in pure Python - skip comments we already stored
+        # or already replied to, and cap inflight work at max_replies
+        pending = [
+            comment for comment in comments
+            if comment.get("comment_id") not in existing_comment_ids
+            and not comment.get("has_our_reply", False)
+        ][:max_replies]
+
+        if not pending:
+            logger.info("No new comments to process for video %s", video_id)
+            return 0
+
+        # Generate response using AI tools - simple fallback
+        response_text = "Thank you for your comment! We appreciate your feedback."
+        if song_title and song_title != 'Unknown Song':
+            response_text = f"Thank you for listening to '{song_title}'! We're glad you enjoyed it."
+
+        # Stage 2: fan the store+reply pairs out across the pool; each
+        # worker handles its own errors so one bad comment can't sink
+        # the batch
         processed_count = 0
-        for comment in comments:
-            if processed_count >= max_replies:
-                break
-                
-            comment_id = comment.get("comment_id")
-            comment_text = comment.get("content", "")
-            
-            # Skip if already processed
-            if comment_id in existing_comment_ids:
-                continue
-                
-            # Skip if we already replied
-            if comment.get("has_our_reply", False):
-                continue
-            
-            try:
-                # Store feedback using direct database access
-                try:
-                    from tools.supabase_tools import get_supabase_client
-                    supabase_client = get_supabase_client()
-                    feedback_data = {
-                        "song_id": song_id,
-                        "comments": comment.get("content", ""),
-                        "comment_id": comment.get("comment_id", "")
-                    }
-                    supabase_client.client.table("feedback").insert(feedback_data).execute()
-                except Exception as e:
-                    logger.error(f"Error storing feedback: {str(e)}")
-                
-                # Generate response using AI tools - simple fallback
-                response_text = "Thank you for your comment! We appreciate your feedback."
-                if song_title and song_title != 'Unknown Song':
-                    response_text = f"Thank you for listening to '{song_title}'! We're glad you enjoyed it."
-                
-                if response_text:
-                    # Reply to comment using YouTube client
-                    reply_id = youtube_client.reply_to_comment(comment_id, response_text)
-                    if reply_id:
-                        processed_count += 1
-                        logger.info(f"Successfully processed comment: {comment_text[:50]}...")
-                
-            except Exception as e:
-                logger.error(f"Error processing comment {comment_id}: {str(e)}")
+        with ThreadPoolExecutor(max_workers=min(_COMMENT_WORKERS, len(pending))) as executor:
+            futures = [
+                executor.submit(_store_and_reply, youtube_client, song_id, comment, response_text)
+                for comment in pending
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    processed_count += 1
+
+        if processed_count:
+            # The memoized comment-id set for this song is now stale
+            _get_supabase_tools().get_feedback_comment_ids.cache_clear()
         
-        logger.info(f"Processed {processed_count} comments for video {video_id}")
+        logger.info("Processed %s comments for video %s", processed_count, video_id)
         return processed_count
         
     except Exception as e:
@@ -390,6 +1104,42 @@ def process_video_comments(video_id: str, song_id: str = None, max_replies: int
         logger.error(error_msg)
         return 0
 
+class CommentPrefetcher:
+    """Double-buffer comment fetches across a list of videos.
+
+    When an orchestrator walks videos sequentially, each video's comment
+    fetch is dead wall-clock time between videos. Priming the next fetch
+    on a background thread while the current video's comments are being
+    processed hides that round trip. The default window of 2 (current +
+    next) is enough to cover one RTT while keeping memory bounded - a
+    full fetch is ~100 comments of a few hundred bytes each.
+    """
+
+    def __init__(self, video_ids: List[str], max_results: int = 100, window: int = 2):
+        self._max_results = max_results
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._futures: Dict[str, Any] = {}
+        for video_id in video_ids[:window]:
+            self.prime(video_id)
+
+    def prime(self, video_id: str) -> None:
+        """Start fetching a video's comments in the background."""
+        if video_id and video_id not in self._futures:
+            self._futures[video_id] = self._executor.submit(
+                _fetch_comments_cached, video_id, self._max_results)
+
+    def get(self, video_id: str) -> List[Dict[str, Any]]:
+        """Comments for a video; blocks only if the prefetch isn't done."""
+        future = self._futures.pop(video_id, None)
+        if future is None:
+            return _fetch_comments_cached(video_id, self._max_results)
+        return future.result()
+
+    def close(self) -> None:
+        """Discard pending fetches and release the worker threads."""
+        self._executor.shutdown(wait=False)
+        self._futures.clear()
+
 # Tool list for easy import
 YOUTUBE_TOOLS = [
     upload_song_to_youtube,
@@ -399,3 +1149,12 @@ YOUTUBE_TOOLS = [
     get_video_details,
     process_video_comments
 ]
+
+# Async variants for callers on LangChain's async tool interface; kept
+# out of YOUTUBE_TOOLS so agents don't see duplicate capabilities
+YOUTUBE_ASYNC_TOOLS = [
+    afetch_youtube_comments,
+    areply_to_youtube_comment,
+    aprocess_video_comments,
+    aget_video_details
+]
@@ -34,24 +34,42 @@ def get_utility_modules():
     return list(UTILITY_MODULES.keys())
 
 # Basic utility functions
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(bytes_value):
-    """Format bytes into human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    """Format bytes into human readable format.
+
+    The unit index is read straight off the bit length (each unit step
+    is 10 bits), replacing the old divide-and-compare loop with one
+    shift and one divide.
+    """
+    if bytes_value < 1:
+        return f"{bytes_value:.1f} B"
+    i = min((int(bytes_value).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{bytes_value / (1 << (i * 10)):.1f} {_UNITS[i]}"
+
+def format_bytes_batch(values):
+    """Format a sequence of byte counts in one vectorized pass.
+
+    For monitoring paths formatting thousands of metrics, the unit
+    indices come from a single numpy log2 over the whole array instead
+    of per-value Python bytecode.
+    """
+    import numpy as np
+    arr = np.asarray(values, dtype=np.float64)
+    idx = np.zeros(arr.shape, dtype=np.int64)
+    positive = arr >= 1
+    idx[positive] = np.clip(np.log2(arr[positive]).astype(np.int64) // 10, 0, len(_UNITS) - 1)
+    scaled = arr / np.power(2.0, idx * 10)
+    return [f"{value:.1f} {_UNITS[i]}" for value, i in zip(scaled, idx)]
 
 def format_duration(seconds):
     """Format seconds into human readable duration."""
     if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.1f}m"
-    else:
-        hours = seconds / 3600
-        return f"{hours:.1f}h"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
 
 def safe_import(module_name, fallback=None):
     """Safely import a module with fallback."""
@@ -10,18 +10,65 @@ import requests
 from typing import Dict, Any, Optional, List, Union
 
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 
+from yt_exceptions import SourceURLExpired, UploadLimitExceeded
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # OAuth 2.0 scopes for YouTube API
-SCOPES = ["https://www.googleapis.com/auth/youtube.upload", 
+SCOPES = ["https://www.googleapis.com/auth/youtube.upload",
           "https://www.googleapis.com/auth/youtube.force-ssl"]
 
+# Partial-response projection for commentThreads.list: just the fields the
+# comment pipeline reads (plus the top-level etag for revalidation), so
+# the API skips serializing - and we skip decoding - the rest of the
+# snippet/author/statistics payload
+_COMMENT_FIELDS = (
+    "etag,"
+    "items("
+    "id,"
+    "snippet/topLevelComment/snippet(authorDisplayName,textOriginal,publishedAt),"
+    "replies/comments/snippet/authorChannelId"
+    ")"
+)
+
+def parse_comment_threads(response: Dict[str, Any], channel_id: Optional[str]) -> List[Dict[str, Any]]:
+    """Convert a commentThreads.list response into comment dicts.
+
+    Shared by the blocking client below and the async httpx read path in
+    tools/youtube_tools.py, so both produce the same comment shape.
+    """
+    comments = []
+    for item in response.get("items", []):
+        comment_id = item["id"]
+        snippet = item["snippet"]["topLevelComment"]["snippet"]
+
+        # Check if we've already replied to this comment
+        has_our_reply = False
+        if "replies" in item and item["replies"]["comments"]:
+            for reply in item["replies"]["comments"]:
+                reply_snippet = reply["snippet"]
+                if reply_snippet.get("authorChannelId", {}).get("value") == channel_id:
+                    has_our_reply = True
+                    break
+
+        comment_data = {
+            "comment_id": comment_id,
+            "author": snippet["authorDisplayName"],
+            "content": snippet["textOriginal"],
+            "timestamp": snippet["publishedAt"],
+            "has_our_reply": has_our_reply
+        }
+        comments.append(comment_data)
+
+    return comments
+
 class YouTubeClientLangChain:
     """
     Simplified YouTube client for LangChain Agent Angus.
@@ -38,6 +85,7 @@ class YouTubeClientLangChain:
         self.api_key = api_key or self._get_env_var('YOUTUBE_API_KEY')
         self.channel_id = channel_id or self._get_env_var('YOUTUBE_CHANNEL_ID')
         self.youtube = None
+        self.credentials = None
         
         # Validate credentials
         if not self.client_id or not self.client_secret:
@@ -49,7 +97,7 @@ class YouTubeClientLangChain:
             self.authenticate()
             logger.info("YouTube client initialized")
         except Exception as e:
-            logger.error(f"Error initializing YouTube client: {str(e)}")
+            logger.error("Error initializing YouTube client: %s", str(e))
             raise
     
     def _get_env_var(self, var_name: str) -> Optional[str]:
@@ -93,11 +141,11 @@ class YouTubeClientLangChain:
                 try:
                     with open(token_path, 'rb') as token:
                         creds = pickle.load(token)
-                    logger.info(f"Loaded credentials from {token_path}")
+                    logger.info("Loaded credentials from %s", token_path)
                     token_path_used = token_path
                     break
                 except Exception as e:
-                    logger.warning(f"Error loading credentials from {token_path}: {str(e)}")
+                    logger.warning("Error loading credentials from %s: %s", token_path, str(e))
                     force_new_auth = True
         
         # If credentials don't exist or are invalid, raise an error
@@ -107,53 +155,167 @@ class YouTubeClientLangChain:
                     creds.refresh(Request())
                     logger.info("Refreshed expired credentials")
                 except Exception as e:
-                    logger.warning(f"Error refreshing credentials: {str(e)}")
+                    logger.warning("Error refreshing credentials: %s", str(e))
                     raise ValueError("YouTube credentials expired and could not be refreshed. Please run youtube_auth_langchain.py")
             else:
                 raise ValueError("No valid YouTube credentials found. Please run youtube_auth_langchain.py first")
         
-        # Build YouTube API client
+        # Build YouTube API client; keep the credentials so the async
+        # httpx path in tools/youtube_tools.py can reuse the bearer token
+        self.credentials = creds
         self.youtube = build("youtube", "v3", credentials=creds)
     
-    def upload_video(self, video_url: str, title: str, description: str, 
+    def upload_video(self, video_url: str, title: str, description: str,
                      tags: List[str] = None) -> Optional[str]:
         """
         Upload a video to YouTube.
-        
+
+        The source is piped straight into YouTube's resumable upload
+        protocol when its size is known, so the bytes never touch local
+        disk and the next chunk downloads while the current one uploads.
+        Sources without a Content-Length fall back to the old
+        spool-to-tempfile path.
+
         Args:
             video_url: URL of the video file to upload
             title: Title of the video
             description: Description of the video
             tags: List of tags for the video
-            
+
         Returns:
             YouTube video ID if successful, None otherwise
-            Special return value "URL_EXPIRED" if the URL is expired or inaccessible
+
+        Raises:
+            SourceURLExpired: the source URL answered 403/410
+            UploadLimitExceeded: the channel hit its daily upload limit
         """
-        logger.info(f"Uploading video: {title}")
-        
+        logger.info("Uploading video: %s", title)
+
+        # Open the source stream
+        try:
+            source = requests.get(video_url, stream=True)
+            source.raise_for_status()  # Raise exception for HTTP errors
+        except requests.HTTPError as e:
+            if e.response.status_code in (403, 410):
+                logger.warning("URL expired or access denied: %s", video_url)
+                raise SourceURLExpired(video_url) from e
+            else:
+                # Re-raise other HTTP errors
+                raise
+
+        total = source.headers.get("Content-Length")
+        if total is not None:
+            try:
+                return self.upload_video_streaming(source, int(total), title, description, tags)
+            except UploadLimitExceeded:
+                raise
+            except Exception as e:
+                logger.error("Error uploading video: %s", str(e))
+                return None
+            finally:
+                source.close()
+
+        logger.info("Source has no Content-Length, spooling to temp file")
+        return self._upload_video_buffered(source, title, description, tags)
+
+    def upload_video_streaming(self, source, total: int, title: str, description: str,
+                               tags: List[str] = None) -> Optional[str]:
+        """
+        Pipe a source stream into YouTube's resumable upload protocol.
+
+        The old path downloaded the whole file to disk and then
+        re-uploaded it - paying the transfer twice, serially. Here 8 MB
+        chunks are PUT against a resumable session as they arrive, and a
+        one-worker pool prefetches the next chunk while the current PUT
+        is in flight, so download and upload overlap.
+
+        Args:
+            source: Open streaming requests response for the video bytes
+            total: Source size in bytes (required for Content-Range)
+            title: Title of the video
+            description: Description of the video
+            tags: List of tags for the video
+
+        Returns:
+            YouTube video ID if successful
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        chunk_size = 8 * 1024 * 1024
+
+        body = {
+            "snippet": {
+                "title": title,
+                "description": description,
+                "tags": tags or [],
+                "categoryId": "10"  # Music category
+            },
+            "status": {
+                "privacyStatus": "public"
+            }
+        }
+
+        # Open the resumable upload session
+        init = requests.post(
+            "https://www.googleapis.com/upload/youtube/v3/videos",
+            params={"uploadType": "resumable", "part": "snippet,status"},
+            headers={
+                "Authorization": f"Bearer {self.credentials.token}",
+                "X-Upload-Content-Type": "video/*",
+                "X-Upload-Content-Length": str(total)
+            },
+            json=body
+        )
+        if init.status_code >= 400:
+            if "uploadLimitExceeded" in init.text:
+                raise UploadLimitExceeded(init.text[:200])
+            raise RuntimeError(f"Resumable session refused ({init.status_code}): {init.text[:200]}")
+        session_url = init.headers["Location"]
+
+        offset = 0
+        chunks = source.iter_content(chunk_size=chunk_size)
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(next, chunks, b"")
+            while True:
+                chunk = pending.result()
+                if not chunk:
+                    break
+                # Prefetch the next chunk while this PUT is in flight
+                pending = prefetcher.submit(next, chunks, b"")
+
+                end = offset + len(chunk) - 1
+                put = requests.put(
+                    session_url,
+                    data=chunk,
+                    headers={"Content-Range": f"bytes {offset}-{end}/{total}"}
+                )
+                if put.status_code in (200, 201):
+                    video_id = put.json()["id"]
+                    logger.info("Video upload complete: %s", video_id)
+                    return video_id
+                if put.status_code != 308:  # 308 = Resume Incomplete, keep going
+                    if "uploadLimitExceeded" in put.text:
+                        raise UploadLimitExceeded(put.text[:200])
+                    raise RuntimeError(f"Resumable upload failed ({put.status_code}): {put.text[:200]}")
+                offset = end + 1
+                logger.info("Uploaded %s%%", int(offset * 100 / total))
+
+        raise RuntimeError("Source stream ended before the upload completed")
+
+    def _upload_video_buffered(self, response, title: str, description: str,
+                               tags: List[str] = None) -> Optional[str]:
+        """Legacy path: spool the already-open source stream to a temp
+        file and upload via MediaFileUpload."""
         # Create a temporary file path
         temp_fd, temp_video_path = tempfile.mkstemp(suffix='.mp4')
         os.close(temp_fd)  # Close the file descriptor immediately
-        
+
         try:
-            # Download the video
-            try:
-                response = requests.get(video_url, stream=True)
-                response.raise_for_status()  # Raise exception for HTTP errors
-            except requests.HTTPError as e:
-                if e.response.status_code == 403:
-                    logger.warning(f"URL expired or access denied: {video_url}")
-                    return "URL_EXPIRED"  # Special return value for expired URLs
-                else:
-                    # Re-raise other HTTP errors
-                    raise
-            
             with open(temp_video_path, 'wb') as temp_file:
                 for chunk in response.iter_content(chunk_size=8192):
                     temp_file.write(chunk)
             
-            logger.info(f"Downloaded video to temporary file: {temp_video_path}")
+            logger.info("Downloaded video to temporary file: %s", temp_video_path)
             
             # Prepare video metadata
             body = {
@@ -181,23 +343,29 @@ class YouTubeClientLangChain:
             while response is None:
                 status, response = request.next_chunk()
                 if status:
-                    logger.info(f"Uploaded {int(status.progress() * 100)}%")
+                    logger.info("Uploaded %s%%", int(status.progress() * 100))
             
             # Make sure to close the media file
             media._fd.close()
             
-            logger.info(f"Video upload complete: {response['id']}")
+            logger.info("Video upload complete: %s", response['id'])
             return response["id"]
             
+        except HttpError as e:
+            logger.error("Error uploading video: %s", str(e))
+
+            # Structured classification instead of substring-scanning the
+            # stringified error
+            if e.resp.status == 403 and any(
+                detail.get("reason") == "uploadLimitExceeded"
+                for detail in (e.error_details or [])
+            ):
+                raise UploadLimitExceeded(str(e)) from e
+
+            return None
+
         except Exception as e:
-            error_str = str(e)
-            logger.error(f"Error uploading video: {error_str}")
-            
-            # Check if this is an upload limit exceeded error
-            if "uploadLimitExceeded" in error_str or "The user has exceeded the number of videos they may upload" in error_str:
-                # Re-raise the exception to be caught by the caller
-                raise
-                
+            logger.error("Error uploading video: %s", str(e))
             return None
             
         finally:
@@ -212,7 +380,7 @@ class YouTubeClientLangChain:
                         os.remove(temp_video_path)
                     break
                 except Exception as e:
-                    logger.warning(f"Failed to remove temp file, retrying: {str(e)}")
+                    logger.warning("Failed to remove temp file, retrying: %s", str(e))
                     time.sleep(1)
     
     def reply_to_comment(self, comment_id: str, reply_text: str) -> Optional[str]:
@@ -226,7 +394,7 @@ class YouTubeClientLangChain:
         Returns:
             The ID of the reply comment if successful, None otherwise
         """
-        logger.info(f"Replying to comment: {comment_id}")
+        logger.info("Replying to comment: %s", comment_id)
         
         try:
             response = self.youtube.comments().insert(
@@ -240,11 +408,11 @@ class YouTubeClientLangChain:
             ).execute()
             
             reply_id = response.get("id")
-            logger.info(f"Successfully replied to comment {comment_id} with reply ID: {reply_id}")
+            logger.info("Successfully replied to comment %s with reply ID: %s", comment_id, reply_id)
             return reply_id
             
         except Exception as e:
-            logger.error(f"Error replying to comment {comment_id}: {str(e)}")
+            logger.error("Error replying to comment %s: %s", comment_id, str(e))
             return None
     
     def fetch_comments(self, video_id: str, max_results: int = 100) -> List[Dict[str, Any]]:
@@ -258,47 +426,53 @@ class YouTubeClientLangChain:
         Returns:
             List of comment data dictionaries
         """
-        logger.info(f"Fetching comments for video ID: {video_id}")
-        
+        _, comments = self.fetch_comments_conditional(video_id, max_results)
+        return comments if comments is not None else []
+
+    def fetch_comments_conditional(self, video_id: str, max_results: int = 100,
+                                   etag: Optional[str] = None) -> tuple:
+        """
+        Fetch comments for a video, revalidating against an ETag if provided.
+
+        Args:
+            video_id: YouTube video ID
+            max_results: Maximum number of comments to retrieve
+            etag: ETag from a previous response; sent as If-None-Match so an
+                unchanged thread list answers 304 at zero quota cost
+
+        Returns:
+            Tuple of (etag, comments). comments is None when the server
+            answered 304 Not Modified - the caller's cached copy is current.
+        """
+        logger.info("Fetching comments for video ID: %s", video_id)
+
         try:
             # Fetch comments with replies
             request = self.youtube.commentThreads().list(
                 part="snippet,replies",
                 videoId=video_id,
-                maxResults=max_results
+                maxResults=max_results,
+                fields=_COMMENT_FIELDS
             )
+            if etag:
+                request.headers["If-None-Match"] = etag
             response = request.execute()
-            
+
             # Process comments
-            comments = []
-            for item in response.get("items", []):
-                comment_id = item["id"]
-                snippet = item["snippet"]["topLevelComment"]["snippet"]
-                
-                # Check if we've already replied to this comment
-                has_our_reply = False
-                if "replies" in item and item["replies"]["comments"]:
-                    for reply in item["replies"]["comments"]:
-                        reply_snippet = reply["snippet"]
-                        if reply_snippet.get("authorChannelId", {}).get("value") == self.channel_id:
-                            has_our_reply = True
-                            break
-                
-                comment_data = {
-                    "comment_id": comment_id,
-                    "author": snippet["authorDisplayName"],
-                    "content": snippet["textOriginal"],
-                    "timestamp": snippet["publishedAt"],
-                    "has_our_reply": has_our_reply
-                }
-                comments.append(comment_data)
-            
-            logger.info(f"Retrieved {len(comments)} comments")
-            return comments
-            
+            comments = parse_comment_threads(response, self.channel_id)
+
+            logger.info("Retrieved %s comments", len(comments))
+            return response.get("etag"), comments
+
+        except HttpError as e:
+            if e.resp.status == 304:
+                logger.info("Comments for video %s not modified (ETag hit)", video_id)
+                return etag, None
+            logger.error("Error fetching comments: %s", str(e))
+            return None, []
         except Exception as e:
-            logger.error(f"Error fetching comments: {str(e)}")
-            return []
+            logger.error("Error fetching comments: %s", str(e))
+            return None, []
 
 # Alias for compatibility
 YouTubeClient = YouTubeClientLangChain
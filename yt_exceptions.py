@@ -0,0 +1,21 @@
+"""
+Typed exceptions for YouTube upload control flow.
+
+Upload failures used to be classified by stringifying the exception and
+scanning for substrings ("uploadLimitExceeded" in str(e)) and by
+comparing a "URL_EXPIRED" sentinel string - per-error string work in
+what should be a type check. Catching these classes is O(1) and keeps
+the error paths branch-predictable.
+
+Kept at the repo root beside youtube_client_langchain.py: importing
+them from the tools package would execute its heavy __init__ and create
+an import cycle with tools/youtube_tools.
+"""
+
+
+class UploadLimitExceeded(Exception):
+    """YouTube refused the upload: the channel hit its daily upload limit."""
+
+
+class SourceURLExpired(Exception):
+    """The source video URL answered 403/410 - expired or access denied."""